@@ -0,0 +1,171 @@
+# agents/analysis_cache.py
+"""
+Analysis result cache
+Complete trip analyses (scores, insights, season, packing list and hotel search
+links) cached under a hash of the normalized trip inputs, bounded and shared by
+every Streamlit session, so repeating an analysis is a single lookup
+"""
+
+import datetime
+import hashlib
+import json
+import numbers
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .comfort_calculator import TravelComfortCalculator
+from .destination_profiles import get_destination_profile
+from .hotel_suggestions import BabyFriendlyHotelService
+from .packing_assistant import get_smart_packing_list
+from .scoring_engine import TripScore, TripScoringEngine
+from .search_cache import LocationCache
+
+ANALYSIS_CACHE_SIZE = 1024
+# Bump when the analysis computed for the same inputs changes
+ANALYSIS_VERSION = 1
+
+FALLBACK_PACKING_LIST = (
+    "Diapers (extra supply)", "Baby wipes", "Baby clothes (layered)",
+    "Feeding supplies", "Baby carrier", "Travel stroller",
+    "Baby first aid kit", "Baby sunscreen", "Pacifiers",
+    "Baby toys/entertainment", "Blanket", "Baby monitor",
+    "Changing pad", "Plastic bags", "Hand sanitizer",
+    "Baby food/formula", "Bottles", "Baby medications"
+)
+
+@dataclass(frozen=True)
+class TripAnalysis:
+    """Everything the comfort analyzer computes for one trip (shared, do not modify)"""
+    trip_score: TripScore
+    season: str
+    weather_desc: str
+    packing_items: Tuple[str, ...]
+    # HotelSearchLink objects, or link dicts if the hotel service failed
+    search_links: Tuple[Any, ...]
+
+def _normalize(value: Any) -> Any:
+    """JSON-ready canonical form: equal inputs (6 and 6.0, tuples and lists) look the same"""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        value = float(value)
+        return int(value) if value.is_integer() else value
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, Mapping):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if hasattr(value, 'item'):
+        # NumPy scalar
+        return _normalize(value.item())
+    raise TypeError(f"cannot normalize {type(value).__name__} for an analysis key")
+
+def destination_id(destination) -> Optional[Tuple[str, str, str]]:
+    """(name, country, admin) of a Destination or DestinationView"""
+    if destination is None:
+        return None
+    return (destination.name, getattr(destination, 'country', ''), getattr(destination, 'admin', ''))
+
+def analysis_key(rules_fingerprint: str, **inputs: Any) -> str:
+    """Canonical hash of normalized trip inputs (destinations given as destination_id)
+
+    Values are kept exact rather than bucketed: scores only depend on the
+    scoring buckets, but the packing list and hotel links use finer
+    thresholds (age in years, trips over 10 days) and the dates themselves.
+    """
+    canonical = {'version': ANALYSIS_VERSION, 'rules': rules_fingerprint, 'inputs': _normalize(inputs)}
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True, separators=(',', ':'),
+                                     ensure_ascii=False).encode()).hexdigest()
+
+_ANALYSES = LocationCache(max_size=ANALYSIS_CACHE_SIZE)
+
+def _fallback_search_links(destination, departure_date: datetime.date,
+                           return_date: datetime.date) -> Tuple[Dict[str, Any], ...]:
+    checkin, checkout = departure_date.strftime('%Y-%m-%d'), return_date.strftime('%Y-%m-%d')
+    return (
+        {
+            'platform': 'Booking.com',
+            'url': f"https://www.booking.com/searchresults.html?ss={destination.name}&checkin={checkin}&checkout={checkout}&group_adults=2&group_children=1&age=0",
+            'description': 'Comprehensive hotel search with family filters and your exact dates',
+            'filters_applied': ['Family rooms', 'Crib available', 'Kitchen facilities', 'Your travel dates']
+        },
+        {
+            'platform': 'Hotels.com',
+            'url': f"https://www.hotels.com/search.do?destination={destination.name}&adults=2&children=1&checkin={checkin}&checkout={checkout}",
+            'description': 'Family-friendly hotels and resorts with exact dates',
+            'filters_applied': ['Baby amenities', 'Family suites', 'Pool access', 'Your dates']
+        },
+        {
+            'platform': 'Airbnb',
+            'url': f"https://www.airbnb.com/s/{destination.name}/homes?adults=2&children=1&infants=1&checkin={checkin}&checkout={checkout}",
+            'description': 'Vacation rentals with kitchen and family amenities',
+            'filters_applied': ['Kitchen', 'Family-friendly', 'Crib available', 'Your exact dates']
+        }
+    )
+
+def _analyze(calculator: TravelComfortCalculator, baby_age: int, flight_hours: float, layovers: int,
+             departure_time: str, has_partner: bool, special_needs: bool, pumping_needed: bool,
+             first_international: bool, parent_experience: str, destination, departure,
+             trip_duration: int, departure_date: datetime.date, return_date: datetime.date,
+             hotel_preferences: Dict[str, Any]) -> TripAnalysis:
+    trip_score = TripScoringEngine(calculator).score_trip(
+        baby_age, flight_hours, layovers, departure_time,
+        has_partner, special_needs, pumping_needed, first_international,
+        parent_experience, destination, departure, trip_duration
+    )
+    season, weather_desc = get_destination_profile(destination).season_for(departure_date.month)
+
+    try:
+        packing_items = tuple(get_smart_packing_list(
+            baby_age, destination, trip_score.comfort_score, flight_hours,
+            special_needs, pumping_needed, trip_duration
+        ))
+    except Exception:
+        packing_items = FALLBACK_PACKING_LIST
+
+    try:
+        search_links = tuple(BabyFriendlyHotelService().get_baby_friendly_hotels(
+            destination, hotel_preferences, baby_age, trip_duration
+        ))
+    except Exception:
+        search_links = _fallback_search_links(destination, departure_date, return_date)
+
+    return TripAnalysis(trip_score, season, weather_desc, packing_items, search_links)
+
+def cached_analysis(calculator: TravelComfortCalculator, baby_age: int, flight_hours: float,
+                    layovers: int, departure_time: str, has_partner: bool, special_needs: bool,
+                    pumping_needed: bool, first_international: bool, parent_experience: str,
+                    destination, departure, trip_duration: int, departure_date: datetime.date,
+                    return_date: datetime.date,
+                    hotel_preferences: Dict[str, Any]) -> Tuple[TripAnalysis, bool]:
+    """(analysis, cache hit) for one trip, computed only if no session has analyzed the same inputs
+
+    The key covers the calculator's rules and weights, so edited scoring rules
+    start a fresh set of entries.
+    """
+    key = analysis_key(
+        calculator.rules.fingerprint, weights=calculator.factor_weights,
+        baby_age=baby_age, flight_hours=flight_hours, layovers=layovers,
+        departure_time=departure_time, has_partner=has_partner, special_needs=special_needs,
+        pumping_needed=pumping_needed, first_international=first_international,
+        parent_experience=parent_experience, destination=destination_id(destination),
+        # (the departure location does not change the analysis)
+        trip_duration=trip_duration,
+        departure_date=departure_date, return_date=return_date, hotel_preferences=hotel_preferences
+    )
+    analysis = _ANALYSES.get(key)
+    if analysis is not None:
+        return analysis, True
+    analysis = _analyze(calculator, baby_age, flight_hours, layovers, departure_time, has_partner,
+                        special_needs, pumping_needed, first_international, parent_experience,
+                        destination, departure, trip_duration, departure_date, return_date,
+                        hotel_preferences)
+    _ANALYSES.set(key, analysis)
+    return analysis, False
+
+def analysis_cache_stats() -> Dict[str, float]:
+    """Size, hit/miss/eviction counts and hit rate of the shared analysis cache"""
+    return _ANALYSES.stats()
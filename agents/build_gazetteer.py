@@ -0,0 +1,46 @@
+# agents/build_gazetteer.py
+"""
+Gazetteer snapshot build step
+Compiles world_locations.py, optionally extended with GeoNames / OurAirports
+dumps, plus its search indexes and display strings into the binary snapshot
+that GlobalLocationService memory-maps at startup.
+
+Run: python -m agents.build_gazetteer [output path]
+     python -m agents.build_gazetteer --geonames cities15000.txt --airports airports.csv \\
+         --country-info countryInfo.txt --admin1 admin1CodesASCII.txt
+"""
+
+import argparse
+import time
+
+from .location_service import GAZETTEER_SNAPSHOT_PATH, build_gazetteer_snapshot
+from .snapshot import Snapshot
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Build the gazetteer snapshot")
+    parser.add_argument('output', nargs='?', default=GAZETTEER_SNAPSHOT_PATH)
+    parser.add_argument('--geonames', help="GeoNames dump, e.g. cities15000.txt")
+    parser.add_argument('--airports', help="OurAirports airports.csv (needs --geonames)")
+    parser.add_argument('--country-info', help="GeoNames countryInfo.txt, for country names")
+    parser.add_argument('--admin1', help="GeoNames admin1CodesASCII.txt, for region names")
+    parser.add_argument('--min-population', type=int, default=0)
+    args = parser.parse_args(argv)
+    
+    import_options = {}
+    if args.geonames:
+        import_options = {
+            'geonames_path': args.geonames, 'airports_path': args.airports,
+            'country_info_path': args.country_info, 'admin1_path': args.admin1,
+            'min_population': args.min_population,
+        }
+    elif args.airports or args.country_info or args.admin1:
+        parser.error("--airports, --country-info and --admin1 require --geonames")
+    
+    start = time.perf_counter()
+    build_gazetteer_snapshot(args.output, **import_options)
+    snapshot = Snapshot(args.output)
+    print(f"Wrote {snapshot.meta['locations']:,} locations to {args.output} "
+          f"in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
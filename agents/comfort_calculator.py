@@ -3,9 +3,16 @@ Travel Comfort Calculator - FIXED SCORING SYSTEM
 Provides positive framing for travel planning calculations
 """
 
-from typing import Tuple, Dict, Optional
+from typing import Tuple, Dict, Mapping, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
+from .destination_profiles import get_destination_profile
+from .scoring_engine import ScoringCube, trip_columns
+from .scoring_rules import ScoringRules, current_rules
+from .search_cache import LocationCache
+
 @dataclass
 class Destination:
     name: str
@@ -16,21 +23,38 @@ class Destination:
     display: str
     source: str = 'database'
 
+# Thresholds, normalized (0-1) values and weights come from the comfort section
+# of scoring_rules.json (see scoring_rules.py); scores are read from the
+# ScoringCube of scoring_engine.py
+
+# Cubes by (calculator class, rules fingerprint, factor weights), shared by all calculator instances
+_SCORING_CUBES = LocationCache(max_size=16)
+
 class TravelComfortCalculator:
-    """Calculate travel comfort scores with positive framing and FIXED scoring"""
+    """Calculate travel comfort scores with positive framing and FIXED scoring
 
-    def __init__(self):
-        self.factor_weights = {
-            'baby_age_comfort': 3.0,
-            'flight_comfort': 3.0,
-            'logistical_ease': 2.0,
-            'timing_convenience': 2.0,
-            'support_system': 2.0,
-            'medical_preparedness': 1.0,
-            'experience_advantage': 2.0,
-            'destination_friendliness': 1.0,
-            'trip_duration_comfort': 2.0
-        }
+    A calculator scores with the rules it was created with (by default the
+    current contents of scoring_rules.json), so create one per analysis to pick
+    up edits to the rules file.
+    """
+
+    def __init__(self, rules: Optional[ScoringRules] = None):
+        self.rules = rules or current_rules()
+        self.factor_weights = dict(self.rules.comfort.weights)
+
+    def scoring_cube(self) -> ScoringCube:
+        """The ScoringCube for the current rules and factor_weights, built on first use
+        
+        Cubes are shared between instances and looked up by the rules fingerprint
+        and weights, so changing factor_weights switches to (or builds) the
+        matching cube.
+        """
+        key = (self.rules.fingerprint, tuple(self.factor_weights.items()))
+        cube = self.__dict__.get('_scoring_cube')
+        if cube is None or cube[0] != key:
+            cube = (key, _SCORING_CUBES.get_or_compute((type(self),) + key, lambda: ScoringCube(self)))
+            self._scoring_cube = cube
+        return cube[1]
 
     def calculate_travel_comfort(
         self, baby_age: int, flight_hours: float, layovers: int, departure_time: str,
@@ -38,132 +62,83 @@ class TravelComfortCalculator:
         first_international: bool, parent_experience: str, destination: Destination,
         departure_location: Optional[Destination] = None, trip_duration: int = 5
     ) -> Tuple[int, dict]:
-        comfort_factors = {
-            'baby_age_comfort': self._calculate_baby_age_comfort(baby_age),
-            'flight_comfort': self._calculate_flight_comfort(flight_hours, layovers),
-            'logistical_ease': self._calculate_logistics_comfort(pumping_needed, first_international),
-            'timing_convenience': self._calculate_timing_comfort(departure_time),
-            'support_system': self._calculate_support_comfort(has_partner),
-            'medical_preparedness': self._calculate_medical_comfort(special_needs),
-            'experience_advantage': self._calculate_experience_comfort(parent_experience),
-            'destination_friendliness': self._calculate_destination_comfort(destination),
-            'trip_duration_comfort': self._calculate_duration_comfort(trip_duration)
-        }
-
-        total_comfort = sum(comfort_factors.values())
-        max_possible = sum(self.factor_weights.values())
-        comfort_score = max(1, min(10, round((total_comfort / max_possible) * 10)))
-
-        return comfort_score, comfort_factors
+        cube = self.scoring_cube()
+        index = cube.index_of(baby_age, flight_hours, layovers, departure_time, has_partner,
+                              special_needs, pumping_needed, first_international,
+                              parent_experience, destination, trip_duration)
+        return cube.score_at(index), cube.factors_at(index)
+
+    def calculate_travel_comfort_batch(
+        self, trips: Mapping[str, object]
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Score many trips at once from columnar inputs
+        
+        trips maps the calculate_travel_comfort parameter names (scoring_engine.CUBE_AXES) to
+        arrays, lists or scalars, e.g. a dict of NumPy arrays or a DataFrame;
+        scalars are broadcast and trip_duration defaults to 5. destination holds
+        destination names or objects with a name. Returns (scores, factors) like
+        the scalar method, with an int array of 1-10 scores and one float array
+        per factor, all read from the scoring cube.
+        """
+        cube = self.scoring_cube()
+        indexes = cube.indexes_of(trip_columns(trips))
+        return cube.scores[indexes].astype(np.int64), cube.factor_columns(indexes)
 
     def _calculate_baby_age_comfort(self, baby_age: int) -> float:
         """FIXED: Now properly respects weight limits"""
-        if baby_age <= 3:
-            normalized = 0.83  # 0.83 * 3 = 2.5 (same as before)
-        elif baby_age <= 6:
-            normalized = 1.0   # 1.0 * 3 = 3.0 (same as before)
-        elif baby_age <= 11:
-            normalized = 0.33  # 0.33 * 3 = 1.0 (same as before)
-        elif baby_age <= 18:
-            normalized = 0.5   # 0.5 * 3 = 1.5 (same as before)
-        else:
-            normalized = 0.83  # 0.83 * 3 = 2.5 (same as before)
-        
+        normalized = self.rules.comfort['baby_age'].value(baby_age)
         return normalized * self.factor_weights['baby_age_comfort']
 
     def _calculate_flight_comfort(self, flight_hours: float, layovers: int) -> float:
         """FIXED: Now properly respects weight limits - was the main problem!"""
-        # Duration comfort (0-1 scale)
-        if flight_hours <= 3:
-            duration_comfort = 1.0
-        elif flight_hours <= 6:
-            duration_comfort = 0.83  # was 2.5, now 0.83 * 3 = 2.5
-        elif flight_hours <= 10:
-            duration_comfort = 0.5   # was 1.5, now 0.5 * 3 = 1.5
-        else:
-            duration_comfort = 0.17  # was 0.5, now 0.17 * 3 = 0.5
-        
-        # Layover comfort (0-1 scale)
-        if layovers == 0:
-            layover_comfort = 0.67   # was 2.0, now 0.67 * 3 = 2.0
-        elif layovers == 1:
-            layover_comfort = 0.33   # was 1.0, now 0.33 * 3 = 1.0
-        else:
-            layover_comfort = 0.0
+        rules = self.rules.comfort
+        # Duration and layover comfort (0-1 scale)
+        duration_comfort = rules['flight_hours'].value(flight_hours)
+        layover_comfort = rules['layovers'].value(layovers)
         
         # Combined comfort (weighted average, then scale to weight)
-        combined_comfort = (duration_comfort * 0.7) + (layover_comfort * 0.3)
+        blend = rules['flight_blend']
+        combined_comfort = (duration_comfort * blend['flight_hours']) + (layover_comfort * blend['layovers'])
         return combined_comfort * self.factor_weights['flight_comfort']
 
     def _calculate_timing_comfort(self, departure_time: str) -> float:
         """FIXED: Now properly respects weight limits"""
-        timing_scores = {
-            "Morning (7-11 AM)": 1.0,     # 1.0 * 2 = 2.0 (same as before)
-            "Evening (5-10 PM)": 1.0,     # 1.0 * 2 = 2.0 (same as before)  
-            "Afternoon (11 AM-5 PM)": 0.75, # 0.75 * 2 = 1.5 (same as before)
-            "Late Night (10 PM-12 AM)": 0.5, # 0.5 * 2 = 1.0 (same as before)
-            "Very Early (5-7 AM)": 0.25,  # 0.25 * 2 = 0.5 (same as before)
-            "Red-eye (12-5 AM)": 0.0      # 0.0 * 2 = 0.0 (same as before)
-        }
-        normalized = timing_scores.get(departure_time, 0.5)
+        normalized = self.rules.comfort['departure_time'].value(departure_time)
         return normalized * self.factor_weights['timing_convenience']
 
     def _calculate_duration_comfort(self, trip_duration: int) -> float:
         """FIXED: Now properly respects weight limits"""
-        if trip_duration <= 3:
-            normalized = 1.0   # 1.0 * 2 = 2.0 (same as before)
-        elif trip_duration <= 7:
-            normalized = 0.75  # 0.75 * 2 = 1.5 (same as before)
-        elif trip_duration <= 14:
-            normalized = 0.5   # 0.5 * 2 = 1.0 (same as before)
-        else:
-            normalized = 0.25  # 0.25 * 2 = 0.5 (same as before)
-        
+        normalized = self.rules.comfort['trip_duration'].value(trip_duration)
         return normalized * self.factor_weights['trip_duration_comfort']
 
     def _calculate_support_comfort(self, has_partner: bool) -> float:
         """FIXED: Now properly respects weight limits"""
-        normalized = 1.0 if has_partner else 0.25  # 1.0*2=2.0 or 0.25*2=0.5
+        normalized = self.rules.comfort['has_partner'].value(has_partner)
         return normalized * self.factor_weights['support_system']
 
     def _calculate_medical_comfort(self, special_needs: bool) -> float:
         """FIXED: Now properly respects weight limits"""
-        normalized = 0.5 if special_needs else 1.0  # 0.5*1=0.5 or 1.0*1=1.0
+        normalized = self.rules.comfort['special_needs'].value(special_needs)
         return normalized * self.factor_weights['medical_preparedness']
 
     def _calculate_logistics_comfort(self, pumping_needed: bool, first_international: bool) -> float:
         """FIXED: Now properly respects weight limits"""
-        comfort = 1.0
-        if pumping_needed:
-            comfort -= 0.25
-        if first_international:
-            comfort -= 0.25
-        normalized = max(0, comfort)
+        normalized = self.rules.comfort['logistics'].value(
+            pumping_needed=pumping_needed, first_international=first_international)
         return normalized * self.factor_weights['logistical_ease']
 
     def _calculate_experience_comfort(self, parent_experience: str) -> float:
         """FIXED: Now properly respects weight limits"""
-        experience_scores = {
-            "Travel veteran (10+ flights)": 1.0,     # 1.0 * 2 = 2.0 (same)
-            "Experienced traveler (4+ flights)": 0.75, # 0.75 * 2 = 1.5 (same)
-            "2-3 previous flights": 0.5,             # 0.5 * 2 = 1.0 (same)
-            "First time flying with baby": 0.25      # 0.25 * 2 = 0.5 (same)
-        }
-        normalized = experience_scores.get(parent_experience, 0.5)
+        normalized = self.rules.comfort['parent_experience'].value(parent_experience)
         return normalized * self.factor_weights['experience_advantage']
 
     def _calculate_destination_comfort(self, destination: Destination) -> float:
         """FIXED: Now properly respects weight limits"""
-        excellent = ['Dubai', 'Singapore', 'Tokyo', 'London', 'Sydney', 'Barcelona', 'Amsterdam', 'Copenhagen', 'Reykjavik', 'Paris']
-        good = ['New York', 'Los Angeles', 'Rome', 'Berlin', 'Madrid', 'Istanbul', 'Mumbai', 'Delhi', 'Hyderabad', 'Bangkok']
-        
-        if destination.name in excellent:
-            normalized = 1.0   # 1.0 * 1 = 1.0 (same as before)
-        elif destination.name in good:
-            normalized = 0.7   # 0.7 * 1 = 0.7 (same as before)
-        else:
-            normalized = 0.5   # 0.5 * 1 = 0.5 (same as before)
-        
+        return self._calculate_tier_comfort(self.rules.destination_tier(destination.name))
+
+    def _calculate_tier_comfort(self, tier: str) -> float:
+        """Destination comfort for a friendliness tier (excellent/good/standard)"""
+        normalized = self.rules.comfort['destination_tier'][tier]
         return normalized * self.factor_weights['destination_friendliness']
 
     def get_comfort_insights(self, comfort_score: int, factors: Dict) -> Dict[str, str]:
@@ -221,22 +196,7 @@ class TravelComfortCalculator:
 class WeatherComfortService:
     @staticmethod
     def get_weather_comfort_info(destination: Destination) -> Dict[str, str]:
-        climate_data = {
-            'Dubai': {'temp': '35-40°C', 'climate': 'Hot & Humid', 'season': 'Year-round heat', 'comfort': 'Stay hydrated, use AC'},
-            'Hyderabad': {'temp': '25-35°C', 'climate': 'Tropical', 'season': 'Hot, monsoon season', 'comfort': 'Light clothing recommended'},
-            'Mumbai': {'temp': '25-32°C', 'climate': 'Tropical', 'season': 'Hot & humid', 'comfort': 'Breathable fabrics essential'},
-            'Singapore': {'temp': '25-32°C', 'climate': 'Tropical', 'season': 'Consistently warm', 'comfort': 'Excellent AC everywhere'},
-            'Stockholm': {'temp': '0-20°C', 'climate': 'Continental', 'season': 'Cold winters', 'comfort': 'Layer clothing, heated indoors'},
-            'Reykjavik': {'temp': '0-15°C', 'climate': 'Oceanic', 'season': 'Cool year-round', 'comfort': 'Warm clothing needed'},
-            'Copenhagen': {'temp': '2-22°C', 'climate': 'Oceanic', 'season': 'Mild but cool', 'comfort': 'Layers recommended'},
-            'London': {'temp': '5-22°C', 'climate': 'Oceanic', 'season': 'Mild, rainy', 'comfort': 'Excellent for families'},
-            'Paris': {'temp': '3-25°C', 'climate': 'Oceanic', 'season': 'Mild seasons', 'comfort': 'Generally comfortable'},
-            'Tokyo': {'temp': '5-30°C', 'climate': 'Humid subtropical', 'season': 'Four distinct seasons', 'comfort': 'Varies by season'},
-            'Sydney': {'temp': '10-25°C', 'climate': 'Oceanic', 'season': 'Mild year-round', 'comfort': 'Ideal for families'}
-        }
-        return climate_data.get(destination.name, {
-            'temp': '15-25°C', 'climate': 'Temperate', 'season': 'Variable', 'comfort': 'Generally moderate'
-        })
+        return dict(get_destination_profile(destination).climate)
 
 
 # Test the fixed scoring system
@@ -0,0 +1,235 @@
+# agents/destination_profiles.py
+"""
+Destination profiles
+Everything the analyzer shows about a destination (climate, seasonal weather by
+month, family insights, emoji and friendliness tier) precomputed into one
+immutable record, so a page render needs a single lookup per destination
+"""
+
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from .scoring_rules import ScoringRules, current_rules
+
+# Typical climate per destination (WeatherComfortService)
+CLIMATE_DATA = {
+    'Dubai': {'temp': '35-40°C', 'climate': 'Hot & Humid', 'season': 'Year-round heat', 'comfort': 'Stay hydrated, use AC'},
+    'Hyderabad': {'temp': '25-35°C', 'climate': 'Tropical', 'season': 'Hot, monsoon season', 'comfort': 'Light clothing recommended'},
+    'Mumbai': {'temp': '25-32°C', 'climate': 'Tropical', 'season': 'Hot & humid', 'comfort': 'Breathable fabrics essential'},
+    'Singapore': {'temp': '25-32°C', 'climate': 'Tropical', 'season': 'Consistently warm', 'comfort': 'Excellent AC everywhere'},
+    'Stockholm': {'temp': '0-20°C', 'climate': 'Continental', 'season': 'Cold winters', 'comfort': 'Layer clothing, heated indoors'},
+    'Reykjavik': {'temp': '0-15°C', 'climate': 'Oceanic', 'season': 'Cool year-round', 'comfort': 'Warm clothing needed'},
+    'Copenhagen': {'temp': '2-22°C', 'climate': 'Oceanic', 'season': 'Mild but cool', 'comfort': 'Layers recommended'},
+    'London': {'temp': '5-22°C', 'climate': 'Oceanic', 'season': 'Mild, rainy', 'comfort': 'Excellent for families'},
+    'Paris': {'temp': '3-25°C', 'climate': 'Oceanic', 'season': 'Mild seasons', 'comfort': 'Generally comfortable'},
+    'Tokyo': {'temp': '5-30°C', 'climate': 'Humid subtropical', 'season': 'Four distinct seasons', 'comfort': 'Varies by season'},
+    'Sydney': {'temp': '10-25°C', 'climate': 'Oceanic', 'season': 'Mild year-round', 'comfort': 'Ideal for families'}
+}
+DEFAULT_CLIMATE = {'temp': '15-25°C', 'climate': 'Temperate', 'season': 'Variable', 'comfort': 'Generally moderate'}
+
+# Seasonal weather: season -> (months, description)
+SEASONAL_WEATHER = {
+    'Dubai': {
+        'winter': ((12, 1, 2), "Perfect weather! 22-28°C, ideal for families"),
+        'spring': ((3, 4, 5), "Warm and pleasant, 25-35°C"),
+        'summer': ((6, 7, 8), "Very hot! 35-45°C, stay indoors midday"),
+        'autumn': ((9, 10, 11), "Hot but cooling down, 28-38°C")
+    },
+    'London': {
+        'winter': ((12, 1, 2), "Cold and wet, 2-8°C, pack warm clothes"),
+        'spring': ((3, 4, 5), "Mild and rainy, 8-15°C, perfect for sightseeing"),
+        'summer': ((6, 7, 8), "Warm and pleasant, 15-25°C, ideal weather"),
+        'autumn': ((9, 10, 11), "Cool and crisp, 8-16°C, beautiful season")
+    },
+    'Singapore': {
+        'winter': ((12, 1, 2), "Dry season, 24-30°C, best time to visit"),
+        'spring': ((3, 4, 5), "Hot and humid, 26-32°C"),
+        'summer': ((6, 7, 8), "Very hot and humid, 26-33°C, frequent rain"),
+        'autumn': ((9, 10, 11), "Monsoon season, 25-31°C, heavy rains")
+    },
+    'Tokyo': {
+        'winter': ((12, 1, 2), "Cold and dry, 0-10°C, pack warm layers"),
+        'spring': ((3, 4, 5), "Beautiful cherry blossoms, 10-20°C, perfect weather"),
+        'summer': ((6, 7, 8), "Hot and humid, 20-30°C, rainy season"),
+        'autumn': ((9, 10, 11), "Cool and comfortable, 10-22°C, stunning colors")
+    },
+    'Paris': {
+        'winter': ((12, 1, 2), "Cold and wet, 3-8°C, cozy indoor activities"),
+        'spring': ((3, 4, 5), "Mild and blooming, 8-16°C, lovely for walking"),
+        'summer': ((6, 7, 8), "Warm and sunny, 15-25°C, perfect for tourism"),
+        'autumn': ((9, 10, 11), "Cool and golden, 8-18°C, beautiful season")
+    }
+}
+DEFAULT_SEASONS = {
+    'winter': ((12, 1, 2), "Winter season - check local weather"),
+    'spring': ((3, 4, 5), "Spring season - mild temperatures"),
+    'summer': ((6, 7, 8), "Summer season - warm weather"),
+    'autumn': ((9, 10, 11), "Autumn season - cooler temperatures")
+}
+FALLBACK_SEASON = ("spring", "Moderate weather expected")
+
+COUNTRY_EMOJIS = {
+    'United Arab Emirates': '🇦🇪',
+    'United Kingdom': '🇬🇧',
+    'Japan': '🇯🇵',
+    'United States': '🇺🇸',
+    'Singapore': '🇸🇬',
+    'Thailand': '🇹🇭',
+    'France': '🇫🇷',
+    'Australia': '🇦🇺',
+    'Spain': '🇪🇸',
+    'Netherlands': '🇳🇱',
+    'India': '🇮🇳',
+    'Germany': '🇩🇪',
+    'Italy': '🇮🇹',
+    'Sweden': '🇸🇪',
+    'Norway': '🇳🇴',
+    'Denmark': '🇩🇰',
+    'Iceland': '🇮🇸'
+}
+DEFAULT_EMOJI = '🌍'
+
+# Family insights (get_destination_insights)
+DEFAULT_INSIGHTS = {
+    'family_rating': 'Standard',
+    'infrastructure': 'Good',
+    'language_barrier': 'Low',
+    'medical_facilities': 'Available',
+    'baby_facilities': 'Basic'
+}
+FAMILY_INSIGHTS = {
+    'family_rating': 'Excellent',
+    'infrastructure': 'World-class',
+    'baby_facilities': 'Comprehensive'
+}
+ENGLISH_SPEAKING_COUNTRIES = frozenset({
+    'United States', 'Canada', 'United Kingdom', 'Australia', 'New Zealand', 'Singapore'
+})
+DEVELOPED_COUNTRIES = frozenset({
+    'Japan', 'Germany', 'France', 'Netherlands', 'Sweden', 'Norway', 'Denmark'
+})
+COUNTRY_INSIGHTS = {
+    # UAE-specific (since it's a key destination)
+    'United Arab Emirates': {
+        'family_rating': 'Excellent',
+        'infrastructure': 'World-class',
+        'language_barrier': 'Low',
+        'medical_facilities': 'Excellent',
+        'baby_facilities': 'Comprehensive'
+    }
+}
+
+# Friendliness tiers (excellent/good/standard) and their comfort values come
+# from the scoring rules; the excellent tier is the family destination list
+FAMILY_TIER = 'excellent'
+
+def profiled_names(rules: ScoringRules) -> frozenset:
+    """Names with their own entry in any table above or a destination tier; every
+    other name shares its country's profile"""
+    return frozenset(CLIMATE_DATA) | frozenset(SEASONAL_WEATHER) | frozenset(rules.destination_tiers)
+
+@dataclass(frozen=True)
+class DestinationProfile:
+    """Precomputed display data for one destination"""
+    climate: Mapping[str, str]
+    # (season, description) for each month, January first
+    seasons: Tuple[Tuple[str, str], ...]
+    insights: Mapping[str, str]
+    emoji: str
+    tier: str
+    friendliness: float
+
+    @property
+    def family_friendly(self) -> bool:
+        return self.tier == FAMILY_TIER
+
+    def season_for(self, month: int) -> Tuple[str, str]:
+        """(season, weather description) for a month number (1-12)"""
+        return self.seasons[month - 1] if 1 <= month <= 12 else FALLBACK_SEASON
+
+def _season_table(name: str) -> Tuple[Tuple[str, str], ...]:
+    seasons = SEASONAL_WEATHER.get(name, DEFAULT_SEASONS)
+    by_month = {month: (season, description)
+                for season, (months, description) in seasons.items() for month in months}
+    return tuple(by_month.get(month, FALLBACK_SEASON) for month in range(1, 13))
+
+def _insights(tier: str, country: str) -> Dict[str, str]:
+    insights = dict(DEFAULT_INSIGHTS)
+    if tier == FAMILY_TIER:
+        insights.update(FAMILY_INSIGHTS)
+    if country in ENGLISH_SPEAKING_COUNTRIES:
+        insights['language_barrier'] = 'None'
+    if country in DEVELOPED_COUNTRIES:
+        insights.update({'infrastructure': 'Excellent', 'medical_facilities': 'World-class'})
+    insights.update(COUNTRY_INSIGHTS.get(country, {}))
+    return insights
+
+def build_profile(name: str, country: str, rules: ScoringRules) -> DestinationProfile:
+    """Profile for a destination name and country, evaluated from the tables above"""
+    tier = rules.destination_tier(name)
+    return DestinationProfile(
+        climate=MappingProxyType(dict(CLIMATE_DATA.get(name, DEFAULT_CLIMATE))),
+        seasons=_season_table(name),
+        insights=MappingProxyType(_insights(tier, country)),
+        emoji=COUNTRY_EMOJIS.get(country, DEFAULT_EMOJI),
+        tier=tier,
+        friendliness=rules.comfort['destination_tier'][tier],
+    )
+
+class DestinationProfileTable:
+    """Profiles keyed by (profiled name or '', country)
+
+    Destinations without a name-specific entry share their country's profile,
+    so the table holds one record per country plus one per profiled name.
+    precompute() fills it ahead of time (the location service does this for its
+    whole gazetteer); anything else is built once on first lookup. Tiers come
+    from the scoring rules, so the table empties itself when new rules are
+    loaded and rebuilds profiles on demand.
+    """
+
+    def __init__(self):
+        self._profiles: Dict[Tuple[str, str], DestinationProfile] = {}
+        self._rules: Optional[ScoringRules] = None
+        self._names: frozenset = frozenset()
+        self._lock = threading.Lock()
+
+    def _current_rules(self) -> ScoringRules:
+        rules = current_rules()
+        if rules is not self._rules:
+            with self._lock:
+                if rules is not self._rules:
+                    self._profiles = {}
+                    self._names = profiled_names(rules)
+                    self._rules = rules
+        return rules
+
+    def _key(self, name: str, country: str) -> Tuple[str, str]:
+        return (name if name in self._names else '', country or '')
+
+    def precompute(self, destinations: Iterable[Tuple[str, str]]) -> None:
+        """Build profiles for (name, country) pairs not in the table yet"""
+        rules = self._current_rules()
+        keys = {self._key(name, country) for name, country in destinations}
+        with self._lock:
+            for key in keys - self._profiles.keys():
+                self._profiles[key] = build_profile(*key, rules)
+
+    def profile_for(self, name: str, country: Optional[str] = '') -> DestinationProfile:
+        rules = self._current_rules()
+        key = self._key(name, country)
+        profile = self._profiles.get(key)
+        if profile is None:
+            with self._lock:
+                profile = self._profiles.setdefault(key, build_profile(*key, rules))
+        return profile
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+DESTINATION_PROFILES = DestinationProfileTable()
+
+def get_destination_profile(destination) -> DestinationProfile:
+    """Profile for anything with name and country attributes (Destination, DestinationView)"""
+    return DESTINATION_PROFILES.profile_for(destination.name, getattr(destination, 'country', ''))
@@ -0,0 +1,104 @@
+# agents/flight_estimator.py
+"""
+Flight time estimation from coordinates
+Vectorized great-circle distances and estimated block times for one route or a
+whole origin x destination matrix
+"""
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .geo_index import EARTH_RADIUS_KM
+
+# Block-time model: airways are ~5% longer than the great circle, jets average
+# ~830 km/h gate to gate in cruise, and every leg adds ~30 min of taxi, climb
+# and approach. Routes beyond MAX_NONSTOP_KM are assumed to need one stop.
+ROUTE_FACTOR = 1.05
+CRUISE_SPEED_KMH = 830.0
+LEG_OVERHEAD_HOURS = 0.5
+MAX_NONSTOP_KM = 12000.0
+
+@dataclass(frozen=True)
+class FlightEstimate:
+    distance_km: float
+    flight_hours: float
+    layovers: int
+
+def estimate_layovers(distance_km) -> np.ndarray:
+    """Expected number of stops for great-circle distances in km"""
+    return (np.asarray(distance_km) > MAX_NONSTOP_KM).astype(np.int64)
+
+def estimate_block_hours(distance_km, layovers=None) -> np.ndarray:
+    """Estimated total flight time in hours (all legs, excluding ground connections)"""
+    distance_km = np.asarray(distance_km, dtype=np.float64)
+    if layovers is None:
+        layovers = estimate_layovers(distance_km)
+    return distance_km * ROUTE_FACTOR / CRUISE_SPEED_KMH + LEG_OVERHEAD_HOURS * (layovers + 1)
+
+class FlightTimeEstimator:
+    """Great-circle distances and block times between rows of a coordinate table
+
+    Radians and cosines are computed once, on first use, so a route, one origin
+    against every destination, or a full origin x destination matrix is a
+    single broadcast NumPy expression. Per-origin rows are cached for repeat
+    lookups.
+    """
+
+    def __init__(self, lat, lon, cached_origins: int = 256):
+        self._lat_degrees = lat
+        self._lon_degrees = lon
+        self._origin_distances = lru_cache(maxsize=cached_origins)(self._distances_from)
+
+    @cached_property
+    def _radians(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        lat = np.radians(np.asarray(self._lat_degrees, dtype=np.float64))
+        lon = np.radians(np.asarray(self._lon_degrees, dtype=np.float64))
+        return lat, lon, np.cos(lat)
+
+    def __len__(self) -> int:
+        return len(self._lat_degrees)
+
+    def distance_matrix(self, origins, destinations=None) -> np.ndarray:
+        """Distances in km, shape (len(origins), len(destinations)); all rows if destinations is None"""
+        lat, lon, cos_lat = self._radians
+        origins = np.asarray(origins, dtype=np.int64).reshape(-1, 1)
+        lat1, lon1, cos1 = lat[origins], lon[origins], cos_lat[origins]
+        if destinations is None:
+            lat2, lon2, cos2 = lat[np.newaxis], lon[np.newaxis], cos_lat[np.newaxis]
+        else:
+            destinations = np.asarray(destinations, dtype=np.int64).reshape(1, -1)
+            lat2, lon2, cos2 = lat[destinations], lon[destinations], cos_lat[destinations]
+        h = np.sin((lat2 - lat1) / 2.0) ** 2 + cos1 * cos2 * np.sin((lon2 - lon1) / 2.0) ** 2
+        return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+    def hours_matrix(self, origins, destinations=None) -> Tuple[np.ndarray, np.ndarray]:
+        """(estimated flight hours, layovers) matrices for origins x destinations"""
+        distances = self.distance_matrix(origins, destinations)
+        layovers = estimate_layovers(distances)
+        return estimate_block_hours(distances, layovers), layovers
+
+    def hours_from(self, origin: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(estimated flight hours, layovers) from one origin row to every row"""
+        distances = self.distances_from(origin)
+        layovers = estimate_layovers(distances)
+        return estimate_block_hours(distances, layovers), layovers
+
+    def _distances_from(self, origin: int) -> np.ndarray:
+        distances = self.distance_matrix([origin])[0]
+        distances.setflags(write=False)
+        return distances
+
+    def distances_from(self, origin: int) -> np.ndarray:
+        """Read-only distances in km from one origin row to every row (cached per origin)"""
+        return self._origin_distances(int(origin))
+
+    def estimate(self, origin: int, destination: int) -> Optional[FlightEstimate]:
+        """Estimate for one route, or None if either end has no coordinates"""
+        distance = float(self.distance_matrix([origin], [destination])[0, 0])
+        if np.isnan(distance):
+            return None
+        layovers = int(estimate_layovers(distance))
+        return FlightEstimate(round(distance, 1), float(estimate_block_hours(distance, layovers)), layovers)
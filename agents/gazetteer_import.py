@@ -0,0 +1,164 @@
+# agents/gazetteer_import.py
+"""
+Streaming importer for external gazetteers
+Reads GeoNames city dumps (cities15000.txt, cities5000.txt, ...) and OurAirports
+airports.csv in fixed-size chunks and turns them into LocationStore records,
+merging airport codes onto their cities
+"""
+
+import csv
+import itertools
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .location_store import LocationRecord, LocationStore
+from .search_index import normalize_search_text
+from .world_locations import LOCATION_ALIASES, format_display_name, location_records
+
+CHUNK_SIZE = 50_000
+
+# https://download.geonames.org/export/dump/readme.txt, "main 'geoname' table"
+GEONAMES_COLUMNS = [
+    'geonameid', 'name', 'asciiname', 'alternatenames', 'latitude', 'longitude',
+    'feature_class', 'feature_code', 'country_code', 'cc2', 'admin1_code', 'admin2_code',
+    'admin3_code', 'admin4_code', 'population', 'elevation', 'dem', 'timezone',
+    'modification_date',
+]
+
+# Airports with an IATA code and scheduled service are attached to the city named
+# by their municipality if it lies within AIRPORT_RADIUS_KM; larger airports first
+AIRPORT_TYPE_RANK = {'large_airport': 0, 'medium_airport': 1, 'small_airport': 2}
+AIRPORT_RADIUS_KM = 60.0
+
+# Imported places with the same name as a curated world_locations entry this
+# close to it are treated as duplicates of that entry
+DUPLICATE_RADIUS_KM = 50.0
+
+# (ISO country code, folded municipality) -> [(type rank, IATA code, lat, lon)]
+AirportIndex = Dict[Tuple[str, str], List[Tuple[int, str, float, float]]]
+
+def _distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    h = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * 6371.0088 * math.asin(min(math.sqrt(h), 1.0))
+
+def read_country_names(path: str) -> Dict[str, str]:
+    """ISO 3166 alpha-2 code -> country name, from GeoNames countryInfo.txt"""
+    names = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#') or not line.strip():
+                continue
+            fields = line.rstrip('\n').split('\t')
+            names[fields[0]] = fields[4]
+    return names
+
+def read_admin1_names(path: str) -> Dict[str, str]:
+    """'CC.admin1' code -> region name, from GeoNames admin1CodesASCII.txt"""
+    names = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) >= 2:
+                names[fields[0]] = fields[1]
+    return names
+
+def read_airports(path: str, chunk_size: int = CHUNK_SIZE) -> AirportIndex:
+    """Scheduled-service airports with IATA codes from OurAirports airports.csv
+
+    Only the few thousand qualifying airports are kept, whatever the file size.
+    """
+    airports = {}
+    chunks = pd.read_csv(
+        path, chunksize=chunk_size, keep_default_na=False, dtype=str,
+        usecols=['type', 'latitude_deg', 'longitude_deg', 'iso_country', 'municipality',
+                 'scheduled_service', 'iata_code'],
+    )
+    for chunk in chunks:
+        chunk = chunk[(chunk['iata_code'].str.len() == 3)
+                      & (chunk['scheduled_service'] == 'yes')
+                      & chunk['type'].isin(list(AIRPORT_TYPE_RANK))]
+        for airport_type, lat, lon, country, municipality, code in zip(
+                *(chunk[column].tolist() for column in
+                  ('type', 'latitude_deg', 'longitude_deg', 'iso_country', 'municipality', 'iata_code'))):
+            key = (country, normalize_search_text(municipality))
+            airports.setdefault(key, []).append(
+                (AIRPORT_TYPE_RANK[airport_type], code.upper(), float(lat), float(lon))
+            )
+    for entries in airports.values():
+        entries.sort()
+    return airports
+
+def iter_geonames_records(path: str, country_names: Optional[Dict[str, str]] = None,
+                          admin1_names: Optional[Dict[str, str]] = None,
+                          airports: Optional[AirportIndex] = None,
+                          min_population: int = 0,
+                          chunk_size: int = CHUNK_SIZE) -> Iterator[LocationRecord]:
+    """LocationStore records for the populated places in a GeoNames dump
+
+    The file is read chunk_size rows at a time and country/region names are
+    mapped per chunk, so memory stays flat however large the dump is. Without
+    country_names, rows keep their ISO country code as the country.
+    """
+    country_names = country_names or {}
+    admin1_names = admin1_names or {}
+    airports = airports or {}
+    chunks = pd.read_csv(
+        path, sep='\t', header=None, names=GEONAMES_COLUMNS, quoting=csv.QUOTE_NONE,
+        usecols=['name', 'latitude', 'longitude', 'feature_class', 'country_code',
+                 'admin1_code', 'population'],
+        dtype={'name': str, 'feature_class': str, 'country_code': str, 'admin1_code': str},
+        keep_default_na=False, chunksize=chunk_size, encoding='utf-8',
+    )
+    for chunk in chunks:
+        population = pd.to_numeric(chunk['population'], errors='coerce').fillna(0).astype('int64')
+        keep = (chunk['feature_class'] == 'P') & (population >= min_population)
+        chunk, population = chunk[keep], population[keep]
+        countries = chunk['country_code'].map(country_names).fillna(chunk['country_code'])
+        admins = (chunk['country_code'] + '.' + chunk['admin1_code']).map(admin1_names).fillna('')
+
+        # Plain lists iterate much faster than (Arrow-backed) Series
+        for name, country_code, country, admin, pop, lat, lon in zip(
+                chunk['name'].tolist(), chunk['country_code'].tolist(), countries.tolist(),
+                admins.tolist(), population.tolist(),
+                chunk['latitude'].tolist(), chunk['longitude'].tolist()):
+            codes = []
+            if airports:
+                codes = [code for _, code, airport_lat, airport_lon
+                         in airports.get((country_code, normalize_search_text(name)), ())
+                         if _distance_km(lat, lon, airport_lat, airport_lon) <= AIRPORT_RADIUS_KM]
+            data = {'type': 'city', 'country': country, 'airport_codes': codes}
+            yield (name, country, admin, pop, 'city', format_display_name(data, name),
+                   codes, lat, lon)
+
+def import_gazetteer(geonames_path: str, airports_path: Optional[str] = None,
+                     country_info_path: Optional[str] = None,
+                     admin1_path: Optional[str] = None,
+                     min_population: int = 0) -> LocationStore:
+    """Curated world_locations entries followed by the imported GeoNames places,
+    with the curated alternate names
+
+    Store columns and lookup indexes are built incrementally as records stream
+    in; no intermediate per-row dicts are kept.
+    """
+    airports = read_airports(airports_path) if airports_path else None
+    country_names = read_country_names(country_info_path) if country_info_path else None
+    admin1_names = read_admin1_names(admin1_path) if admin1_path else None
+
+    curated = list(location_records())
+    curated_places = {}
+    for name, _, _, _, _, _, _, lat, lon in curated:
+        curated_places.setdefault(normalize_search_text(name), []).append((lat, lon))
+
+    def is_curated(record: LocationRecord) -> bool:
+        name, lat, lon = record[0], record[7], record[8]
+        return any(_distance_km(lat, lon, curated_lat, curated_lon) <= DUPLICATE_RADIUS_KM
+                   for curated_lat, curated_lon in curated_places.get(normalize_search_text(name), ()))
+
+    imported = iter_geonames_records(geonames_path, country_names, admin1_names, airports,
+                                     min_population=min_population)
+    return LocationStore(itertools.chain(curated, itertools.filterfalse(is_curated, imported)),
+                         aliases=LOCATION_ALIASES)
@@ -0,0 +1,135 @@
+# agents/geo_index.py
+"""
+Spatial index for location proximity queries
+Static KD-tree over points on the unit sphere, answering "nearest N within R km"
+in logarithmic time
+"""
+
+import heapq
+import math
+from typing import Collection, Dict, List, Mapping, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+def to_unit_vectors(lat, lon) -> np.ndarray:
+    """(..., 3) unit vectors for latitudes and longitudes in degrees"""
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+def _chord_for_km(distance_km: float) -> float:
+    """Straight-line distance through the unit sphere for a great-circle distance"""
+    angle = min(distance_km / EARTH_RADIUS_KM, math.pi)
+    return 2.0 * math.sin(angle / 2.0)
+
+def _km_for_chord(chord: float) -> float:
+    return 2.0 * EARTH_RADIUS_KM * math.asin(min(chord / 2.0, 1.0))
+
+class GeoIndex:
+    """KD-tree over (lat, lon) points, addressed by their position in the input
+
+    Points are mapped to 3-D unit vectors, where straight-line (chord) distance
+    grows monotonically with great-circle distance, so an ordinary Euclidean
+    KD-tree gives exact great-circle nearest neighbours without special cases
+    at the poles or the antimeridian. Points with NaN coordinates are skipped.
+    """
+
+    def __init__(self, lat, lon, leaf_size: int = 16):
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        self._points = to_unit_vectors(lat, lon)
+        self._order = np.flatnonzero(np.isfinite(lat) & np.isfinite(lon))
+
+        # Per node: bounding box, children (-1 for leaves) and _order range
+        nodes = {'lows': [], 'highs': [], 'left': [], 'right': [], 'start': [], 'end': []}
+        if len(self._order):
+            self._build(0, len(self._order), nodes, leaf_size)
+        self._lows = np.array(nodes['lows'], dtype=np.float64).reshape(-1, 3)
+        self._highs = np.array(nodes['highs'], dtype=np.float64).reshape(-1, 3)
+        self._left = np.array(nodes['left'], dtype=np.int32)
+        self._right = np.array(nodes['right'], dtype=np.int32)
+        self._start = np.array(nodes['start'], dtype=np.int64)
+        self._end = np.array(nodes['end'], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _build(self, start: int, end: int, nodes: dict, leaf_size: int) -> int:
+        node = len(nodes['left'])
+        rows = self._order[start:end]
+        points = self._points[rows]
+        low, high = points.min(axis=0), points.max(axis=0)
+        nodes['lows'].append(low)
+        nodes['highs'].append(high)
+        nodes['left'].append(-1)
+        nodes['right'].append(-1)
+        nodes['start'].append(start)
+        nodes['end'].append(end)
+
+        if end - start > leaf_size:
+            # Split at the median of the widest dimension
+            dim = int(np.argmax(high - low))
+            mid = (end - start) // 2
+            self._order[start:end] = rows[np.argpartition(points[:, dim], mid)]
+            nodes['left'][node] = self._build(start, start + mid, nodes, leaf_size)
+            nodes['right'][node] = self._build(start + mid, end, nodes, leaf_size)
+        return node
+
+    _ARRAYS = ('points', 'order', 'lows', 'highs', 'left', 'right', 'start', 'end')
+
+    def to_arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        """The tree as named arrays, for saving in a snapshot"""
+        return {f'{prefix}.{name}': getattr(self, f'_{name}') for name in self._ARRAYS}
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, np.ndarray], prefix: str) -> 'GeoIndex':
+        """Rebuild an index from to_arrays() output without recomputing the tree"""
+        index = cls.__new__(cls)
+        for name in cls._ARRAYS:
+            setattr(index, f'_{name}', arrays[f'{prefix}.{name}'])
+        return index
+
+    def _box_distance(self, node: int, point: np.ndarray) -> float:
+        gap = np.maximum(np.maximum(self._lows[node] - point, point - self._highs[node]), 0.0)
+        return math.sqrt(float(gap @ gap))
+
+    def nearest(self, lat: float, lon: float, k: int, radius_km: float = None,
+                exclude: Collection[int] = ()) -> List[Tuple[int, float]]:
+        """Up to k (index, distance_km) pairs closest to (lat, lon), nearest first
+
+        Only points within radius_km are returned when it is given; indexes in
+        exclude are skipped.
+        """
+        if k <= 0 or not len(self._order):
+            return []
+        point = to_unit_vectors(lat, lon)
+        max_chord = math.inf if radius_km is None else _chord_for_km(radius_km)
+
+        best = []          # max-heap of (-chord, index) holding the k nearest so far
+        nodes = [(0.0, 0)]  # min-heap of (distance to bounding box, node)
+        while nodes:
+            bound, node = heapq.heappop(nodes)
+            if bound > max_chord or (len(best) == k and bound > -best[0][0]):
+                break
+
+            left = int(self._left[node])
+            if left != -1:
+                for child in (left, int(self._right[node])):
+                    heapq.heappush(nodes, (self._box_distance(child, point), child))
+                continue
+
+            rows = self._order[self._start[node]:self._end[node]]
+            chords = np.sqrt(((self._points[rows] - point) ** 2).sum(axis=1))
+            for row, chord in zip(rows.tolist(), chords.tolist()):
+                if chord > max_chord or row in exclude:
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (-chord, row))
+                elif chord < -best[0][0]:
+                    heapq.heapreplace(best, (-chord, row))
+
+        return [(row, _km_for_chord(-negative_chord))
+                for negative_chord, row in sorted(best, key=lambda entry: (-entry[0], entry[1]))]
@@ -4,11 +4,47 @@ Global Location Service for destination management
 Handles location search, autocomplete, and destination data
 """
 
+import functools
+import hashlib
+import json
+import math
+import os
+import time
 import streamlit as st
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Mapping, Tuple
 from dataclasses import dataclass
 
-@dataclass
+import numpy as np
+
+from .destination_profiles import (DESTINATION_PROFILES, FAMILY_TIER, get_destination_profile,
+                                   profiled_names)
+from .flight_estimator import FlightEstimate, FlightTimeEstimator
+from .location_store import LocationStore, StringTable
+from .regions import region_of
+from .scoring_rules import current_rules
+from .search_cache import LocationCache
+from .search_index import (FrozenPrefixTrie, PrefixTrie, TrieCursor, normalize_search_text,
+                           prune_prefix_keys, word_start_keys)
+from .snapshot import PackedStrings, Snapshot, SnapshotError, write_snapshot
+
+# Compiled gazetteer (store, indexes and tries) memory-mapped by the service,
+# kept in the user cache directory unless GAZETTEER_SNAPSHOT names a file.
+# Snapshots are rebuilt when their data sources, the code that compiles them
+# (_GAZETTEER_CODE) or the names, dtypes or dimensions of the arrays written by
+# to_arrays() change; bump GAZETTEER_SCHEMA_VERSION when only code elsewhere
+# changes what they mean.
+GAZETTEER_SNAPSHOT_PATH = os.getenv('GAZETTEER_SNAPSHOT') or os.path.join(
+    os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'gobabygo', 'gazetteer.snap'
+)
+GAZETTEER_SCHEMA_VERSION = 4
+_GAZETTEER_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'world_locations.py')
+_REGIONS_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'regions.py')
+_GAZETTEER_CODE = [os.path.join(os.path.dirname(os.path.abspath(__file__)), module)
+                   for module in ('location_service.py', 'location_store.py', 'search_index.py',
+                                  'geo_index.py', 'snapshot.py')]
+
+@dataclass(frozen=True)
 class Destination:
     name: str
     country: str
@@ -19,51 +55,77 @@ class Destination:
     source: str = 'database'
 
 class GlobalLocationService:
-    """Service for managing global location data and search functionality"""
+    """Service for managing global location data and search functionality
     
-    def __init__(self):
-        self._search_cache = {}
-        self.top_family_destinations = [
-            'Dubai', 'Singapore', 'Tokyo', 'London', 'Sydney', 
-            'Barcelona', 'Amsterdam', 'Copenhagen', 'Reykjavik', 'Paris'
-        ]
-        self.all_locations = self._load_all_locations()
+    Read-only after construction, so one instance can safely serve every
+    Streamlit session; use get_location_service() instead of building your own.
+    
+    fuzzy_max_edits caps the typos tolerated by autocomplete (further limited to
+    one per four typed characters) and fuzzy_time_budget caps, in seconds, the
+    time a single typo-tolerant lookup may take. Search results are kept in an
+    LRU cache of cache_size entries, each valid for cache_ttl seconds.
+    
+    Search data comes from the gazetteer snapshot at snapshot_path (compiled
+    first if missing or stale), so startup cost does not grow with the dataset
+    and processes share its pages. With snapshot_path=None, or if the snapshot
+    cannot be used, everything is built in memory from locations (a prebuilt
+    store, e.g. from gazetteer_import) or else from world_locations.py.
+    """
+    
+    def __init__(self, fuzzy_max_edits: int = 2, fuzzy_time_budget: float = 0.02,
+                 snapshot_path: Optional[str] = GAZETTEER_SNAPSHOT_PATH,
+                 locations: Optional[LocationStore] = None,
+                 cache_size: int = 4096, cache_ttl: Optional[float] = 3600):
+        self.fuzzy_max_edits = fuzzy_max_edits
+        self.fuzzy_time_budget = fuzzy_time_budget
+        self._search_cache = LocationCache(max_size=cache_size, ttl=cache_ttl)
+        
+        snapshot = None
+        if snapshot_path:
+            try:
+                snapshot = open_gazetteer_snapshot(snapshot_path)
+            except (SnapshotError, OSError) as e:
+                st.warning(f"Gazetteer snapshot unavailable, building in memory: {e}")
+        
+        if snapshot is not None:
+            self._load_from_arrays(snapshot)
+        else:
+            self.all_locations = locations if locations is not None else self._load_all_locations()
+            (self._autocomplete_trie, self._suggestion_trie,
+             self._suggestion_labels) = self._build_prefix_tries()
+        self.flight_estimator = FlightTimeEstimator(self.all_locations.lat, self.all_locations.lon)
+        self._precompute_profiles()
     
-    def _load_all_locations(self) -> List[Destination]:
-        """Load all locations for autocomplete from world_locations.py"""
+    @property
+    def top_family_destinations(self) -> Tuple[str, ...]:
+        """Names in the scoring rules' top destination tier"""
+        return current_rules().tier_names(FAMILY_TIER)
+    
+    def _precompute_profiles(self):
+        """Build the destination profiles for every country and profiled city in the gazetteer"""
+        store = self.all_locations
+        pairs = [('', country) for country in store.countries.strings]
+        for name in profiled_names(current_rules()):
+            row = store.row_by_name(name)
+            if row is not None:
+                pairs.append((name, store.countries[store.country_codes[row]]))
+        DESTINATION_PROFILES.precompute(pairs)
+    
+    def _load_all_locations(self) -> LocationStore:
+        """Load all locations for autocomplete from world_locations.py into a columnar store"""
         try:
-            import sys
-            import os
-            
-            # Add current directory to path
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            if current_dir not in sys.path:
-                sys.path.append(current_dir)
-            parent_dir = os.path.dirname(current_dir)
-            if parent_dir not in sys.path:
-                sys.path.append(parent_dir)
-            
-            from world_locations import WORLD_LOCATIONS, format_display_name
-            
-            locations = []
-            for name, data in WORLD_LOCATIONS.items():
-                dest = Destination(
-                    name=name,
-                    country=data['country'],
-                    admin=data.get('admin', ''),
-                    population=data['population'],
-                    type=data['type'],
-                    display=format_display_name(data, name),
-                    source='database'
-                )
-                locations.append(dest)
+            from .world_locations import LOCATION_ALIASES, location_records
             
-            return locations
+            return LocationStore(location_records(), aliases=LOCATION_ALIASES)
             
         except Exception as e:
             st.error(f"Could not load locations: {e}")
             # Fallback locations if world_locations.py is not available
-            return self._get_fallback_locations()
+            return LocationStore(
+                (dest.name, dest.country, dest.admin, dest.population, dest.type, dest.display, [],
+                 math.nan, math.nan)
+                for dest in self._get_fallback_locations()
+            )
     
     def _get_fallback_locations(self) -> List[Destination]:
         """Fallback location data if main database fails to load"""
@@ -81,6 +143,53 @@ class GlobalLocationService:
             Destination('Hyderabad', 'India', 'Telangana', 10500000, 'city', 'Hyderabad (HYD), India'),
         ]
     
+    def _build_prefix_tries(self) -> Tuple[PrefixTrie, PrefixTrie, StringTable]:
+        """Build population-ranked prefix tries for autocomplete and suggestions
+        
+        Suggestion trie items are codes into the returned table of city and
+        country names.
+        """
+        autocomplete_trie = PrefixTrie(top_k=20)
+        suggestion_trie = PrefixTrie(top_k=10)
+        suggestion_labels = StringTable()
+        
+        for i, dest in enumerate(self.all_locations):
+            # Any word of the name, aliases, country, admin region or display string
+            aliases = self.all_locations.alias_keys_of(i)
+            keys = set()
+            for field in (dest.name, *aliases, dest.country, dest.admin, dest.display):
+                keys |= word_start_keys(field)
+            for key in prune_prefix_keys(keys):
+                autocomplete_trie.insert(key, i, dest.population)
+            
+            # Whole city and country names for search suggestions; aliases
+            # suggest the name they stand for
+            for label in (dest.name, dest.country):
+                suggestion_trie.insert(normalize_search_text(label), suggestion_labels.intern(label),
+                                       dest.population)
+            for alias in aliases:
+                suggestion_trie.insert(alias, suggestion_labels.intern(dest.name), dest.population)
+        
+        autocomplete_trie.finalize()
+        suggestion_trie.finalize()
+        return autocomplete_trie, suggestion_trie, suggestion_labels
+    
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Store, indexes and tries as named arrays, for the gazetteer snapshot"""
+        return {
+            **self.all_locations.to_arrays('locations'),
+            **self._autocomplete_trie.to_arrays('autocomplete'),
+            **self._suggestion_trie.to_arrays('suggestions'),
+            **PackedStrings.pack(self._suggestion_labels.strings).to_arrays('suggestion_labels'),
+        }
+    
+    def _load_from_arrays(self, arrays: Mapping[str, np.ndarray]) -> None:
+        """Use to_arrays() output (normally the memory-mapped snapshot) as-is"""
+        self.all_locations = LocationStore.from_arrays(arrays, 'locations')
+        self._autocomplete_trie = FrozenPrefixTrie(arrays, 'autocomplete')
+        self._suggestion_trie = FrozenPrefixTrie(arrays, 'suggestions')
+        self._suggestion_labels = StringTable(PackedStrings.from_arrays(arrays, 'suggestion_labels'))
+    
     def search_destinations_autocomplete(self, searchterm: str) -> List[str]:
         """Autocomplete search function for streamlit-searchbox integration"""
         if not searchterm:
@@ -88,27 +197,57 @@ class GlobalLocationService:
             return [dest.display for dest in self.all_locations[:10] 
                    if dest.name in self.top_family_destinations]
         
-        searchterm_lower = searchterm.lower()
-        matches = []
+        query = normalize_search_text(searchterm)
+        displays = self._search_cache.get_or_compute(
+            ('autocomplete', query), lambda: tuple(self._autocomplete_displays(query))
+        )
+        return list(displays)
+    
+    def autocomplete_session(self) -> 'AutocompleteSession':
+        """Incremental autocomplete for one search box (keep one per box and user)"""
+        return AutocompleteSession(self)
+    
+    def _autocomplete_displays(self, query: str, matches: Optional[List[int]] = None) -> List[str]:
+        # Word-prefix matches, most populous first (unless the caller already has them)
+        if matches is None:
+            matches = self._autocomplete_trie.search(query, 20)
         
-        # Search through all locations
-        for dest in self.all_locations:
-            if (searchterm_lower in dest.name.lower() or 
-                searchterm_lower in dest.country.lower() or
-                searchterm_lower in dest.display.lower() or
-                searchterm_lower in dest.admin.lower()):
-                matches.append(dest.display)
-                if len(matches) >= 20:  # Limit results for performance
-                    break
+        # Too few exact prefix hits: add typo-tolerant matches, fewest edits first
+        if len(matches) < 20:
+            seen = set(matches)
+            for row, _ in self._fuzzy_matches(query, 20):
+                if row not in seen:
+                    seen.add(row)
+                    matches.append(row)
         
-        return matches
+        return [self.all_locations.display_of(i) for i in matches[:20]]
+    
+    def _fuzzy_matches(self, query: str, limit: int) -> List[Tuple[int, int]]:
+        """(row, edits) for destinations whose words start close to query"""
+        max_edits = self._fuzzy_edits(query)
+        if max_edits == 0:
+            return []
+        return self._autocomplete_trie.fuzzy_search(
+            query, max_edits=max_edits, limit=limit, time_budget=self.fuzzy_time_budget
+        )
+    
+    def _fuzzy_edits(self, query: str) -> int:
+        return min(self.fuzzy_max_edits, len(query) // 4)
     
     def get_destination_by_display(self, display_name: str) -> Optional[Destination]:
         """Get destination object by display name"""
-        for dest in self.all_locations:
-            if dest.display == display_name:
-                return dest
-        return None
+        row = self.all_locations.row_by_display(display_name)
+        return self.all_locations[row] if row is not None else None
+    
+    def get_destination_by_name(self, name: str) -> Optional[Destination]:
+        """Get destination object by name, ignoring case"""
+        row = self.all_locations.row_by_name(name)
+        return self.all_locations[row] if row is not None else None
+    
+    def get_destination_by_airport_code(self, code: str) -> Optional[Destination]:
+        """Get destination object by airport code (e.g. 'DXB' -> Dubai)"""
+        row = self.all_locations.row_by_airport_code(code)
+        return self.all_locations[row] if row is not None else None
     
     def search_destinations(self, query: str, limit: int = 8) -> List[Destination]:
         """Fallback search method for non-searchbox implementations"""
@@ -116,188 +255,229 @@ class GlobalLocationService:
             return [dest for dest in self.all_locations[:limit] 
                    if dest.name in self.top_family_destinations]
         
-        query_lower = query.lower()
-        results = []
-        
-        for dest in self.all_locations:
-            # Search in name, country, and admin fields
-            if (query_lower in dest.name.lower() or 
-                query_lower in dest.country.lower() or
-                query_lower in dest.admin.lower()):
-                results.append(dest)
-                if len(results) >= limit:
-                    break
-        
-        return results
+        # Search in name, country, and admin fields (precomputed folded keys,
+        # so 'sao paulo' matches 'São Paulo')
+        rows = self._search_cache.get_or_compute(
+            ('destinations', normalize_search_text(query), limit),
+            lambda: tuple(self.all_locations.rows_containing(query, limit))
+        )
+        return [self.all_locations[row] for row in rows]
+    
+    def cache_stats(self) -> Dict[str, float]:
+        """Hit/miss/eviction counters of the shared search cache"""
+        return self._search_cache.stats()
     
     def get_family_friendly_destinations(self, limit: int = 10) -> List[Destination]:
         """Get curated list of family-friendly destinations"""
-        family_destinations = []
-        
-        for dest in self.all_locations:
-            if dest.name in self.top_family_destinations:
-                family_destinations.append(dest)
-                if len(family_destinations) >= limit:
-                    break
-        
-        return family_destinations
+        # Name index lookups, kept in database order
+        rows = sorted(row for row in map(self.all_locations.row_by_name, self.top_family_destinations)
+                      if row is not None)
+        return [self.all_locations[row] for row in rows[:limit]]
     
     def get_destinations_by_region(self, region: str) -> List[Destination]:
-        """Get destinations filtered by geographical region"""
-        
-        region_mapping = {
-            'europe': ['United Kingdom', 'France', 'Germany', 'Spain', 'Italy', 'Netherlands', 
-                      'Sweden', 'Norway', 'Denmark', 'Finland', 'Iceland'],
-            'asia': ['Japan', 'China', 'India', 'Thailand', 'Singapore', 'Malaysia', 'Indonesia'],
-            'middle_east': ['United Arab Emirates', 'Qatar', 'Saudi Arabia', 'Oman', 'Bahrain'],
-            'north_america': ['United States', 'Canada'],
-            'oceania': ['Australia', 'New Zealand']
-        }
-        
-        region_countries = region_mapping.get(region.lower(), [])
-        
-        return [dest for dest in self.all_locations 
-                if dest.country in region_countries]
+        """Get destinations filtered by geographical region ('europe', 'Middle East', ...)"""
+        return self.all_locations.filter(region=region)
     
     def get_destination_insights(self, destination: Destination) -> Dict[str, str]:
         """Get additional insights about a destination for families"""
-        
-        insights = {
-            'family_rating': 'Standard',
-            'infrastructure': 'Good',
-            'language_barrier': 'Low',
-            'medical_facilities': 'Available',
-            'baby_facilities': 'Basic'
-        }
-        
-        # Family-friendly destinations get enhanced ratings
-        if destination.name in self.top_family_destinations:
-            insights.update({
-                'family_rating': 'Excellent',
-                'infrastructure': 'World-class',
-                'baby_facilities': 'Comprehensive'
-            })
-        
-        # Country-specific insights
-        english_speaking = ['United States', 'Canada', 'United Kingdom', 'Australia', 'New Zealand', 'Singapore']
-        if destination.country in english_speaking:
-            insights['language_barrier'] = 'None'
-        
-        developed_countries = ['Japan', 'Germany', 'France', 'Netherlands', 'Sweden', 'Norway', 'Denmark']
-        if destination.country in developed_countries:
-            insights.update({
-                'infrastructure': 'Excellent',
-                'medical_facilities': 'World-class'
-            })
-        
-        # UAE-specific (since it's a key destination)
-        if destination.country == 'United Arab Emirates':
-            insights.update({
-                'family_rating': 'Excellent',
-                'infrastructure': 'World-class',
-                'language_barrier': 'Low',
-                'medical_facilities': 'Excellent',
-                'baby_facilities': 'Comprehensive'
-            })
-        
-        return insights
+        return dict(get_destination_profile(destination).insights)
     
     def get_search_suggestions(self, partial_query: str) -> List[str]:
         """Get search suggestions for autocomplete"""
         if len(partial_query) < 2:
             return []
         
-        suggestions = set()
-        partial_lower = partial_query.lower()
-        
-        for dest in self.all_locations:
-            # Add city names that match
-            if dest.name.lower().startswith(partial_lower):
-                suggestions.add(dest.name)
-            
-            # Add country names that match
-            if dest.country.lower().startswith(partial_lower):
-                suggestions.add(dest.country)
-            
-            # Limit suggestions
-            if len(suggestions) >= 10:
-                break
-        
-        return sorted(list(suggestions))
+        # City and country names starting with the query, 10 most populous
+        suggestions = self._suggestion_trie.search(normalize_search_text(partial_query), 10)
+        return sorted(self._suggestion_labels[code] for code in suggestions)
     
     def validate_destination(self, destination_name: str) -> bool:
         """Validate if a destination exists in the database"""
-        destination_lower = destination_name.lower()
-        
-        for dest in self.all_locations:
-            if (dest.name.lower() == destination_lower or 
-                dest.display.lower() == destination_lower):
-                return True
+        return (self.all_locations.row_by_name(destination_name) is not None or
+                self.all_locations.row_by_display(destination_name, ignore_case=True) is not None)
+    
+    def estimate_flight(self, departure: Destination, destination: Destination) -> Optional[FlightEstimate]:
+        """Estimated distance, flight hours and layovers between two destinations
         
-        return False
+        Returns None if either end is unknown or has no coordinates.
+        """
+        origin = self.all_locations.row_by_display(departure.display)
+        target = self.all_locations.row_by_display(destination.display)
+        if origin is None or target is None:
+            return None
+        return self.flight_estimator.estimate(origin, target)
     
-    def get_nearby_destinations(self, destination: Destination, limit: int = 5) -> List[Destination]:
-        """Get destinations in the same country or region"""
+    def get_nearby_destinations(self, destination: Destination, limit: int = 5,
+                                radius_km: Optional[float] = None) -> List[Destination]:
+        """Get the destinations closest to destination, nearest first
         
-        # Same country destinations
-        same_country = [dest for dest in self.all_locations 
-                       if dest.country == destination.country and dest.name != destination.name]
+        Uses the spatial index when the destination has coordinates (optionally
+        only those within radius_km); otherwise falls back to same country/region.
+        """
+        row = self.all_locations.row_by_display(destination.display)
+        if row is not None and not math.isnan(self.all_locations.lat[row]):
+            nearby = self.all_locations.rows_near(
+                self.all_locations.lat[row], self.all_locations.lon[row], limit,
+                radius_km=radius_km, exclude=[row]
+            )
+            return [self.all_locations[nearby_row] for nearby_row, _ in nearby]
         
-        if len(same_country) >= limit:
-            return same_country[:limit]
+        # Same country destinations, then the rest of the region (partition slices)
+        same_country = [int(other) for other in self.all_locations.rows_in_country(destination.country)
+                        if self.all_locations.names[other] != destination.name]
         
-        # If not enough in same country, get from same region
-        region_map = {
-            'Europe': ['United Kingdom', 'France', 'Germany', 'Spain', 'Italy', 'Netherlands'],
-            'Asia': ['Japan', 'China', 'India', 'Thailand', 'Singapore', 'Malaysia'],
-            'Middle East': ['United Arab Emirates', 'Qatar', 'Saudi Arabia', 'Oman']
-        }
+        if len(same_country) < limit:
+            region = region_of(destination.country)
+            if region:
+                same_country += [int(other) for other in self.all_locations.rows_in_region(region)
+                                 if self.all_locations.countries[self.all_locations.country_codes[other]]
+                                 != destination.country][:limit - len(same_country)]
         
-        dest_region = None
-        for region, countries in region_map.items():
-            if destination.country in countries:
-                dest_region = region
-                break
+        return [self.all_locations[other] for other in same_country[:limit]]
+
+class AutocompleteSession:
+    """Autocomplete for one search box that reuses work between keystrokes
+    
+    Usable directly as st_searchbox's search_function. The trie position of the
+    last query is kept, so typing one more character walks one step further
+    instead of starting over; results are remembered per query, so backspace
+    returns the shorter prefix's results without searching. Once a query has
+    no exact or typo-tolerant matches at all, longer queries allowing the same
+    number of typos cannot match either and are answered without a search.
+    
+    Not thread-safe; each Streamlit session keeps its own.
+    """
+    
+    def __init__(self, service: GlobalLocationService, history: int = 64):
+        self._service = service
+        self._history = LocationCache(max_size=history)   # query -> (displays, cursor)
+        self._query = ''
+        self._cursor = service._autocomplete_trie.cursor()
+        self._dead_end = None   # (query, allowed edits) that matched nothing
+    
+    def __call__(self, searchterm: str) -> List[str]:
+        if not searchterm:
+            return self._service.search_destinations_autocomplete(searchterm)
         
-        if dest_region:
-            region_destinations = [dest for dest in self.all_locations 
-                                 if dest.country in region_map[dest_region] 
-                                 and dest.name != destination.name]
-            return (same_country + region_destinations)[:limit]
+        query = normalize_search_text(searchterm)
+        entry = self._history.get(query)
+        if entry is None:
+            entry = self._search(query)
+            self._history.set(query, entry)
+        displays, self._cursor = entry
+        self._query = query
+        return list(displays)
+    
+    def _search(self, query: str) -> Tuple[Tuple[str, ...], Optional[TrieCursor]]:
+        service = self._service
+        if self._dead_end is not None:
+            dead_query, dead_edits = self._dead_end
+            if query.startswith(dead_query) and service._fuzzy_edits(query) == dead_edits:
+                return (), None
+        
+        if not query.startswith(self._query):
+            cursor = service._autocomplete_trie.cursor(query)
+        elif self._cursor is not None:
+            cursor = self._cursor.extend(query[len(self._query):])
+        else:
+            cursor = None   # the shorter query already had no prefix matches
+        matches = cursor.top(20) if cursor is not None else []
         
-        return same_country[:limit]
+        displays = service._search_cache.get(('autocomplete', query))
+        if displays is None:
+            started = time.perf_counter()
+            displays = tuple(service._autocomplete_displays(query, matches))
+            service._search_cache.set(('autocomplete', query), displays)
+            # A typo-tolerant walk that ended within its time budget was exhaustive
+            if not displays and time.perf_counter() - started < service.fuzzy_time_budget:
+                self._dead_end = (query, service._fuzzy_edits(query))
+        return displays, cursor
+
+@functools.lru_cache(maxsize=1)
+def _gazetteer_layout() -> str:
+    """Hash of the name, dtype and dimensions of every array to_arrays() writes
+
+    Computed from a one-location service, since the layout does not depend on
+    the data.
+    """
+    sample = GlobalLocationService.__new__(GlobalLocationService)
+    sample.all_locations = LocationStore(
+        [('London', 'United Kingdom', 'England', 9000000, 'city', 'London (LHR), UK', ['LHR'],
+          51.5, -0.13)],
+        aliases={'London': ['Londres']}
+    )
+    (sample._autocomplete_trie, sample._suggestion_trie,
+     sample._suggestion_labels) = sample._build_prefix_tries()
+    layout = sorted((name, array.dtype.str, array.ndim) for name, array in sample.to_arrays().items())
+    return hashlib.sha256(json.dumps(layout).encode()).hexdigest()[:16]
 
-class LocationCache:
-    """Simple caching mechanism for location searches"""
-    
-    def __init__(self, max_size: int = 100):
-        self.cache = {}
-        self.max_size = max_size
-        self.access_order = []
-    
-    def get(self, key: str) -> Optional[List[Destination]]:
-        """Get cached search results"""
-        if key in self.cache:
-            # Move to end (most recently accessed)
-            self.access_order.remove(key)
-            self.access_order.append(key)
-            return self.cache[key]
-        return None
-    
-    def set(self, key: str, value: List[Destination]) -> None:
-        """Cache search results"""
-        if len(self.cache) >= self.max_size:
-            # Remove least recently used
-            oldest_key = self.access_order.pop(0)
-            del self.cache[oldest_key]
+@functools.lru_cache(maxsize=1)
+def _gazetteer_code_hash() -> str:
+    """Hash of the modules that compile and read snapshots (_GAZETTEER_CODE)"""
+    digest = hashlib.sha256()
+    for module in _GAZETTEER_CODE:
+        with open(module, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def _gazetteer_fingerprint(sources: List[str]) -> str:
+    """Identifies the source files (by size and mtime), compiling code and array
+    layout of a snapshot"""
+    parts = [str(GAZETTEER_SCHEMA_VERSION), _gazetteer_code_hash(), _gazetteer_layout()]
+    for source in sources:
+        try:
+            stat = os.stat(source)
+            parts.append(f"{source}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{source}:missing")
+    return '|'.join(parts)
+
+def build_gazetteer_snapshot(path: str = GAZETTEER_SNAPSHOT_PATH, **import_options) -> None:
+    """Compile the gazetteer, its indexes and display strings into a snapshot file
+    
+    import_options (geonames_path, airports_path, country_info_path,
+    admin1_path, min_population) add external data via
+    gazetteer_import.import_gazetteer; they are recorded in the snapshot so a
+    stale snapshot is rebuilt from the same sources.
+    """
+    locations = None
+    sources = [_GAZETTEER_SOURCE, _REGIONS_SOURCE]
+    if import_options:
+        from .gazetteer_import import import_gazetteer
         
-        self.cache[key] = value
-        self.access_order.append(key)
+        locations = import_gazetteer(**import_options)
+        sources += [os.path.abspath(value) for key, value in sorted(import_options.items())
+                    if key.endswith('_path') and value]
     
-    def clear(self) -> None:
-        """Clear cache"""
-        self.cache.clear()
-        self.access_order.clear()
+    service = GlobalLocationService(snapshot_path=None, locations=locations)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    write_snapshot(path, service.to_arrays(), meta={
+        'fingerprint': _gazetteer_fingerprint(sources), 'sources': sources,
+        'import_options': import_options, 'locations': len(service.all_locations),
+    })
+
+def open_gazetteer_snapshot(path: str = GAZETTEER_SNAPSHOT_PATH) -> Snapshot:
+    """Memory-map the gazetteer snapshot, rebuilding it first if missing or stale"""
+    import_options = {}
+    try:
+        snapshot = Snapshot(path)
+        sources = snapshot.meta.get('sources', [_GAZETTEER_SOURCE, _REGIONS_SOURCE])
+        if snapshot.meta.get('fingerprint') == _gazetteer_fingerprint(sources):
+            return snapshot
+        import_options = snapshot.meta.get('import_options', {})
+    except SnapshotError:
+        pass
+    build_gazetteer_snapshot(path, **import_options)
+    return Snapshot(path)
+
+@st.cache_resource(show_spinner=False)
+def get_location_service() -> GlobalLocationService:
+    """Process-wide location service shared by all Streamlit sessions
+    
+    Built once per server process (thread-safe via st.cache_resource) instead of
+    once per session in st.session_state.
+    """
+    return GlobalLocationService()
 
 # Utility functions for external use
 def format_destination_display(destination: Destination) -> str:
@@ -312,25 +492,4 @@ def format_destination_display(destination: Destination) -> str:
 
 def get_destination_emoji(destination: Destination) -> str:
     """Get appropriate emoji for destination"""
-    
-    country_emojis = {
-        'United Arab Emirates': '🇦🇪',
-        'United Kingdom': '🇬🇧',
-        'Japan': '🇯🇵',
-        'United States': '🇺🇸',
-        'Singapore': '🇸🇬',
-        'Thailand': '🇹🇭',
-        'France': '🇫🇷',
-        'Australia': '🇦🇺',
-        'Spain': '🇪🇸',
-        'Netherlands': '🇳🇱',
-        'India': '🇮🇳',
-        'Germany': '🇩🇪',
-        'Italy': '🇮🇹',
-        'Sweden': '🇸🇪',
-        'Norway': '🇳🇴',
-        'Denmark': '🇩🇰',
-        'Iceland': '🇮🇸'
-    }
-    
-    return country_emojis.get(destination.country, '🌍')
\ No newline at end of file
+    return get_destination_profile(destination).emoji
\ No newline at end of file
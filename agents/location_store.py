@@ -0,0 +1,413 @@
+# agents/location_store.py
+"""
+Columnar location store
+Keeps the gazetteer as interned string tables plus NumPy code and population
+columns, and hands out lightweight Destination-compatible views on demand.
+A store can be saved as named arrays and reopened from a memory-mapped snapshot.
+"""
+
+import heapq
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .geo_index import GeoIndex
+from .regions import normalize_region, region_of
+from .search_index import normalize_search_text
+from .snapshot import HashIndex, PackedStrings
+
+class StringTable:
+    """Interned strings addressed by dense integer codes
+
+    Built tables hold a list; tables loaded from a snapshot hold PackedStrings
+    and build their reverse lookup only when code_of is first used.
+    """
+
+    __slots__ = ('strings', '_codes')
+
+    def __init__(self, strings: Optional[Sequence[str]] = None):
+        self.strings = [] if strings is None else strings
+        self._codes = {} if strings is None else None
+
+    def _code_map(self) -> dict:
+        if self._codes is None:
+            self._codes = {value: code for code, value in enumerate(self.strings)}
+        return self._codes
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def __getitem__(self, code: int) -> str:
+        return self.strings[code]
+
+    def intern(self, value: str) -> int:
+        """Code for value, adding it to the table if new"""
+        codes = self._code_map()
+        code = codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            codes[value] = code
+            self.strings.append(value)
+        return code
+
+    def code_of(self, value: str) -> Optional[int]:
+        """Code for value, or None if it is not in the table"""
+        return self._code_map().get(value)
+
+class DestinationView:
+    """Read-only view of one store row with the same attributes as Destination"""
+
+    __slots__ = ('_store', 'row')
+
+    source = 'database'
+
+    def __init__(self, store: 'LocationStore', row: int):
+        self._store = store
+        self.row = row
+
+    @property
+    def name(self) -> str:
+        return self._store.names[self.row]
+
+    @property
+    def country(self) -> str:
+        return self._store.countries[self._store.country_codes[self.row]]
+
+    @property
+    def admin(self) -> str:
+        return self._store.admins[self._store.admin_codes[self.row]]
+
+    @property
+    def population(self) -> int:
+        return int(self._store.population[self.row])
+
+    @property
+    def type(self) -> str:
+        return self._store.types[self._store.type_codes[self.row]]
+
+    @property
+    def lat(self) -> float:
+        return float(self._store.lat[self.row])
+
+    @property
+    def lon(self) -> float:
+        return float(self._store.lon[self.row])
+
+    @property
+    def display(self) -> str:
+        return self._store.display_of(self.row)
+
+    @property
+    def airport_codes(self) -> Tuple[str, ...]:
+        return self._store.airport_codes_of(self.row)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DestinationView):
+            return NotImplemented
+        return self._store is other._store and self.row == other.row
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self.row))
+
+    def __repr__(self) -> str:
+        return (f"DestinationView(name={self.name!r}, country={self.country!r}, "
+                f"admin={self.admin!r}, population={self.population}, "
+                f"type={self.type!r}, display={self.display!r})")
+
+# Location types left out of the spatial index (countries carry their capital's
+# coordinates, so they would come up 0 km from it)
+SPATIAL_EXCLUDED_TYPES = ('country',)
+
+# (name, country, admin, population, type, display, airport_codes, lat, lon);
+# coordinates are NaN when unknown
+LocationRecord = Tuple[str, str, str, int, str, str, Sequence[str], float, float]
+
+class LocationStore:
+    """Struct-of-arrays gazetteer: one entry per row, columns instead of objects
+
+    Behaves like a read-only sequence of DestinationView, so it can stand in for
+    a list of Destination objects. Display, name and airport-code lookups go
+    through hash indexes built together with the columns, and names, countries
+    and admin regions carry accent- and case-folded search keys computed once.
+    Alternate names (aliases) resolve through the same name index and are
+    searched alongside names. Coordinates feed a KD-tree for proximity queries.
+    Rows are also partitioned by country and by region (see agents.regions), so
+    those filters are slice lookups rather than column scans.
+
+    to_arrays()/from_arrays() convert the whole store, indexes included, to and
+    from named arrays, so a snapshot-backed store opens without rebuilding.
+    """
+
+    _COLUMNS = ('country_codes', 'admin_codes', 'type_codes', 'population', 'lat', 'lon',
+                'display_tail_codes', 'display_tail_after_name',
+                'airport_code_ids', 'airport_code_offsets', 'alias_rows', 'region_codes',
+                'country_rows', 'country_offsets', 'region_rows', 'region_offsets')
+    _STRING_COLUMNS = ('names', 'name_keys', 'country_keys', 'admin_keys', 'alias_keys')
+    _TABLES = ('countries', 'admins', 'types', 'display_tails', 'airport_codes', 'regions')
+    _INDEXES = ('display_index', 'name_index', 'airport_code_index')
+
+    def __init__(self, records: Iterable[LocationRecord],
+                 aliases: Optional[Mapping[str, Iterable[str]]] = None):
+        self.names = []
+        name_keys = []
+        self.countries = StringTable()
+        self.admins = StringTable()
+        self.types = StringTable()
+        # Displays are mostly name + a shared ' (CODE), Country' tail, so only
+        # the tail is interned; displays not starting with the name are stored whole
+        self.display_tails = StringTable()
+        self.airport_codes = StringTable()
+
+        # Exact-match indexes: casefolded display, folded name and upper-case code -> row
+        self._display_index = {}
+        self._name_index = {}
+        self._airport_code_index = {}
+
+        country_codes, admin_codes, type_codes, population, lat, lon = [], [], [], [], [], []
+        tail_codes, tail_after_name = [], []
+        airport_code_ids, airport_code_offsets = [], [0]
+        for row, (name, country, admin, pop, loc_type, display, codes,
+                  latitude, longitude) in enumerate(records):
+            name_key = normalize_search_text(name)
+            self.names.append(name)
+            name_keys.append(name_key)
+            starts_with_name = display.startswith(name)
+            tail_codes.append(self.display_tails.intern(display[len(name):] if starts_with_name else display))
+            tail_after_name.append(starts_with_name)
+            country_codes.append(self.countries.intern(country))
+            admin_codes.append(self.admins.intern(admin or ''))
+            type_codes.append(self.types.intern(loc_type))
+            population.append(pop)
+            lat.append(latitude)
+            lon.append(longitude)
+            for code in codes:
+                airport_code_ids.append(self.airport_codes.intern(code))
+            airport_code_offsets.append(len(airport_code_ids))
+
+            self._display_index.setdefault(display.casefold(), row)
+            # Shared names resolve to the most populous entry
+            best = self._name_index.get(name_key)
+            if best is None or pop > population[best]:
+                self._name_index[name_key] = row
+            for code in codes:
+                self._airport_code_index.setdefault(code.upper(), row)
+
+        self.country_codes = np.array(country_codes, dtype=np.int32)
+        self.admin_codes = np.array(admin_codes, dtype=np.int32)
+        self.type_codes = np.array(type_codes, dtype=np.int16)
+        self.population = np.array(population, dtype=np.int64)
+        self.lat = np.array(lat, dtype=np.float64)
+        self.lon = np.array(lon, dtype=np.float64)
+        self.display_tail_codes = np.array(tail_codes, dtype=np.int32)
+        self.display_tail_after_name = np.array(tail_after_name, dtype=bool)
+        self.airport_code_ids = np.array(airport_code_ids, dtype=np.int32)
+        self.airport_code_offsets = np.array(airport_code_offsets, dtype=np.int64)
+        # Packed so substring scans run over one blob (see rows_containing)
+        self.name_keys = PackedStrings.pack(name_keys)
+
+        # Folded search keys for the interned tables, indexed by code
+        self.country_keys = [normalize_search_text(country) for country in self.countries.strings]
+        self.admin_keys = [normalize_search_text(admin) for admin in self.admins.strings]
+
+        # Aliases by canonical name -> folded alias keys sorted by row, plus name
+        # index entries (real names take precedence over aliases)
+        alias_entries = []
+        for name, alternates in (aliases or {}).items():
+            row = self._name_index.get(normalize_search_text(name))
+            if row is None:
+                continue
+            for alias in alternates:
+                alias_key = normalize_search_text(alias)
+                alias_entries.append((row, alias_key))
+                self._name_index.setdefault(alias_key, row)
+        alias_entries.sort()
+        self.alias_rows = np.array([row for row, _ in alias_entries], dtype=np.int32)
+        self.alias_keys = PackedStrings.pack(alias_key for _, alias_key in alias_entries)
+
+        # Region of each row through its country; '' when the country is not in the table
+        self.regions = StringTable()
+        country_regions = np.array([self.regions.intern(region_of(country))
+                                    for country in self.countries.strings], dtype=np.int16)
+        self.region_codes = country_regions[self.country_codes]
+        self.country_rows, self.country_offsets = self._partition(self.country_codes, len(self.countries))
+        self.region_rows, self.region_offsets = self._partition(self.region_codes, len(self.regions))
+
+        not_spatial = self.filter_mask(type=SPATIAL_EXCLUDED_TYPES)
+        self.geo_index = GeoIndex(np.where(not_spatial, np.nan, self.lat), self.lon)
+
+    @staticmethod
+    def _partition(codes: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows grouped by code (store order within a group) and per-code offsets"""
+        rows = np.argsort(codes, kind='stable').astype(np.int32)
+        offsets = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=size), out=offsets[1:])
+        return rows, offsets
+
+    def to_arrays(self, prefix: str = 'locations') -> Dict[str, np.ndarray]:
+        """The store as named arrays, for saving in a snapshot"""
+        arrays = {f'{prefix}.{name}': getattr(self, name) for name in self._COLUMNS}
+        for name in self._STRING_COLUMNS:
+            arrays.update(PackedStrings.pack(getattr(self, name)).to_arrays(f'{prefix}.{name}'))
+        for name in self._TABLES:
+            arrays.update(PackedStrings.pack(getattr(self, name).strings).to_arrays(f'{prefix}.{name}'))
+        for name in self._INDEXES:
+            index = getattr(self, f'_{name}')
+            if not isinstance(index, HashIndex):
+                index = HashIndex.build(index)
+            arrays.update(index.to_arrays(f'{prefix}.{name}'))
+        arrays.update(self.geo_index.to_arrays(f'{prefix}.geo'))
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, np.ndarray], prefix: str = 'locations') -> 'LocationStore':
+        """Open a store from to_arrays() output (e.g. a Snapshot) without copying"""
+        store = cls.__new__(cls)
+        for name in cls._COLUMNS:
+            setattr(store, name, arrays[f'{prefix}.{name}'])
+        for name in cls._STRING_COLUMNS:
+            setattr(store, name, PackedStrings.from_arrays(arrays, f'{prefix}.{name}'))
+        for name in cls._TABLES:
+            setattr(store, name, StringTable(PackedStrings.from_arrays(arrays, f'{prefix}.{name}')))
+        for name in cls._INDEXES:
+            setattr(store, f'_{name}', HashIndex.from_arrays(arrays, f'{prefix}.{name}'))
+        store.geo_index = GeoIndex.from_arrays(arrays, f'{prefix}.geo')
+        return store
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [DestinationView(self, row) for row in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('location index out of range')
+        return DestinationView(self, index)
+
+    def display_of(self, row: int) -> str:
+        """Display string for a row, rebuilt from its name and interned tail"""
+        tail = self.display_tails[self.display_tail_codes[row]]
+        return self.names[row] + tail if self.display_tail_after_name[row] else tail
+
+    def airport_codes_of(self, row: int) -> Tuple[str, ...]:
+        """Airport codes for a row, primary code first"""
+        start, end = self.airport_code_offsets[row], self.airport_code_offsets[row + 1]
+        return tuple(self.airport_codes[code] for code in self.airport_code_ids[start:end])
+
+    def row_by_display(self, display: str, ignore_case: bool = False) -> Optional[int]:
+        """Row whose display string equals display (optionally ignoring case), in O(1)"""
+        row = self._display_index.get(display.casefold())
+        if row is not None and (ignore_case or self.display_of(row) == display):
+            return row
+        return None
+
+    def row_by_name(self, name: str) -> Optional[int]:
+        """Most populous row with this name or alias, ignoring case and accents, in O(1)"""
+        return self._name_index.get(normalize_search_text(name))
+
+    def alias_keys_of(self, row: int) -> List[str]:
+        """Folded aliases of a row"""
+        start, end = np.searchsorted(self.alias_rows, [row, row + 1])
+        return [self.alias_keys[i] for i in range(start, end)]
+
+    def row_by_airport_code(self, code: str) -> Optional[int]:
+        """First row served by this IATA/ICAO code, ignoring case, in O(1)"""
+        return self._airport_code_index.get(code.strip().upper())
+
+    def rows_containing(self, text: str, limit: Optional[int] = None) -> List[int]:
+        """Rows whose name, alias, country or admin region contains text, ignoring
+        case and accents, in store order
+
+        Countries and regions are tested once per distinct value against the
+        precomputed keys; names are scanned lazily, so the scan stops at limit.
+        """
+        key = normalize_search_text(text)
+        mask = np.isin(self.country_codes,
+                       [code for code, field in enumerate(self.country_keys) if key in field])
+        mask |= np.isin(self.admin_codes,
+                        [code for code, field in enumerate(self.admin_keys) if key in field])
+        field_rows = map(int, np.flatnonzero(mask))
+        alias_rows = (int(self.alias_rows[i]) for i in self.alias_keys.find_all(key))
+        rows = []
+        for row in heapq.merge(field_rows, self.name_keys.find_all(key), alias_rows):
+            if rows and rows[-1] == row:
+                continue
+            rows.append(row)
+            if len(rows) == limit:
+                break
+        return rows
+
+    def rows_near(self, lat: float, lon: float, limit: int, radius_km: Optional[float] = None,
+                  exclude: Sequence[int] = ()) -> List[Tuple[int, float]]:
+        """(row, distance_km) for the nearest rows with coordinates, nearest first
+        (never rows of SPATIAL_EXCLUDED_TYPES)"""
+        return self.geo_index.nearest(lat, lon, limit, radius_km=radius_km, exclude=set(exclude))
+
+    def __iter__(self) -> Iterator[DestinationView]:
+        for row in range(len(self)):
+            yield DestinationView(self, row)
+
+    def _codes_for(self, table: StringTable, values: Union[str, Iterable[str]]) -> List[int]:
+        if isinstance(values, str):
+            values = [values]
+        return [code for code in map(table.code_of, values) if code is not None]
+
+    def _region_codes_for(self, regions: Union[str, Iterable[str]]) -> List[int]:
+        if isinstance(regions, str):
+            regions = [regions]
+        return self._codes_for(self.regions, filter(None, map(normalize_region, regions)))
+
+    def _partition_mask(self, rows: np.ndarray, offsets: np.ndarray, codes: List[int]) -> np.ndarray:
+        mask = np.zeros(len(self), dtype=bool)
+        for code in codes:
+            mask[rows[offsets[code]:offsets[code + 1]]] = True
+        return mask
+
+    def rows_in_country(self, country: str) -> np.ndarray:
+        """Row ids in a country, in store order, as a slice of the country partition"""
+        code = self.countries.code_of(country)
+        if code is None:
+            return self.country_rows[:0]
+        return self.country_rows[self.country_offsets[code]:self.country_offsets[code + 1]]
+
+    def rows_in_region(self, region: str) -> np.ndarray:
+        """Row ids in a region ('Europe', 'middle_east', ...), in store order"""
+        codes = self._region_codes_for(region)
+        if not codes:
+            return self.region_rows[:0]
+        code = codes[0]
+        return self.region_rows[self.region_offsets[code]:self.region_offsets[code + 1]]
+
+    def filter_mask(self, country: Union[str, Iterable[str], None] = None,
+                    region: Union[str, Iterable[str], None] = None,
+                    type: Union[str, Iterable[str], None] = None,
+                    min_population: Optional[int] = None,
+                    max_population: Optional[int] = None) -> np.ndarray:
+        """Boolean row mask for every given filter
+
+        Country and region filters mark their partition slices; the masks are
+        intersected with each other and with the vectorized column tests.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if country is not None:
+            mask &= self._partition_mask(self.country_rows, self.country_offsets,
+                                         self._codes_for(self.countries, country))
+        if region is not None:
+            mask &= self._partition_mask(self.region_rows, self.region_offsets,
+                                         self._region_codes_for(region))
+        if type is not None:
+            mask &= np.isin(self.type_codes, self._codes_for(self.types, type))
+        if min_population is not None:
+            mask &= self.population >= min_population
+        if max_population is not None:
+            mask &= self.population <= max_population
+        return mask
+
+    def filter_rows(self, **filters) -> np.ndarray:
+        """Row ids matching every filter_mask(**filters) filter, in store order"""
+        return np.flatnonzero(self.filter_mask(**filters))
+
+    def filter(self, **filters) -> List[DestinationView]:
+        """Views for the rows matching filter_rows(**filters), in store order"""
+        return [DestinationView(self, int(row)) for row in self.filter_rows(**filters)]
@@ -0,0 +1,82 @@
+# agents/regions.py
+"""
+World regions
+The single country -> region table used for region filters and region-based
+fallbacks, covering the curated gazetteer and GeoNames country names
+"""
+
+from typing import Optional
+
+EUROPE = 'Europe'
+MIDDLE_EAST = 'Middle East'
+ASIA = 'Asia'
+AFRICA = 'Africa'
+NORTH_AMERICA = 'North America'
+SOUTH_AMERICA = 'South America'
+OCEANIA = 'Oceania'
+
+REGIONS = (EUROPE, MIDDLE_EAST, ASIA, AFRICA, NORTH_AMERICA, SOUTH_AMERICA, OCEANIA)
+
+# Central America and the Caribbean count as North America; the Caucasus and
+# Turkey as Europe, which is how travellers from the region usually book them
+_REGION_COUNTRIES = {
+    EUROPE: [
+        'Albania', 'Andorra', 'Armenia', 'Austria', 'Azerbaijan', 'Belarus', 'Belgium',
+        'Bosnia and Herzegovina', 'Bulgaria', 'Croatia', 'Cyprus', 'Czech Republic', 'Czechia',
+        'Denmark', 'Estonia', 'Faroe Islands', 'Finland', 'France', 'Georgia', 'Germany',
+        'Gibraltar', 'Greece', 'Hungary', 'Iceland', 'Ireland', 'Italy', 'Kosovo', 'Latvia',
+        'Liechtenstein', 'Lithuania', 'Luxembourg', 'Malta', 'Moldova', 'Monaco', 'Montenegro',
+        'Netherlands', 'North Macedonia', 'Norway', 'Poland', 'Portugal', 'Romania', 'Russia',
+        'San Marino', 'Serbia', 'Slovakia', 'Slovenia', 'Spain', 'Sweden', 'Switzerland',
+        'Turkey', 'Türkiye', 'Ukraine', 'United Kingdom', 'Vatican City',
+    ],
+    MIDDLE_EAST: [
+        'Bahrain', 'Iran', 'Iraq', 'Israel', 'Jordan', 'Kuwait', 'Lebanon', 'Oman',
+        'Palestine', 'Qatar', 'Saudi Arabia', 'Syria', 'United Arab Emirates', 'UAE', 'Yemen',
+    ],
+    ASIA: [
+        'Afghanistan', 'Bangladesh', 'Bhutan', 'Brunei', 'Cambodia', 'China', 'Hong Kong',
+        'India', 'Indonesia', 'Japan', 'Kazakhstan', 'Kyrgyzstan', 'Laos', 'Macao', 'Malaysia',
+        'Maldives', 'Mongolia', 'Myanmar', 'Nepal', 'North Korea', 'Pakistan', 'Philippines',
+        'Singapore', 'South Korea', 'Sri Lanka', 'Taiwan', 'Tajikistan', 'Thailand',
+        'Timor Leste', 'Turkmenistan', 'Uzbekistan', 'Vietnam',
+    ],
+    AFRICA: [
+        'Algeria', 'Angola', 'Benin', 'Botswana', 'Burkina Faso', 'Burundi', 'Cabo Verde',
+        'Cameroon', 'Central African Republic', 'Chad', 'Comoros', 'DR Congo', 'Djibouti',
+        'Egypt', 'Equatorial Guinea', 'Eritrea', 'Eswatini', 'Ethiopia', 'Gabon', 'Gambia',
+        'Ghana', 'Guinea', 'Guinea-Bissau', 'Ivory Coast', 'Kenya', 'Lesotho', 'Liberia',
+        'Libya', 'Madagascar', 'Malawi', 'Mali', 'Mauritania', 'Mauritius', 'Morocco',
+        'Mozambique', 'Namibia', 'Niger', 'Nigeria', 'Republic of the Congo', 'Rwanda',
+        'Senegal', 'Seychelles', 'Sierra Leone', 'Somalia', 'South Africa', 'South Sudan',
+        'Sudan', 'Tanzania', 'Togo', 'Tunisia', 'Uganda', 'Zambia', 'Zimbabwe',
+    ],
+    NORTH_AMERICA: [
+        'Antigua and Barbuda', 'Bahamas', 'Barbados', 'Belize', 'Bermuda', 'Canada',
+        'Costa Rica', 'Cuba', 'Dominica', 'Dominican Republic', 'El Salvador', 'Greenland',
+        'Grenada', 'Guatemala', 'Haiti', 'Honduras', 'Jamaica', 'Mexico', 'Nicaragua',
+        'Panama', 'Puerto Rico', 'Saint Kitts and Nevis', 'Saint Lucia',
+        'Saint Vincent and the Grenadines', 'Trinidad and Tobago', 'United States', 'USA',
+    ],
+    SOUTH_AMERICA: [
+        'Argentina', 'Bolivia', 'Brazil', 'Chile', 'Colombia', 'Ecuador', 'Guyana',
+        'Paraguay', 'Peru', 'Suriname', 'Uruguay', 'Venezuela',
+    ],
+    OCEANIA: [
+        'Australia', 'Fiji', 'French Polynesia', 'Kiribati', 'Marshall Islands', 'Micronesia',
+        'Nauru', 'New Caledonia', 'New Zealand', 'Palau', 'Papua New Guinea', 'Samoa',
+        'Solomon Islands', 'Tonga', 'Tuvalu', 'Vanuatu',
+    ],
+}
+
+COUNTRY_REGIONS = {country: region for region, countries in _REGION_COUNTRIES.items()
+                   for country in countries}
+
+def region_of(country: str) -> str:
+    """Region of a country, or '' if it is not in the table"""
+    return COUNTRY_REGIONS.get(country, '')
+
+def normalize_region(region: str) -> Optional[str]:
+    """Canonical region name for 'Middle East', 'middle_east', 'MIDDLE EAST', ...; None if unknown"""
+    wanted = ' '.join(region.replace('_', ' ').split()).casefold()
+    return next((name for name in REGIONS if name.casefold() == wanted), None)
@@ -0,0 +1,320 @@
+# agents/scoring_engine.py
+"""
+Trip scoring engine
+Buckets a trip's inputs once, against the comfort and stress rules together, and
+reads both scores, both factor breakdowns and the comfort insights from one
+precomputed cube, for single trips and for batches
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .scoring_rules import DESTINATION_TIERS, SHARED_RULES, STANDARD_TIER, RuleSet, shared_buckets
+from .search_cache import LocationCache
+
+# Cube axes, in calculate_travel_comfort parameter order, and the axes each factor depends on
+CUBE_AXES = (
+    'baby_age', 'flight_hours', 'layovers', 'departure_time', 'has_partner',
+    'special_needs', 'pumping_needed', 'first_international', 'parent_experience',
+    'destination', 'trip_duration'
+)
+FACTOR_AXES = {
+    'baby_age_comfort': ('baby_age',),
+    'flight_comfort': ('flight_hours', 'layovers'),
+    'logistical_ease': ('pumping_needed', 'first_international'),
+    'timing_convenience': ('departure_time',),
+    'support_system': ('has_partner',),
+    'medical_preparedness': ('special_needs',),
+    'experience_advantage': ('parent_experience',),
+    'destination_friendliness': ('destination',),
+    'trip_duration_comfort': ('trip_duration',)
+}
+STRESS_FACTOR_AXES = {
+    'baby_age': ('baby_age',),
+    'flight_duration': ('flight_hours',),
+    'layovers': ('layovers',),
+    'timing': ('departure_time',),
+    'support': ('has_partner',),
+    'medical': ('special_needs',),
+    'logistics': ('pumping_needed', 'first_international'),
+    'experience': ('parent_experience',),
+    'destination': ('destination',),
+    'trip_length': ('trip_duration',)
+}
+DEFAULT_TRIP_DURATION = 5
+# Comfort insights of recently scored cube cells, per cube
+INSIGHTS_CACHE_SIZE = 4096
+
+def _lookup(values: np.ndarray, table: Mapping[str, int], default: int) -> np.ndarray:
+    """table[value] for each string value, default for values not in table"""
+    if values.dtype == object:
+        values = values.astype(str)
+    result = np.full(values.shape, default, dtype=np.intp)
+    for label, value in table.items():
+        result[values == label] = value
+    return result
+
+def _stress_methods(stress: RuleSet) -> Dict[str, Callable]:
+    """Stress factor functions of their STRESS_FACTOR_AXES inputs (destination as a tier)"""
+    return {
+        'baby_age': stress['baby_age'].value,
+        'flight_duration': stress['flight_hours'].value,
+        'layovers': stress['layovers'].value,
+        'timing': stress['departure_time'].value,
+        'support': stress['has_partner'].value,
+        'medical': stress['special_needs'].value,
+        'logistics': lambda pumping_needed, first_international: stress['logistics'].value(
+            pumping_needed=pumping_needed, first_international=first_international),
+        'experience': stress['parent_experience'].value,
+        'destination': stress['destination_tier'].__getitem__,
+        'trip_length': stress['trip_duration'].value
+    }
+
+def trip_columns(trips: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+    """Broadcast trip columns named as CUBE_AXES (trip_duration defaults to 5)"""
+    columns = {name: trips[name] for name in CUBE_AXES if name in trips}
+    columns.setdefault('trip_duration', DEFAULT_TRIP_DURATION)
+    missing = set(CUBE_AXES) - columns.keys()
+    if missing:
+        raise KeyError(f"missing trip columns: {sorted(missing)}")
+    names = list(columns)
+    return dict(zip(names, np.broadcast_arrays(*(np.asarray(columns[name]) for name in names))))
+
+class ScoringCube:
+    """Every comfort and stress factor and score, precomputed for one set of rules and weights
+
+    Each input is reduced to one bucket index (CUBE_AXES) whose buckets split
+    both the comfort and the stress buckets of that input (shared_buckets).
+    Factor tables hold each factor's value for every combination of its own
+    axes, filled at one representative input per bucket: comfort factors by the
+    calculator's _calculate_* methods, stress factors by the stress rules. The
+    score cubes hold the comfort and stress score for every combination of all
+    axes (about 700k int8 cells each with the default rules). Totals are summed
+    in factor order, as the scalar formulas did, so the cube reproduces them
+    exactly. Cubes are shared between calculators (TravelComfortCalculator.
+    scoring_cube), and each keeps the comfort insights of recently used cells.
+    """
+
+    def __init__(self, calculator):
+        self.rules = calculator.rules
+        comfort, stress = self.rules.comfort, self.rules.stress
+        self.buckets = {axis: shared_buckets(comfort[axis], stress[axis]) for axis in SHARED_RULES}
+        bools = [False, True]
+        representatives = {axis: rule.representatives() for axis, rule in self.buckets.items()}
+        representatives.update({
+            'has_partner': bools,
+            'special_needs': bools,
+            'pumping_needed': bools,
+            'first_international': bools,
+            'destination': list(DESTINATION_TIERS),
+        })
+        comfort_methods = {
+            'baby_age_comfort': calculator._calculate_baby_age_comfort,
+            'flight_comfort': calculator._calculate_flight_comfort,
+            'logistical_ease': calculator._calculate_logistics_comfort,
+            'timing_convenience': calculator._calculate_timing_comfort,
+            'support_system': calculator._calculate_support_comfort,
+            'medical_preparedness': calculator._calculate_medical_comfort,
+            'experience_advantage': calculator._calculate_experience_comfort,
+            'destination_friendliness': calculator._calculate_tier_comfort,
+            'trip_duration_comfort': calculator._calculate_duration_comfort
+        }
+        self.shape = tuple(len(representatives[axis]) for axis in CUBE_AXES)
+
+        self.factor_tables, comfort_total = self._tables(FACTOR_AXES, comfort_methods, representatives)
+        self.stress_tables, stress_total = self._tables(STRESS_FACTOR_AXES, _stress_methods(stress),
+                                                        representatives)
+        max_possible = sum(calculator.factor_weights.values())
+        scale = comfort.score_scale or comfort.score_max
+        self.scores = np.clip(np.rint((comfort_total / max_possible) * scale),
+                              comfort.score_min, comfort.score_max).astype(np.int8)
+        self.stress_scores = np.clip(stress_total, stress.score_min, stress.score_max)
+        if np.issubdtype(self.stress_scores.dtype, np.integer):
+            self.stress_scores = self.stress_scores.astype(np.int8)
+
+        self._factor_axes = {factor: tuple(CUBE_AXES.index(axis) for axis in axes)
+                             for factor, axes in FACTOR_AXES.items()}
+        self._stress_axes = {factor: tuple(CUBE_AXES.index(axis) for axis in axes)
+                             for factor, axes in STRESS_FACTOR_AXES.items()}
+        # Nested lists for single lookups, which index faster than arrays
+        self._factor_lists = [(factor, self.factor_tables[factor].tolist(), axes)
+                              for factor, axes in self._factor_axes.items()]
+        self._stress_lists = [(factor, self.stress_tables[factor].tolist(), axes)
+                              for factor, axes in self._stress_axes.items()]
+        self._bucket = {axis: rule.bucket for axis, rule in self.buckets.items()}
+        self._tier_index = {tier: i for i, tier in enumerate(DESTINATION_TIERS)}
+        # Only names listed in the rules have their own friendliness tier
+        self._name_tier_index = {name: self._tier_index[tier]
+                                 for name, tier in self.rules.destination_tiers.items()}
+        self._insights = LocationCache(max_size=INSIGHTS_CACHE_SIZE)
+
+    def _tables(self, factor_axes: Mapping[str, Tuple[str, ...]], methods: Mapping[str, Callable],
+                representatives: Mapping[str, list]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Factor tables over their own axes, and their total over the full cube"""
+        tables = {}
+        for factor, axes in factor_axes.items():
+            table = np.array([methods[factor](*inputs) for inputs in
+                              itertools.product(*(representatives[axis] for axis in axes))])
+            tables[factor] = table.reshape([len(representatives[axis]) for axis in axes])
+        total = np.zeros(self.shape, dtype=np.result_type(*tables.values()))
+        for factor, axes in factor_axes.items():
+            # Broadcast the table over the full cube along its own axes
+            total += tables[factor].reshape([self.shape[i] if axis in axes else 1
+                                             for i, axis in enumerate(CUBE_AXES)])
+        return tables, total
+
+    def index_of(self, baby_age, flight_hours, layovers, departure_time, has_partner, special_needs,
+                 pumping_needed, first_international, parent_experience, destination,
+                 trip_duration) -> Tuple[int, ...]:
+        """Cube index of one trip (same arguments as calculate_travel_comfort)"""
+        bucket = self._bucket
+        return (
+            bucket['baby_age'](baby_age),
+            bucket['flight_hours'](flight_hours),
+            bucket['layovers'](layovers),
+            bucket['departure_time'](departure_time),
+            int(bool(has_partner)),
+            int(bool(special_needs)),
+            int(bool(pumping_needed)),
+            int(bool(first_international)),
+            bucket['parent_experience'](parent_experience),
+            self._tier_index[self.rules.destination_tier(destination.name)],
+            bucket['trip_duration'](trip_duration),
+        )
+
+    def indexes_of(self, columns: Mapping[str, np.ndarray]) -> Tuple[np.ndarray, ...]:
+        """Cube index arrays for broadcast trip columns (from trip_columns)"""
+        buckets = self.buckets
+        destinations = columns['destination']
+        if destinations.dtype == object:
+            destinations = np.array([getattr(dest, 'name', dest) for dest in destinations.ravel()],
+                                    dtype=object).reshape(destinations.shape)
+        return (
+            buckets['baby_age'].buckets(columns['baby_age']),
+            buckets['flight_hours'].buckets(columns['flight_hours']),
+            buckets['layovers'].buckets(columns['layovers']),
+            buckets['departure_time'].buckets(columns['departure_time']),
+            columns['has_partner'].astype(bool).astype(np.intp),
+            columns['special_needs'].astype(bool).astype(np.intp),
+            columns['pumping_needed'].astype(bool).astype(np.intp),
+            columns['first_international'].astype(bool).astype(np.intp),
+            buckets['parent_experience'].buckets(columns['parent_experience']),
+            _lookup(destinations, self._name_tier_index, self._tier_index[STANDARD_TIER]),
+            buckets['trip_duration'].buckets(columns['trip_duration']),
+        )
+
+    def score_at(self, index: Tuple[int, ...]) -> int:
+        """Comfort score at one cube index"""
+        return self.scores.item(index)
+
+    def stress_score_at(self, index: Tuple[int, ...]):
+        """Stress score at one cube index"""
+        return self.stress_scores.item(index)
+
+    @staticmethod
+    def _factors_at(factor_lists: list, index: Tuple[int, ...]) -> Dict[str, Any]:
+        factors = {}
+        for factor, value, axes in factor_lists:
+            for axis in axes:
+                value = value[index[axis]]
+            factors[factor] = value
+        return factors
+
+    def factors_at(self, index: Tuple[int, ...]) -> Dict[str, float]:
+        """Comfort factor values at one cube index"""
+        return self._factors_at(self._factor_lists, index)
+
+    def stress_factors_at(self, index: Tuple[int, ...]) -> Dict[str, Any]:
+        """Stress factor values at one cube index"""
+        return self._factors_at(self._stress_lists, index)
+
+    def factor_columns(self, indexes: Tuple[np.ndarray, ...]) -> Dict[str, np.ndarray]:
+        """Comfort factor arrays for cube index arrays (from indexes_of)"""
+        return {factor: self.factor_tables[factor][tuple(indexes[axis] for axis in axes)]
+                for factor, axes in self._factor_axes.items()}
+
+    def stress_factor_columns(self, indexes: Tuple[np.ndarray, ...]) -> Dict[str, np.ndarray]:
+        """Stress factor arrays for cube index arrays (from indexes_of)"""
+        return {factor: self.stress_tables[factor][tuple(indexes[axis] for axis in axes)]
+                for factor, axes in self._stress_axes.items()}
+
+    def insights_at(self, index: Tuple[int, ...], calculator) -> Dict[str, Any]:
+        """Comfort insights at one cube index (shared between callers, do not modify)"""
+        return self._insights.get_or_compute(index, lambda: calculator.get_comfort_insights(
+            self.score_at(index), self.factors_at(index)))
+
+@dataclass
+class TripScore:
+    """Comfort and stress results for one trip"""
+    comfort_score: int
+    comfort_factors: Dict[str, float]
+    stress_score: int
+    stress_factors: Dict[str, Any]
+    insights: Dict[str, Any]
+
+@dataclass
+class TripScores:
+    """Comfort and stress results for a batch of trips, one array entry per trip"""
+    comfort_scores: np.ndarray
+    comfort_factors: Dict[str, np.ndarray]
+    stress_scores: np.ndarray
+    stress_factors: Dict[str, np.ndarray]
+    # Comfort insights per trip (shared dicts), if requested
+    insights: Optional[List[Dict[str, Any]]] = None
+
+class TripScoringEngine:
+    """Comfort and stress scoring in one pass over a TravelComfortCalculator's scoring cube
+
+    Inputs are bucketed once per trip and both scores, both factor breakdowns
+    and the comfort insights are read at that one cube index.
+    """
+
+    def __init__(self, calculator):
+        self.calculator = calculator
+
+    def score_trip(
+        self, baby_age: int, flight_hours: float, layovers: int, departure_time: str,
+        has_partner: bool, special_needs: bool, pumping_needed: bool,
+        first_international: bool, parent_experience: str, destination,
+        departure_location=None, trip_duration: int = DEFAULT_TRIP_DURATION
+    ) -> TripScore:
+        """Scores, factors and insights for one trip (same arguments as calculate_travel_comfort)"""
+        cube = self.calculator.scoring_cube()
+        index = cube.index_of(baby_age, flight_hours, layovers, departure_time, has_partner,
+                              special_needs, pumping_needed, first_international,
+                              parent_experience, destination, trip_duration)
+        insights = cube.insights_at(index, self.calculator)
+        return TripScore(
+            comfort_score=cube.score_at(index),
+            comfort_factors=cube.factors_at(index),
+            stress_score=cube.stress_score_at(index),
+            stress_factors=cube.stress_factors_at(index),
+            insights={key: list(value) if isinstance(value, list) else value
+                      for key, value in insights.items()},
+        )
+
+    def score_trips(self, trips: Mapping[str, Any], insights: bool = False) -> TripScores:
+        """Scores and factors for many trips from columnar inputs
+
+        trips is as for TravelComfortCalculator.calculate_travel_comfort_batch.
+        With insights=True, comfort insights are also built, once per distinct
+        cube cell among the trips.
+        """
+        cube = self.calculator.scoring_cube()
+        indexes = cube.indexes_of(trip_columns(trips))
+        scores = TripScores(
+            comfort_scores=cube.scores[indexes].astype(np.int64),
+            comfort_factors=cube.factor_columns(indexes),
+            stress_scores=cube.stress_scores[indexes].astype(np.result_type(cube.stress_scores, np.int64)),
+            stress_factors=cube.stress_factor_columns(indexes),
+        )
+        if insights:
+            cells, inverse = np.unique(np.ravel_multi_index(indexes, cube.shape).ravel(),
+                                       return_inverse=True)
+            cell_insights = [cube.insights_at(index, self.calculator)
+                             for index in zip(*(axis.tolist() for axis in np.unravel_index(cells, cube.shape)))]
+            scores.insights = [cell_insights[i] for i in inverse.tolist()]
+        return scores
@@ -0,0 +1,364 @@
+# agents/scoring_rules.py
+"""
+Scoring rules
+Loads the comfort/stress thresholds, values, weights and destination tiers from
+scoring_rules.json, compiles them into lookup tables (tuples for single trips,
+NumPy arrays for batches) and hot-swaps them when the file changes
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+SCORING_RULES_PATH = os.getenv(
+    'SCORING_RULES', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scoring_rules.json')
+)
+# How often current_rules() looks at the file's modification time, in seconds
+RULES_CHECK_INTERVAL = 2.0
+
+DESTINATION_TIERS = ('excellent', 'good', 'standard')
+STANDARD_TIER = 'standard'
+
+class RulesError(ValueError):
+    """The rules file is missing, not valid JSON or not a valid rule set"""
+
+@dataclass(frozen=True)
+class BucketRule:
+    """Value by upper-inclusive edges: edges[i-1] < x <= edges[i] -> values[i]
+
+    Values above the last edge, and NaN, take the last value.
+    """
+    edges: Tuple[float, ...]
+    values: Tuple[float, ...]
+    edge_array: np.ndarray
+    value_array: np.ndarray
+
+    def bucket(self, x) -> int:
+        for bucket, edge in enumerate(self.edges):
+            if x <= edge:
+                return bucket
+        return len(self.edges)
+
+    def buckets(self, x: np.ndarray) -> np.ndarray:
+        return np.digitize(x, self.edge_array, right=True)
+
+    def value(self, x):
+        return self.values[self.bucket(x)]
+
+    def representatives(self) -> list:
+        """One input inside each bucket"""
+        return list(self.edges) + [self.edges[-1] + 1]
+
+@dataclass(frozen=True)
+class CountRule:
+    """Value by count: values[n] for n = 0, 1, ...; other numbers take the last value"""
+    values: Tuple[float, ...]
+    value_array: np.ndarray
+
+    def bucket(self, n) -> int:
+        for count in range(len(self.values) - 1):
+            if n == count:
+                return count
+        return len(self.values) - 1
+
+    def buckets(self, n: np.ndarray) -> np.ndarray:
+        result = np.full(np.shape(n), len(self.values) - 1, dtype=np.intp)
+        for count in range(len(self.values) - 1):
+            result[n == count] = count
+        return result
+
+    def value(self, n):
+        return self.values[self.bucket(n)]
+
+    def representatives(self) -> list:
+        return list(range(len(self.values)))
+
+@dataclass(frozen=True)
+class LabelRule:
+    """Value by label, with a default for unknown labels (bucket len(labels))"""
+    labels: Tuple[str, ...]
+    values: Tuple[float, ...]
+    default: float
+    index: Mapping[str, int]
+
+    def bucket(self, label) -> int:
+        return self.index.get(label, len(self.labels))
+
+    def buckets(self, labels: np.ndarray) -> np.ndarray:
+        if labels.dtype == object:
+            labels = labels.astype(str)
+        result = np.full(labels.shape, len(self.labels), dtype=np.intp)
+        for bucket, label in enumerate(self.labels):
+            result[labels == label] = bucket
+        return result
+
+    def value(self, label):
+        bucket = self.bucket(label)
+        return self.values[bucket] if bucket < len(self.values) else self.default
+
+    def representatives(self) -> list:
+        # '' stands for any label not in the rule
+        return list(self.labels) + ['']
+
+@dataclass(frozen=True)
+class FlagRule:
+    """Value for a true/false input"""
+    true: float
+    false: float
+
+    def value(self, flag):
+        return self.true if flag else self.false
+
+@dataclass(frozen=True)
+class AdjustmentRule:
+    """base + adjustments for each true flag, optionally floored"""
+    base: float
+    adjustments: Tuple[Tuple[str, float], ...]
+    floor: Optional[float]
+
+    def value(self, **flags):
+        total = self.base
+        for name, adjustment in self.adjustments:
+            if flags[name]:
+                total += adjustment
+        return total if self.floor is None else max(self.floor, total)
+
+@dataclass(frozen=True)
+class RuleSet:
+    """Compiled rules for one score (comfort or stress)"""
+    rules: Mapping[str, Any]
+    weights: Mapping[str, float]
+    score_min: int
+    score_max: int
+    score_scale: Optional[float]
+
+    def __getitem__(self, name: str):
+        return self.rules[name]
+
+@dataclass(frozen=True)
+class ScoringRules:
+    """One immutable, compiled version of the rules file"""
+    comfort: RuleSet
+    stress: RuleSet
+    # Profiled name -> tier; names not listed are STANDARD_TIER
+    destination_tiers: Mapping[str, str]
+    fingerprint: str
+
+    def destination_tier(self, name: str) -> str:
+        return self.destination_tiers.get(name, STANDARD_TIER)
+
+    def tier_names(self, tier: str) -> Tuple[str, ...]:
+        return tuple(name for name, name_tier in self.destination_tiers.items() if name_tier == tier)
+
+def _numbers(values: Sequence, what: str) -> Tuple[float, ...]:
+    if not values or not all(isinstance(value, (int, float)) and not isinstance(value, bool)
+                             for value in values):
+        raise RulesError(f"{what}: expected a non-empty list of numbers")
+    return tuple(values)
+
+def _compile_rule(name: str, spec: Any):
+    if not isinstance(spec, Mapping):
+        raise RulesError(f"{name}: expected an object")
+    if 'edges' in spec:
+        edges = _numbers(spec['edges'], f"{name}.edges")
+        values = _numbers(spec.get('values'), f"{name}.values")
+        if list(edges) != sorted(edges) or len(values) != len(edges) + 1:
+            raise RulesError(f"{name}: edges must be ascending, with one more value than edges")
+        return BucketRule(edges, values, np.array(edges), np.array(values))
+    if 'counts' in spec:
+        values = _numbers(spec['counts'], f"{name}.counts")
+        return CountRule(values, np.array(values))
+    if 'labels' in spec:
+        labels = tuple(spec['labels'])
+        values = _numbers([spec['labels'][label] for label in labels], f"{name}.labels")
+        default = _numbers([spec.get('default')], f"{name}.default")[0]
+        return LabelRule(labels, values, default,
+                         MappingProxyType({label: i for i, label in enumerate(labels)}))
+    if 'true' in spec:
+        true, false = _numbers([spec['true'], spec.get('false')], name)
+        return FlagRule(true, false)
+    if 'base' in spec:
+        adjustments = tuple((flag, _numbers([value], f"{name}.{flag}")[0])
+                            for flag, value in spec.items() if flag not in ('base', 'floor'))
+        floor = spec.get('floor')
+        return AdjustmentRule(_numbers([spec['base']], f"{name}.base")[0], adjustments,
+                              None if floor is None else _numbers([floor], f"{name}.floor")[0])
+    if set(spec) == set(DESTINATION_TIERS):
+        return MappingProxyType(dict(zip(DESTINATION_TIERS, _numbers(
+            [spec[tier] for tier in DESTINATION_TIERS], name))))
+    # Plain mapping of named numbers (e.g. flight_blend)
+    return MappingProxyType(dict(zip(spec, _numbers(list(spec.values()), name))))
+
+def _compile_rule_set(name: str, spec: Any, required: Sequence[str]) -> RuleSet:
+    if not isinstance(spec, Mapping):
+        raise RulesError(f"{name}: expected an object")
+    missing = [rule for rule in required if rule not in spec]
+    if missing:
+        raise RulesError(f"{name}: missing rules {missing}")
+    score = spec.get('score', {})
+    rules = {rule: _compile_rule(f"{name}.{rule}", value)
+             for rule, value in spec.items() if rule not in ('score', 'weights')}
+    weights = spec.get('weights', {})
+    if weights:
+        _numbers(list(weights.values()), f"{name}.weights")
+    return RuleSet(MappingProxyType(rules), MappingProxyType(dict(weights)),
+                   int(score.get('min', 1)), int(score.get('max', 10)), score.get('scale'))
+
+def shared_buckets(*rules):
+    """A rule of the same kind whose buckets split every given rule's buckets, so
+    one bucket index determines each of their values; its values are the bucket numbers"""
+    first = rules[0]
+    if isinstance(first, BucketRule):
+        edges = tuple(sorted(set().union(*(rule.edges for rule in rules))))
+        values = tuple(range(len(edges) + 1))
+        return BucketRule(edges, values, np.array(edges), np.array(values))
+    if isinstance(first, CountRule):
+        values = tuple(range(max(len(rule.values) for rule in rules)))
+        return CountRule(values, np.array(values))
+    if isinstance(first, LabelRule):
+        labels = tuple(dict.fromkeys(label for rule in rules for label in rule.labels))
+        return LabelRule(labels, tuple(range(len(labels))), len(labels),
+                         MappingProxyType({label: i for i, label in enumerate(labels)}))
+    raise RulesError(f"cannot share buckets between {type(first).__name__} rules")
+
+COMFORT_FACTORS = (
+    'baby_age_comfort', 'flight_comfort', 'logistical_ease', 'timing_convenience', 'support_system',
+    'medical_preparedness', 'experience_advantage', 'destination_friendliness', 'trip_duration_comfort'
+)
+# Rule kinds allowed for each input; inputs bucketed by both comfort and stress
+# (the first six) must use the same kind in both sections
+_RULE_KINDS = {
+    'baby_age': (BucketRule, CountRule, LabelRule),
+    'flight_hours': (BucketRule, CountRule, LabelRule),
+    'layovers': (BucketRule, CountRule, LabelRule),
+    'departure_time': (BucketRule, CountRule, LabelRule),
+    'parent_experience': (BucketRule, CountRule, LabelRule),
+    'trip_duration': (BucketRule, CountRule, LabelRule),
+    'has_partner': (FlagRule,),
+    'special_needs': (FlagRule,),
+    'logistics': (AdjustmentRule,),
+    'destination_tier': (MappingProxyType,),
+}
+SHARED_RULES = tuple(_RULE_KINDS)[:6]
+_FACTOR_RULES = tuple(_RULE_KINDS)
+LOGISTICS_FLAGS = ('pumping_needed', 'first_international')
+
+def _check_kinds(comfort: RuleSet, stress: RuleSet) -> None:
+    for section, rule_set in (('comfort', comfort), ('stress', stress)):
+        for name, kinds in _RULE_KINDS.items():
+            rule = rule_set[name]
+            if not isinstance(rule, kinds) or (name == 'destination_tier' and set(rule) != set(DESTINATION_TIERS)):
+                raise RulesError(f"{section}.{name}: not a valid rule for this input")
+            if name == 'logistics' and {flag for flag, _ in rule.adjustments} != set(LOGISTICS_FLAGS):
+                raise RulesError(f"{section}.logistics: expected adjustments for {list(LOGISTICS_FLAGS)}")
+    for name in SHARED_RULES:
+        if type(comfort[name]) is not type(stress[name]):
+            raise RulesError(f"{name}: comfort and stress rules must be the same kind")
+
+def compile_rules(spec: Mapping[str, Any]) -> ScoringRules:
+    """Validate a parsed rules file and compile it into a ScoringRules"""
+    if not isinstance(spec, Mapping):
+        raise RulesError("rules file: expected an object")
+    tier_lists = spec.get('destination_tiers', {})
+    unknown = set(tier_lists) - set(DESTINATION_TIERS)
+    if unknown:
+        raise RulesError(f"destination_tiers: unknown tiers {sorted(unknown)}")
+    tiers = {}
+    for tier in DESTINATION_TIERS:
+        for name in tier_lists.get(tier, []):
+            # A name listed in several tiers keeps the best one
+            tiers.setdefault(name, tier)
+    comfort = _compile_rule_set('comfort', spec.get('comfort'), _FACTOR_RULES + ('flight_blend', 'weights'))
+    missing = set(COMFORT_FACTORS) - set(comfort.weights)
+    if missing:
+        raise RulesError(f"comfort.weights: missing {sorted(missing)}")
+    stress = _compile_rule_set('stress', spec.get('stress'), _FACTOR_RULES)
+    _check_kinds(comfort, stress)
+    fingerprint = hashlib.sha1(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+    return ScoringRules(comfort, stress, MappingProxyType(tiers), fingerprint)
+
+def load_rules(path: str = SCORING_RULES_PATH) -> ScoringRules:
+    """Read and compile a rules file"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            spec = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RulesError(f"cannot read scoring rules {path}: {e}") from e
+    return compile_rules(spec)
+
+class RulesWatcher:
+    """Current compiled rules for a file, reloaded when the file changes
+
+    current() checks the file's modification time at most every check_interval
+    seconds of clock (time.monotonic unless given). A changed file is compiled
+    in full before it replaces the previous rules in a single assignment, so
+    callers always see one complete version; if the new file does not compile,
+    the previous rules stay in use and the error is kept in last_error.
+    """
+
+    def __init__(self, path: str = SCORING_RULES_PATH, check_interval: float = RULES_CHECK_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic):
+        self.path = path
+        self.check_interval = check_interval
+        self.clock = clock
+        self.last_error: Optional[RulesError] = None
+        self._lock = threading.Lock()
+        self._stamp = self._file_stamp()
+        self._rules = load_rules(path)
+        self._next_check = self.clock() + check_interval
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def current(self) -> ScoringRules:
+        if self.clock() >= self._next_check:
+            self.reload_if_changed()
+        return self._rules
+
+    def reload_if_changed(self) -> bool:
+        """Reload now if the file changed since the last load; True if new rules are in use"""
+        with self._lock:
+            self._next_check = self.clock() + self.check_interval
+            stamp = self._file_stamp()
+            if stamp is None or stamp == self._stamp:
+                return False
+            self._stamp = stamp
+            try:
+                rules = load_rules(self.path)
+            except RulesError as e:
+                self.last_error = e
+                return False
+            self.last_error = None
+            if rules.fingerprint == self._rules.fingerprint:
+                return False
+            self._rules = rules
+            return True
+
+_watcher: Optional[RulesWatcher] = None
+_watcher_lock = threading.Lock()
+
+def current_rules() -> ScoringRules:
+    """The rules from SCORING_RULES_PATH, loaded on first use and kept up to date"""
+    global _watcher
+    if _watcher is None:
+        with _watcher_lock:
+            if _watcher is None:
+                _watcher = RulesWatcher()
+    return _watcher.current()
+
+def rules_status() -> Dict[str, Any]:
+    """Path, fingerprint and last reload error of the rules in use"""
+    rules = current_rules()
+    return {'path': _watcher.path, 'fingerprint': rules.fingerprint,
+            'last_error': str(_watcher.last_error) if _watcher.last_error else None}
@@ -0,0 +1,88 @@
+# agents/search_cache.py
+"""
+Search result caching
+Thread-safe LRU cache with optional time-to-live and hit/miss/eviction counters,
+safe to share between Streamlit sessions
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class LocationCache:
+    """LRU cache for location searches with O(1) get/set
+
+    Holds at most max_size entries; entries older than ttl seconds (if given)
+    are treated as misses and dropped; their age is measured with clock
+    (time.monotonic unless given). All operations take a lock, so one instance
+    can serve every session.
+    """
+
+    def __init__(self, max_size: int = 100, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.cache = OrderedDict()   # key -> (expiry time or None, value), oldest first
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get cached search results, or None if absent or expired"""
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, value = entry
+            if expires is not None and self.clock() >= expires:
+                del self.cache[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            # Mark as most recently used
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache search results, evicting the least recently used entry if full"""
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            elif len(self.cache) >= self.max_size:
+                self.cache.popitem(last=False)
+                self.evictions += 1
+            self.cache[key] = (expires, value)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Cached value for key, computing and storing it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Clear cache (counters are kept)"""
+        with self._lock:
+            self.cache.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Size, hit/miss/eviction/expiration counts and hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.cache), 'max_size': self.max_size,
+                'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
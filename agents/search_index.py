@@ -0,0 +1,335 @@
+# agents/search_index.py
+"""
+Search index structures for location lookup
+Compressed prefix trie (radix tree) with population-ranked top-k results per node
+and typo-tolerant (edit distance) prefix search, plus a read-only array-backed
+form for snapshots
+"""
+
+import heapq
+import time
+import unicodedata
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+
+from .snapshot import PackedStrings
+
+def normalize_search_text(text: str) -> str:
+    """Strip accents, casefold and collapse whitespace so keys and queries compare consistently
+
+    'São  Paulo' -> 'sao paulo', 'Zürich' -> 'zurich', 'Straße' -> 'strasse'
+    """
+    if not text.isascii():
+        text = ''.join(char for char in unicodedata.normalize('NFKD', text)
+                       if not unicodedata.combining(char))
+    return ' '.join(text.casefold().split())
+
+def word_start_keys(text: str) -> Set[str]:
+    """Every suffix of the normalized text that starts at a word boundary
+
+    'London (LHR), United Kingdom' -> 'london (lhr), united kingdom',
+    'lhr), united kingdom', 'united kingdom', 'kingdom'
+    """
+    text = normalize_search_text(text)
+    return {text[i:] for i in range(len(text))
+            if text[i].isalnum() and (i == 0 or not text[i - 1].isalnum())}
+
+def prune_prefix_keys(keys: Set[str]) -> List[str]:
+    """Drop keys that are a prefix of another key; they cannot add prefix matches"""
+    ordered = sorted(keys)
+    return [key for key, following in zip(ordered, ordered[1:] + [''])
+            if not following.startswith(key)]
+
+class _TrieNode:
+    __slots__ = ('edges', 'items', 'top')
+
+    def __init__(self):
+        self.edges = {}      # first character -> (edge label, child node)
+        self.items = set()   # items whose key ends exactly at this node
+        self.top = []        # best items in this subtree, highest score first
+
+class PrefixTrie:
+    """Radix tree mapping string keys to items, ranked by score
+
+    Every node caches the top_k items of its subtree, so a prefix lookup costs
+    O(len(prefix) + k) regardless of how many keys share the prefix.
+    """
+
+    def __init__(self, top_k: int = 20):
+        self.top_k = top_k
+        self._root = _TrieNode()
+        self._rank_keys = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._rank_keys)
+
+    def insert(self, key: str, item: Hashable, score: float = 0) -> None:
+        """Add key -> item; an item inserted under several keys keeps its best score"""
+        rank_key = self._rank_keys.get(item)
+        if rank_key is None:
+            self._rank_keys[item] = (-score, len(self._rank_keys))
+        elif -score < rank_key[0]:
+            self._rank_keys[item] = (-score, rank_key[1])
+
+        node = self._root
+        while key:
+            edge = node.edges.get(key[0])
+            if edge is None:
+                child = _TrieNode()
+                node.edges[key[0]] = (key, child)
+                node = child
+                break
+
+            label, child = edge
+            if key.startswith(label):
+                node = child
+                key = key[len(label):]
+                continue
+
+            # Split the edge so the shared part becomes its own node
+            common = 1
+            while common < len(key) and label[common] == key[common]:
+                common += 1
+            middle = _TrieNode()
+            middle.edges[label[common]] = (label[common:], child)
+            node.edges[key[0]] = (label[:common], middle)
+            node = middle
+            key = key[common:]
+
+        node.items.add(item)
+        self._dirty = True
+
+    def finalize(self) -> None:
+        """Compute the per-node top-k caches (done lazily on first search otherwise)"""
+        self._rank_subtree(self._root)
+        self._dirty = False
+
+    def _rank_subtree(self, node: _TrieNode) -> None:
+        candidates = set(node.items)
+        for _, child in node.edges.values():
+            self._rank_subtree(child)
+            candidates.update(child.top)
+        node.top = heapq.nsmallest(self.top_k, candidates, key=self._rank_keys.__getitem__)
+
+    # Node access; FrozenPrefixTrie overrides these to read from arrays
+
+    def _root_node(self):
+        return self._root
+
+    def _edge(self, node, char: str) -> Optional[tuple]:
+        return node.edges.get(char)
+
+    def _edges(self, node) -> Iterable[tuple]:
+        return node.edges.values()
+
+    def _top(self, node) -> List[Hashable]:
+        return node.top
+
+    def _rank(self, item: Hashable):
+        return self._rank_keys[item]
+
+    def cursor(self, prefix: str = '') -> Optional['TrieCursor']:
+        """Position reached by prefix, or None if no key starts with it"""
+        if self._dirty:
+            self.finalize()
+        return TrieCursor(self, '', self._root_node(), '').extend(prefix)
+
+    def search(self, prefix: str, limit: Optional[int] = None) -> List[Hashable]:
+        """Best-scoring items whose key starts with prefix (at most top_k)"""
+        cursor = self.cursor(prefix)
+        return cursor.top(limit) if cursor is not None else []
+
+    def fuzzy_search(self, query: str, max_edits: int = 2, prefix_length: int = 1,
+                     limit: Optional[int] = None,
+                     time_budget: Optional[float] = None) -> List[Tuple[Hashable, int]]:
+        """Items whose key starts with a string within max_edits of query
+
+        Edits are insertions, deletions, substitutions and adjacent transpositions
+        (optimal string alignment). The first prefix_length characters must match
+        exactly, which keeps the walk small. The trie is walked with one DP row
+        per character and branches that can no longer come within max_edits are
+        pruned; matching subtrees contribute their cached top-k items. The walk
+        stops after time_budget seconds, returning what was found so far.
+
+        Returns (item, edits) pairs, fewest edits first, then highest score.
+        """
+        if self._dirty:
+            self.finalize()
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+
+        # Follow the exact-match prefix; it may end partway along an edge
+        head, query = query[:prefix_length], query[prefix_length:]
+        label, node = '', self._root_node()
+        while head:
+            edge = self._edge(node, head[0])
+            if edge is None:
+                return []
+            label, node = edge
+            if head.startswith(label):
+                head, label = head[len(label):], ''
+            elif label.startswith(head):
+                head, label = '', label[len(head):]
+            else:
+                return []
+
+        # Stack of (edge label still to read, node it leads to, DP row,
+        # previous DP row, previous character)
+        stack = [(label, node, list(range(len(query) + 1)), None, '')]
+        best = {}
+        while stack:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            label, node, row, prev_row, prev_char = stack.pop()
+
+            edits = row[-1]
+            for char in label:
+                new_row = [row[0] + 1]
+                for j in range(1, len(query) + 1):
+                    cost = 0 if query[j - 1] == char else 1
+                    value = min(new_row[j - 1] + 1, row[j] + 1, row[j - 1] + cost)
+                    if (prev_row is not None and j > 1 and query[j - 1] == prev_char
+                            and query[j - 2] == char):
+                        value = min(value, prev_row[j - 2] + 1)
+                    new_row.append(value)
+                prev_row, row, prev_char = row, new_row, char
+                edits = min(edits, row[-1])
+                if min(row) > max_edits:
+                    break
+            else:
+                stack.extend((child_label, child, row, prev_row, prev_char)
+                             for child_label, child in self._edges(node))
+
+            if edits <= max_edits:
+                # A prefix of every key below this node is close enough to the query
+                for item in self._top(node):
+                    if edits < best.get(item, max_edits + 1):
+                        best[item] = edits
+
+        ranked = sorted(best, key=lambda item: (best[item], self._rank(item)))
+        return [(item, best[item]) for item in ranked[:limit]]
+
+    def to_arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        """The finalized trie as named arrays, for saving in a snapshot
+
+        Items must be non-negative ints (e.g. row ids). Nodes are numbered
+        breadth-first; each node's edges are sorted by first character.
+        """
+        if self._dirty:
+            self.finalize()
+
+        edge_start, edge_first, edge_child, labels = [0], [], [], []
+        top_start, top_items = [0], []
+        queue = deque([self._root])
+        while queue:
+            node = queue.popleft()
+            for first, (label, child) in sorted(node.edges.items()):
+                edge_first.append(ord(first))
+                labels.append(label)
+                edge_child.append(len(edge_child) + 1)
+                queue.append(child)
+            edge_start.append(len(edge_first))
+            top_items.extend(node.top)
+            top_start.append(len(top_items))
+
+        ranked = sorted(self._rank_keys, key=self._rank_keys.__getitem__)
+        item_rank = np.full(max(ranked, default=-1) + 1, -1, dtype=np.int64)
+        item_rank[ranked] = np.arange(len(ranked))
+        return {
+            f'{prefix}.top_k': np.array([self.top_k], dtype=np.int64),
+            f'{prefix}.edge_start': np.array(edge_start, dtype=np.int64),
+            f'{prefix}.edge_first': np.array(edge_first, dtype=np.int32),
+            f'{prefix}.edge_child': np.array(edge_child, dtype=np.int32),
+            f'{prefix}.top_start': np.array(top_start, dtype=np.int64),
+            f'{prefix}.top_items': np.array(top_items, dtype=np.int64),
+            f'{prefix}.item_rank': item_rank,
+            **PackedStrings.pack(labels).to_arrays(f'{prefix}.labels'),
+        }
+
+class TrieCursor:
+    """A prefix's position in a PrefixTrie: the node it leads to, plus the part
+    of that node's edge label the prefix has not consumed yet
+
+    extend() walks only the added characters, so narrowing a search one
+    keystroke at a time costs O(1) trie steps per keystroke.
+    """
+
+    __slots__ = ('trie', 'prefix', 'node', 'pending')
+
+    def __init__(self, trie: PrefixTrie, prefix: str, node, pending: str):
+        self.trie = trie
+        self.prefix = prefix
+        self.node = node
+        self.pending = pending
+
+    def extend(self, chars: str) -> Optional['TrieCursor']:
+        """Cursor for prefix + chars, or None if no key continues that way"""
+        node, pending, rest = self.node, self.pending, chars
+        while rest:
+            if not pending:
+                edge = self.trie._edge(node, rest[0])
+                if edge is None:
+                    return None
+                pending, node = edge
+            if rest.startswith(pending):
+                rest, pending = rest[len(pending):], ''
+            elif pending.startswith(rest):
+                rest, pending = '', pending[len(rest):]
+            else:
+                return None
+        return TrieCursor(self.trie, self.prefix + chars, node, pending)
+
+    def top(self, limit: Optional[int] = None) -> List[Hashable]:
+        """Best-scoring items whose key starts with the prefix (at most top_k)"""
+        return self.trie._top(self.node)[:limit]
+
+class FrozenPrefixTrie(PrefixTrie):
+    """Read-only PrefixTrie backed by PrefixTrie.to_arrays() output
+
+    Searches walk the arrays directly, so a trie loaded from a memory-mapped
+    snapshot is usable immediately, without rebuilding any nodes.
+    """
+
+    def __init__(self, arrays: Mapping[str, np.ndarray], prefix: str):
+        self.top_k = int(arrays[f'{prefix}.top_k'][0])
+        self._dirty = False
+        self._edge_start = arrays[f'{prefix}.edge_start']
+        self._edge_first = arrays[f'{prefix}.edge_first']
+        self._edge_child = arrays[f'{prefix}.edge_child']
+        self._labels = PackedStrings.from_arrays(arrays, f'{prefix}.labels')
+        self._top_start = arrays[f'{prefix}.top_start']
+        self._top_items = arrays[f'{prefix}.top_items']
+        self._item_rank = arrays[f'{prefix}.item_rank']
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._item_rank >= 0))
+
+    def insert(self, key: str, item: Hashable, score: float = 0) -> None:
+        raise TypeError('FrozenPrefixTrie is read-only')
+
+    def finalize(self) -> None:
+        pass
+
+    def _root_node(self) -> int:
+        return 0
+
+    def _edge(self, node: int, char: str) -> Optional[tuple]:
+        start, end = self._edge_start[node], self._edge_start[node + 1]
+        code = ord(char)
+        i = start + int(np.searchsorted(self._edge_first[start:end], code))
+        if i < end and self._edge_first[i] == code:
+            return self._labels[i], int(self._edge_child[i])
+        return None
+
+    def _edges(self, node: int) -> Iterable[tuple]:
+        start, end = int(self._edge_start[node]), int(self._edge_start[node + 1])
+        return [(self._labels[i], child)
+                for i, child in zip(range(start, end), self._edge_child[start:end].tolist())]
+
+    def _top(self, node: int) -> List[int]:
+        return self._top_items[self._top_start[node]:self._top_start[node + 1]].tolist()
+
+    def _rank(self, item: int) -> int:
+        return int(self._item_rank[item])
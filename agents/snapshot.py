@@ -0,0 +1,213 @@
+# agents/snapshot.py
+"""
+Versioned binary snapshots of NumPy arrays
+One file holding named, aligned arrays that are memory-mapped on open, plus the
+packed string and hash-table layouts used to keep search data in plain arrays
+"""
+
+import json
+import mmap
+import os
+import zlib
+from typing import Dict, Iterable, Iterator, Mapping, Optional
+
+import numpy as np
+
+SNAPSHOT_MAGIC = b'GBGSNAP\x00'
+SNAPSHOT_FORMAT_VERSION = 1
+_ALIGNMENT = 64
+
+class SnapshotError(Exception):
+    """Raised when a snapshot is missing, corrupt or from another format version"""
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+def write_snapshot(path: str, arrays: Mapping[str, np.ndarray], meta: Optional[dict] = None) -> None:
+    """Write arrays to path atomically (readers never see a partial file)
+
+    Layout: magic, 8-byte header length, JSON header (format version, meta and
+    the dtype/shape/offset of every array), then each array's raw bytes at a
+    64-byte aligned offset.
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    entries, offset = {}, 0
+    for name, array in arrays.items():
+        entries[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset = _aligned(offset + array.nbytes)
+    header = json.dumps({'version': SNAPSHOT_FORMAT_VERSION, 'meta': meta or {},
+                         'arrays': entries}).encode('utf-8')
+    data_start = _aligned(len(SNAPSHOT_MAGIC) + 8 + len(header))
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + entries[name]['offset'])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+class Snapshot(Mapping[str, np.ndarray]):
+    """Read-only, memory-mapped view of a snapshot file
+
+    Opening only parses the header; arrays are zero-copy views into the mapping,
+    created on first access, so pages are read (and shared between processes
+    through the OS page cache) only when they are actually used.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise SnapshotError(f"Cannot open snapshot {path}: {e}") from e
+
+        magic_end = len(SNAPSHOT_MAGIC)
+        if self._mmap[:magic_end] != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"{path} is not a snapshot file")
+        header_length = int.from_bytes(self._mmap[magic_end:magic_end + 8], 'little')
+        header = json.loads(self._mmap[magic_end + 8:magic_end + 8 + header_length])
+        if header.get('version') != SNAPSHOT_FORMAT_VERSION:
+            raise SnapshotError(f"{path} has format version {header.get('version')}, "
+                                f"expected {SNAPSHOT_FORMAT_VERSION}")
+
+        self.meta = header['meta']
+        self._entries = header['arrays']
+        self._data_start = _aligned(magic_end + 8 + header_length)
+        self._arrays = {}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        array = self._arrays.get(name)
+        if array is None:
+            entry = self._entries[name]
+            dtype = np.dtype(entry['dtype'])
+            count = int(np.prod(entry['shape'], dtype=np.int64))
+            array = np.frombuffer(self._mmap, dtype=dtype, count=count,
+                                  offset=self._data_start + entry['offset']).reshape(entry['shape'])
+            self._arrays[name] = array
+        return array
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class PackedStrings:
+    """Read-only sequence of strings stored as one UTF-8 blob plus offsets"""
+
+    __slots__ = ('blob', 'offsets', '_bytes')
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self.blob = blob
+        self.offsets = offsets
+        self._bytes = None
+
+    @classmethod
+    def pack(cls, strings: Iterable[str]) -> 'PackedStrings':
+        encoded = [string.encode('utf-8') for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(data) for data in encoded], out=offsets[1:])
+        return cls(np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return self.blob[self.offsets[index]:self.offsets[index + 1]].tobytes().decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        blob = self.blob.tobytes()
+        offsets = self.offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield blob[start:end].decode('utf-8')
+
+    def find_all(self, substring: str) -> Iterator[int]:
+        """Indexes of the strings containing substring, in order
+
+        Scans the UTF-8 blob with bytes.find instead of decoding every string.
+        """
+        if not substring:
+            yield from range(len(self))
+            return
+        if self._bytes is None:
+            self._bytes = self.blob.tobytes()
+        blob, offsets, needle = self._bytes, self.offsets, substring.encode('utf-8')
+        position = blob.find(needle)
+        while position != -1:
+            index = int(np.searchsorted(offsets, position, side='right')) - 1
+            end = int(offsets[index + 1])
+            if position + len(needle) <= end:
+                yield index
+                position = blob.find(needle, end)
+            else:
+                # Match spans two strings; retry from the next byte
+                position = blob.find(needle, position + 1)
+
+    def to_arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        return {f'{prefix}.blob': self.blob, f'{prefix}.offsets': self.offsets}
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, np.ndarray], prefix: str) -> 'PackedStrings':
+        return cls(arrays[f'{prefix}.blob'], arrays[f'{prefix}.offsets'])
+
+def stable_hash(key: str) -> int:
+    """String hash that is the same in every process (unlike hash())"""
+    return zlib.crc32(key.encode('utf-8'))
+
+class HashIndex:
+    """Open-addressing hash table from strings to ints, kept entirely in arrays
+
+    The array form of a dict index: it can live in a memory-mapped snapshot and
+    be queried in O(1) without rebuilding anything at load time.
+    """
+
+    __slots__ = ('slots', 'keys', 'values')
+
+    def __init__(self, slots: np.ndarray, keys: PackedStrings, values: np.ndarray):
+        self.slots = slots      # entry id per slot, -1 when empty
+        self.keys = keys
+        self.values = values
+
+    @classmethod
+    def build(cls, mapping: Mapping[str, int]) -> 'HashIndex':
+        items = list(mapping.items())
+        size = 1
+        while size < 2 * len(items):
+            size *= 2
+        mask = size - 1
+        slots = np.full(size, -1, dtype=np.int32)
+        for entry, (key, _) in enumerate(items):
+            slot = stable_hash(key) & mask
+            while slots[slot] != -1:
+                slot = (slot + 1) & mask
+            slots[slot] = entry
+        return cls(slots, PackedStrings.pack(key for key, _ in items),
+                   np.array([value for _, value in items], dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        mask = len(self.slots) - 1
+        slot = stable_hash(key) & mask
+        while True:
+            entry = int(self.slots[slot])
+            if entry == -1:
+                return default
+            if self.keys[entry] == key:
+                return int(self.values[entry])
+            slot = (slot + 1) & mask
+
+    def to_arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        return {f'{prefix}.slots': self.slots, f'{prefix}.values': self.values,
+                **self.keys.to_arrays(f'{prefix}.keys')}
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping[str, np.ndarray], prefix: str) -> 'HashIndex':
+        return cls(arrays[f'{prefix}.slots'], PackedStrings.from_arrays(arrays, f'{prefix}.keys'),
+                   arrays[f'{prefix}.values'])
@@ -8,6 +8,10 @@ import time
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from .comfort_calculator import TravelComfortCalculator
+from .location_service import get_location_service
+from .scoring_engine import TripScoringEngine
+
 # Import streamlit-searchbox for autocomplete
 try:
     from streamlit_searchbox import st_searchbox
@@ -35,102 +39,6 @@ class ProductRecommendation:
     rating: str
     category: str
 
-class GlobalLocationService:
-    def __init__(self):
-        self._search_cache = {}
-        self.top_family_destinations = [
-            'Dubai', 'Singapore', 'Tokyo', 'London', 'Sydney', 
-            'Barcelona', 'Amsterdam', 'Copenhagen', 'Reykjavik', 'Paris'
-        ]
-        self.all_locations = self._load_all_locations()
-    
-    def _load_all_locations(self) -> List[Destination]:
-        """Load all locations for autocomplete"""
-        try:
-            import sys
-            import os
-            
-            # Add current directory to path
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            if current_dir not in sys.path:
-                sys.path.append(current_dir)
-            parent_dir = os.path.dirname(current_dir)
-            if parent_dir not in sys.path:
-                sys.path.append(parent_dir)
-            
-            from world_locations import WORLD_LOCATIONS, format_display_name
-            
-            locations = []
-            for name, data in WORLD_LOCATIONS.items():
-                dest = Destination(
-                    name=name,
-                    country=data['country'],
-                    admin=data.get('admin', ''),
-                    population=data['population'],
-                    type=data['type'],
-                    display=format_display_name(data, name),
-                    source='database'
-                )
-                locations.append(dest)
-            
-            return locations
-            
-        except Exception as e:
-            st.error(f"Could not load locations: {e}")
-            # Fallback locations
-            return [
-                Destination('Dubai', 'United Arab Emirates', 'Dubai', 3500000, 'city', 'Dubai, UAE'),
-                Destination('London', 'United Kingdom', 'England', 9000000, 'city', 'London, UK'),
-                Destination('Tokyo', 'Japan', 'Tokyo', 14000000, 'city', 'Tokyo, Japan'),
-                Destination('New York', 'United States', 'New York', 8400000, 'city', 'New York, USA'),
-                Destination('Singapore', 'Singapore', '', 6000000, 'city', 'Singapore'),
-            ]
-    
-    def search_destinations_autocomplete(self, searchterm: str) -> List[str]:
-        """Autocomplete search function for streamlit-searchbox"""
-        if not searchterm:
-            # Return top destinations for empty search
-            return [dest.display for dest in self.all_locations[:10] 
-                   if dest.name in self.top_family_destinations]
-        
-        searchterm_lower = searchterm.lower()
-        matches = []
-        
-        for dest in self.all_locations:
-            if (searchterm_lower in dest.name.lower() or 
-                searchterm_lower in dest.country.lower() or
-                searchterm_lower in dest.display.lower()):
-                matches.append(dest.display)
-                if len(matches) >= 20:  # Limit results
-                    break
-        
-        return matches
-    
-    def get_destination_by_display(self, display_name: str) -> Optional[Destination]:
-        """Get destination object by display name"""
-        for dest in self.all_locations:
-            if dest.display == display_name:
-                return dest
-        return None
-    
-    def search_destinations(self, query: str, limit: int = 8) -> List[Destination]:
-        """Fallback search method"""
-        if not query:
-            return [dest for dest in self.all_locations[:limit] 
-                   if dest.name in self.top_family_destinations]
-        
-        query_lower = query.lower()
-        results = []
-        
-        for dest in self.all_locations:
-            if (query_lower in dest.name.lower() or 
-                query_lower in dest.country.lower()):
-                results.append(dest)
-                if len(results) >= limit:
-                    break
-        
-        return results
-
 class TravelStressAnalyzer:
     @staticmethod
     def calculate_comprehensive_stress(
@@ -139,95 +47,13 @@ class TravelStressAnalyzer:
         first_international: bool, parent_experience: str, destination: Destination,
         departure_location: Optional[Destination] = None, trip_duration: int = 5
     ) -> Tuple[int, dict]:
-        
-        factors = {
-            'baby_age': 0, 'flight_duration': 0, 'layovers': 0, 'timing': 0,
-            'support': 0, 'medical': 0, 'logistics': 0, 'experience': 0, 
-            'destination': 0, 'trip_length': 0
-        }
-        
-        # Baby age factor (FIXED - 4 months should be low stress)
-        if baby_age <= 3:
-            factors['baby_age'] = 1  # Very young, sleeps a lot
-        elif baby_age <= 6:
-            factors['baby_age'] = 1  # Still portable, manageable (4 months = LOW stress)
-        elif baby_age <= 11:
-            factors['baby_age'] = 3  # Mobile, more challenging
-        elif baby_age <= 18:
-            factors['baby_age'] = 2  # Active but can be reasoned with
-        else:
-            factors['baby_age'] = 1  # Can communicate needs
-        
-        # Flight duration (FIXED scaling)
-        if flight_hours > 12:
-            factors['flight_duration'] = 3
-        elif flight_hours > 8:
-            factors['flight_duration'] = 2
-        elif flight_hours > 5:
-            factors['flight_duration'] = 1  # 3.5 hours = minimal stress
-        else:
-            factors['flight_duration'] = 0  # Short flights are easy
-        
-        # Layovers (direct flight = 0 stress)
-        factors['layovers'] = min(layovers, 2)  # Direct flight = 0
-        
-        # Timing
-        timing_stress = {
-            "Morning (7-11 AM)": 0,
-            "Afternoon (11 AM-5 PM)": 1, 
-            "Evening (5-10 PM)": 0,
-            "Very Early (5-7 AM)": 2,
-            "Late Night (10 PM-12 AM)": 1,
-            "Red-eye (12-5 AM)": 3
-        }
-        factors['timing'] = timing_stress.get(departure_time, 1)
-        
-        # Trip duration factor (NEW)
-        if trip_duration <= 3:
-            factors['trip_length'] = 0  # Short trips are easier
-        elif trip_duration <= 7:
-            factors['trip_length'] = 1  # Week-long trips
-        elif trip_duration <= 14:
-            factors['trip_length'] = 2  # Two weeks
-        else:
-            factors['trip_length'] = 3  # Extended trips
-        
-        # Support
-        if not has_partner:
-            factors['support'] = 2  # Reduced from 3
-        
-        # Medical and logistics
-        if special_needs:
-            factors['medical'] = 2  # Reduced from 3
-        if pumping_needed:
-            factors['logistics'] += 1
-        if first_international:
-            factors['logistics'] += 1
-        
-        # Experience
-        experience_stress = {
-            "First time flying with baby": 2,  # Reduced from 3
-            "2-3 previous flights": 1,
-            "Experienced traveler (4+ flights)": 0,
-            "Travel veteran (10+ flights)": 0
-        }
-        factors['experience'] = experience_stress.get(parent_experience, 1)
-        
-        # Destination difficulty
-        easy_destinations = ['Dubai', 'Singapore', 'Tokyo', 'London', 'Sydney', 'Barcelona', 'Amsterdam', 'Copenhagen', 'Reykjavik', 'Paris']
-        moderate_destinations = ['New York', 'Los Angeles', 'Rome', 'Berlin', 'Madrid', 'Istanbul', 'Mumbai', 'Delhi', 'Hyderabad']
-        
-        if destination.name in easy_destinations:
-            factors['destination'] = 0
-        elif destination.name in moderate_destinations:
-            factors['destination'] = 1  # Hyderabad = moderate, not high
-        else:
-            factors['destination'] = 1
-        
-        total_stress = sum(factors.values())
-        final_stress = max(1, min(total_stress, 10))
-        
-        return final_stress, factors
+        """Stress score (1-10) and its factors, from the stress section of the scoring rules"""
+        score = TripScoringEngine(TravelComfortCalculator()).score_trip(
+            baby_age, flight_hours, layovers, departure_time, has_partner, special_needs,
+            pumping_needed, first_international, parent_experience, destination,
+            departure_location, trip_duration
+        )
+        return score.stress_score, score.stress_factors
 
 def get_weather_info(destination: Destination) -> Dict[str, str]:
     """Get weather and temperature information for destination"""
@@ -603,8 +429,9 @@ def display_travel_stress_predictor():
     st.markdown("# ✈️ AI-Powered Travel Stress Predictor")
     st.markdown("🌍 Complete travel planning with departure search & trip duration")
     
+    # Location service is shared across all sessions
     if 'location_service' not in st.session_state:
-        st.session_state.location_service = GlobalLocationService()
+        st.session_state.location_service = get_location_service()
     
     if 'selected_destination' not in st.session_state:
         st.session_state.selected_destination = None
@@ -612,6 +439,11 @@ def display_travel_stress_predictor():
     if 'selected_departure' not in st.session_state:
         st.session_state.selected_departure = None
     
+    # Per-user incremental autocomplete, one per search box
+    for key in ('departure_autocomplete', 'destination_autocomplete'):
+        if key not in st.session_state:
+            st.session_state[key] = st.session_state.location_service.autocomplete_session()
+    
     st.info("📊 **Enhanced Features:** Departure search • Trip duration • Smart packing • 1000+ destinations")
     st.markdown("---")
     
@@ -623,7 +455,7 @@ def display_travel_stress_predictor():
         st.markdown("### 🛫 Departure Location")
         if SEARCHBOX_AVAILABLE:
             departure_selected = st_searchbox(
-                search_function=st.session_state.location_service.search_destinations_autocomplete,
+                search_function=st.session_state.departure_autocomplete,
                 placeholder="Search departure city...",
                 label="From where are you departing?",
                 key="departure_search"
@@ -646,7 +478,7 @@ def display_travel_stress_predictor():
         st.markdown("### 🎯 Destination")
         if SEARCHBOX_AVAILABLE:
             destination_selected = st_searchbox(
-                search_function=st.session_state.location_service.search_destinations_autocomplete,
+                search_function=st.session_state.destination_autocomplete,
                 placeholder="Search destination...",
                 label="Where are you going?",
                 key="destination_search"
@@ -6,18 +6,12 @@ Production Version 1.0
 """
 
 import streamlit as st
-import time
-import pandas as pd
 import datetime
-import streamlit.components.v1 as components
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
-# Import modular services
-from .comfort_calculator import TravelComfortCalculator, WeatherComfortService
-from .hotel_suggestions import BabyFriendlyHotelService, HotelSearchLink
-from .location_service import GlobalLocationService
-from .packing_assistant import get_smart_packing_list
+# Modular services (and NumPy behind them) are imported on first use, so the
+# app starts without loading them
 
 # Import streamlit-searchbox for autocomplete
 try:
@@ -39,59 +33,9 @@ class Destination:
 
 def get_season_from_date(travel_date, destination_name):
     """Get season and weather info based on travel date and destination"""
-    month = travel_date.month
+    from .destination_profiles import DESTINATION_PROFILES
     
-    # Seasonal weather data for major destinations
-    seasonal_weather = {
-        'Dubai': {
-            'winter': (12, 1, 2, "Perfect weather! 22-28°C, ideal for families"),
-            'spring': (3, 4, 5, "Warm and pleasant, 25-35°C"),
-            'summer': (6, 7, 8, "Very hot! 35-45°C, stay indoors midday"),
-            'autumn': (9, 10, 11, "Hot but cooling down, 28-38°C")
-        },
-        'London': {
-            'winter': (12, 1, 2, "Cold and wet, 2-8°C, pack warm clothes"),
-            'spring': (3, 4, 5, "Mild and rainy, 8-15°C, perfect for sightseeing"),
-            'summer': (6, 7, 8, "Warm and pleasant, 15-25°C, ideal weather"),
-            'autumn': (9, 10, 11, "Cool and crisp, 8-16°C, beautiful season")
-        },
-        'Singapore': {
-            'winter': (12, 1, 2, "Dry season, 24-30°C, best time to visit"),
-            'spring': (3, 4, 5, "Hot and humid, 26-32°C"),
-            'summer': (6, 7, 8, "Very hot and humid, 26-33°C, frequent rain"),
-            'autumn': (9, 10, 11, "Monsoon season, 25-31°C, heavy rains")
-        },
-        'Tokyo': {
-            'winter': (12, 1, 2, "Cold and dry, 0-10°C, pack warm layers"),
-            'spring': (3, 4, 5, "Beautiful cherry blossoms, 10-20°C, perfect weather"),
-            'summer': (6, 7, 8, "Hot and humid, 20-30°C, rainy season"),
-            'autumn': (9, 10, 11, "Cool and comfortable, 10-22°C, stunning colors")
-        },
-        'Paris': {
-            'winter': (12, 1, 2, "Cold and wet, 3-8°C, cozy indoor activities"),
-            'spring': (3, 4, 5, "Mild and blooming, 8-16°C, lovely for walking"),
-            'summer': (6, 7, 8, "Warm and sunny, 15-25°C, perfect for tourism"),
-            'autumn': (9, 10, 11, "Cool and golden, 8-18°C, beautiful season")
-        }
-    }
-    
-    # Default seasonal info for other destinations
-    default_seasons = {
-        'winter': (12, 1, 2, "Winter season - check local weather"),
-        'spring': (3, 4, 5, "Spring season - mild temperatures"),
-        'summer': (6, 7, 8, "Summer season - warm weather"),
-        'autumn': (9, 10, 11, "Autumn season - cooler temperatures")
-    }
-    
-    # Get destination-specific or default weather
-    weather_data = seasonal_weather.get(destination_name, default_seasons)
-    
-    # Determine season based on month
-    for season, (m1, m2, m3, description) in weather_data.items():
-        if month in [m1, m2, m3]:
-            return season, description
-    
-    return "spring", "Moderate weather expected"
+    return DESTINATION_PROFILES.profile_for(destination_name).season_for(travel_date.month)
 
 def calculate_trip_duration_from_dates(start_date, end_date):
     """Calculate trip duration in days from start and end dates"""
@@ -231,6 +175,10 @@ def display_travel_comfort_analyzer():
 
 def display_travel_comfort_analyzer():
     """GoBabyGo main interface for smart family travel planning"""
+    from .analysis_cache import cached_analysis
+    from .comfort_calculator import TravelComfortCalculator
+    from .destination_profiles import get_destination_profile
+    from .location_service import get_location_service
     
     # Enhanced CSS for all components with GoBabyGo branding - FIXED SEARCHBOX COLORS
     st.markdown("""
@@ -600,9 +548,9 @@ def display_travel_comfort_analyzer():
     st.markdown('<h1 class="gobabygo-header">🍼 GoBabyGo: Smart Travel Companion</h1>', unsafe_allow_html=True)
     st.markdown('<p class="gobabygo-tagline">✈️ AI-powered travel planning made easy for parents</p>', unsafe_allow_html=True)
     
-    # Initialize services
+    # Initialize services (location service is shared across all sessions)
     if 'location_service' not in st.session_state:
-        st.session_state.location_service = GlobalLocationService()
+        st.session_state.location_service = get_location_service()
     
     if 'selected_destination' not in st.session_state:
         st.session_state.selected_destination = None
@@ -659,8 +607,7 @@ def display_travel_comfort_analyzer():
                     st.success(f"🎯 **To:** {dest.display}")
                     
                     # Add weather information
-                    weather_service = WeatherComfortService()
-                    weather_info = weather_service.get_weather_comfort_info(dest)
+                    weather_info = get_destination_profile(dest).climate
                     st.info(f"🌡️ **Climate:** {weather_info['temp']} • {weather_info['climate']}")
         else:
             st.info("Loading destinations...")
@@ -696,7 +643,7 @@ def display_travel_comfort_analyzer():
         
         # Display trip info with seasonal weather
         if st.session_state.selected_destination:
-            season, weather_desc = get_season_from_date(departure_date, st.session_state.selected_destination.name)
+            season, weather_desc = get_destination_profile(st.session_state.selected_destination).season_for(departure_date.month)
             
             st.info(f"📅 **Duration:** {trip_duration} days")
             st.info(f"🌤️ **Season:** {season.title()} travel")
@@ -716,7 +663,7 @@ def display_travel_comfort_analyzer():
     
     # Trip Summary Card
     if st.session_state.selected_departure and st.session_state.selected_destination:
-        season, weather_desc = get_season_from_date(departure_date, st.session_state.selected_destination.name)
+        season, weather_desc = get_destination_profile(st.session_state.selected_destination).season_for(departure_date.month)
         st.markdown(f"""
         <div class="trip-info-card">
             <h3>🗺️ Your Trip Summary</h3>
@@ -750,13 +697,29 @@ def display_travel_comfort_analyzer():
         else:
             st.info("**🗣️ Communicative Toddler (19-24 months)**: Can express needs but still challenging")
         
-        st.markdown("### ✈️ Flight Details") 
-        flight_hours = st.slider("Total Flight Time (hours)", 0.5, 20.0, 3.0, step=0.5)
-        
-        layovers = st.selectbox("Number of Layovers", 
+        st.markdown("### ✈️ Flight Details")
+
+        # Pre-fill from the great-circle estimate when both endpoints are known
+        flight_estimate = None
+        if st.session_state.selected_departure and st.session_state.selected_destination:
+            flight_estimate = st.session_state.location_service.estimate_flight(
+                st.session_state.selected_departure, st.session_state.selected_destination
+            )
+        default_hours = 3.0
+        default_layovers = 0
+        if flight_estimate:
+            default_hours = min(max(round(flight_estimate.flight_hours * 2) / 2, 0.5), 20.0)
+            default_layovers = min(flight_estimate.layovers, 4)
+
+        flight_hours = st.slider("Total Flight Time (hours)", 0.5, 20.0, default_hours, step=0.5)
+
+        layovers = st.selectbox("Number of Layovers",
             options=[0, 1, 2, 3, 4],
+            index=default_layovers,
             format_func=lambda x: f"{x} layover{'s' if x != 1 else ''}" if x > 0 else "Direct flight"
         )
+        if flight_estimate:
+            st.caption(f"📏 Estimated from {flight_estimate.distance_km:,.0f} km great-circle distance — adjust if your itinerary differs")
         
         departure_time = st.selectbox("Primary Departure Time", [
             "Morning (7-11 AM)", "Afternoon (11 AM-5 PM)", "Evening (5-10 PM)",
@@ -807,15 +770,15 @@ def display_travel_comfort_analyzer():
             st.success(f"🎯 **Destination:** {dest.display}")
             st.info(f"📍 Type: {dest.type.title()} • Population: {dest.population:,}")
             
-            # Add weather information with seasonal context
-            weather_service = WeatherComfortService()
-            weather_info = weather_service.get_weather_comfort_info(dest)
-            season, weather_desc = get_season_from_date(departure_date, dest.name)
+            # Add weather information with seasonal context (one profile lookup)
+            profile = get_destination_profile(dest)
+            weather_info = profile.climate
+            season, weather_desc = profile.season_for(departure_date.month)
             
             st.info(f"🌡️ **Climate:** {weather_info['temp']} • {weather_info['climate']} • {season.title()}")
             st.info(f"☀️ **Travel Weather:** {weather_desc}")
             
-            if hasattr(st.session_state.location_service, 'top_family_destinations') and dest.name in st.session_state.location_service.top_family_destinations:
+            if profile.family_friendly:
                 st.success("👨‍👩‍👧‍👦 **Family-Friendly Destination** - Excellent for children!")
     
     st.markdown("---")
@@ -831,659 +794,615 @@ def display_travel_comfort_analyzer():
             departure = st.session_state.selected_departure
             
             with st.spinner("🧠 AI analyzing your travel comfort factors..."):
-                progress_bar = st.progress(0)
-                for i in range(100):
-                    time.sleep(0.01)
-                    progress_bar.progress(i + 1)
-                
-                # Calculate comfort score using modular service
+                # Scores, insights, packing list and hotel links in one pass,
+                # shared with any earlier analysis of the same inputs
                 calculator = TravelComfortCalculator()
-                comfort_score, factors = calculator.calculate_travel_comfort(
-                    baby_age, flight_hours, layovers, departure_time,
+                analysis, _ = cached_analysis(
+                    calculator, baby_age, flight_hours, layovers, departure_time,
                     has_partner, special_needs, pumping_needed, first_international,
-                    parent_experience, destination, departure, trip_duration
+                    parent_experience, destination, departure, trip_duration,
+                    departure_date, return_date, hotel_preferences
                 )
-                
-                progress_bar.empty()
-                
-                # Display results with positive messaging
-                st.markdown("---")
-                if departure:
-                    st.markdown(f"# ✈️ Travel Comfort Analysis: {departure.name} → {destination.display}")
-                else:
-                    st.markdown(f"# ✈️ Travel Comfort Analysis: {destination.display}")
-                
-                # Enhanced trip summary with dates and weather
-                season, weather_desc = get_season_from_date(departure_date, destination.name)
-                st.markdown(f"""
-                <div class="trip-info-card">
-                    <h3>📋 Trip Overview</h3>
-                    <p><strong>🛫 Route:</strong> {departure.display if departure else 'Not specified'} → {destination.display}</p>
-                    <p><strong>📅 Travel Dates:</strong> {departure_date.strftime('%B %d, %Y')} - {return_date.strftime('%B %d, %Y')}</p>
-                    <p><strong>⏱️ Duration:</strong> {trip_duration} days</p>
-                    <p><strong>👶 Traveler:</strong> {baby_age}-month-old baby</p>
-                    <p><strong>✈️ Flight:</strong> {flight_hours} hours, {layovers} layover{'s' if layovers != 1 else ''}</p>
-                    <p><strong>🌤️ Season:</strong> {season.title()} in {destination.name}</p>
-                    <p><strong>☀️ Weather:</strong> {weather_desc}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Comfort level display
-                if comfort_score >= 8:
-                    emoji, level, color = "😊", "Excellent Comfort", "#28a745"
-                    message = "Outstanding! This trip should be very comfortable and enjoyable for your family."
-                elif comfort_score >= 6:
-                    emoji, level, color = "😌", "Good Comfort", "#17a2b8"  
-                    message = "Great setup! With good preparation, this will be a comfortable experience."
-                elif comfort_score >= 4:
-                    emoji, level, color = "😐", "Moderate Comfort", "#ffc107"
-                    message = "Manageable trip - some preparation will help ensure comfort."
-                else:
-                    emoji, level, color = "😅", "Needs Planning", "#fd7e14"
-                    message = "This trip needs extra planning - but it's definitely doable with the right preparation!"
-                
-                st.markdown(f"""
-                <div class="comfort-score-card" style="text-align: center; padding: 30px; border-radius: 20px; 
-                           background: linear-gradient(135deg, {color}20 0%, {color}10 100%);
-                           border: 2px solid {color}; margin: 20px 0;">
-                    <h2>{emoji} Comfort Level: {comfort_score}/10</h2>
-                    <h3>{level}</h3>
-                    <p style="margin-top: 15px; font-size: 1.1em;">{message}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                st.progress(comfort_score / 10)
-                
-                # Get insights using modular service
-                insights = calculator.get_comfort_insights(comfort_score, factors)
-                
-                # DETAILED COMFORT FACTOR BREAKDOWN - FIXED DISPLAY (only showing proper weights, no extra rounding)
-                st.markdown("## 📊 Detailed Comfort Factor Analysis")
-                st.markdown("*Understanding your comfort score calculation*")
-                
-                factor_explanations = {
-                    'baby_age_comfort': f'👶 **Baby Age ({baby_age} months)**: {factors["baby_age_comfort"]:.1f}/{calculator.factor_weights["baby_age_comfort"]:.0f} points',
-                    'flight_comfort': f'✈️ **Flight ({flight_hours}h, {layovers} stops)**: {factors["flight_comfort"]:.1f}/{calculator.factor_weights["flight_comfort"]:.0f} points',
-                    'timing_convenience': f'⏰ **Departure Time**: {factors["timing_convenience"]:.1f}/{calculator.factor_weights["timing_convenience"]:.0f} points',
-                    'trip_duration_comfort': f'📅 **Trip Duration ({trip_duration} days)**: {factors["trip_duration_comfort"]:.1f}/{calculator.factor_weights["trip_duration_comfort"]:.0f} points',
-                    'support_system': f'👥 **Support System**: {factors["support_system"]:.1f}/{calculator.factor_weights["support_system"]:.0f} points',
-                    'medical_preparedness': f'🏥 **Medical Preparedness**: {factors["medical_preparedness"]:.1f}/{calculator.factor_weights["medical_preparedness"]:.0f} points',
-                    'logistical_ease': f'📋 **Logistics Ease**: {factors["logistical_ease"]:.1f}/{calculator.factor_weights["logistical_ease"]:.0f} points',
-                    'experience_advantage': f'🎯 **Experience Level**: {factors["experience_advantage"]:.1f}/{calculator.factor_weights["experience_advantage"]:.0f} points',
-                    'destination_friendliness': f'🌍 **Destination ({destination.name})**: {factors["destination_friendliness"]:.1f}/{calculator.factor_weights["destination_friendliness"]:.0f} points'
-                }
-                
-                # Create 3 columns for factor display
-                factor_cols = st.columns(3)
-                for i, (factor, explanation) in enumerate(factor_explanations.items()):
-                    with factor_cols[i % 3]:
-                        score = factors[factor]
-                        weight = calculator.factor_weights[factor]
-                        percentage = (score / weight) * 100
-                        
-                        if percentage >= 75:
-                            st.success(explanation + " ✅")
-                        elif percentage >= 50:
-                            st.info(explanation + " ⚠️")
-                        else:
-                            st.warning(explanation + " 🔧")
-                
-                # Display insights
-                st.markdown("### 💡 Comfort Insights")
-                st.info(f"**Overall Assessment:** {insights['overall_assessment']}")
-                
-                if insights['top_strengths']:
-                    st.success(f"**Top Strengths:** {', '.join(insights['top_strengths'])}")
-                
-                if insights['areas_for_improvement']:
-                    st.warning(f"**Areas for Improvement:** {', '.join(insights['areas_for_improvement'])}")
+            trip_score = analysis.trip_score
+            comfort_score, factors = trip_score.comfort_score, trip_score.comfort_factors
+            
+            # Display results with positive messaging
+            st.markdown("---")
+            if departure:
+                st.markdown(f"# ✈️ Travel Comfort Analysis: {departure.name} → {destination.display}")
+            else:
+                st.markdown(f"# ✈️ Travel Comfort Analysis: {destination.display}")
+            
+            # Enhanced trip summary with dates and weather
+            profile = get_destination_profile(destination)
+            season, weather_desc = analysis.season, analysis.weather_desc
+            st.markdown(f"""
+            <div class="trip-info-card">
+                <h3>📋 Trip Overview</h3>
+                <p><strong>🛫 Route:</strong> {departure.display if departure else 'Not specified'} → {destination.display}</p>
+                <p><strong>📅 Travel Dates:</strong> {departure_date.strftime('%B %d, %Y')} - {return_date.strftime('%B %d, %Y')}</p>
+                <p><strong>⏱️ Duration:</strong> {trip_duration} days</p>
+                <p><strong>👶 Traveler:</strong> {baby_age}-month-old baby</p>
+                <p><strong>✈️ Flight:</strong> {flight_hours} hours, {layovers} layover{'s' if layovers != 1 else ''}</p>
+                <p><strong>🌤️ Season:</strong> {season.title()} in {destination.name}</p>
+                <p><strong>☀️ Weather:</strong> {weather_desc}</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Comfort level display
+            if comfort_score >= 8:
+                emoji, level, color = "😊", "Excellent Comfort", "#28a745"
+                message = "Outstanding! This trip should be very comfortable and enjoyable for your family."
+            elif comfort_score >= 6:
+                emoji, level, color = "😌", "Good Comfort", "#17a2b8"  
+                message = "Great setup! With good preparation, this will be a comfortable experience."
+            elif comfort_score >= 4:
+                emoji, level, color = "😐", "Moderate Comfort", "#ffc107"
+                message = "Manageable trip - some preparation will help ensure comfort."
+            else:
+                emoji, level, color = "😅", "Needs Planning", "#fd7e14"
+                message = "This trip needs extra planning - but it's definitely doable with the right preparation!"
+            
+            st.markdown(f"""
+            <div class="comfort-score-card" style="text-align: center; padding: 30px; border-radius: 20px; 
+                       background: linear-gradient(135deg, {color}20 0%, {color}10 100%);
+                       border: 2px solid {color}; margin: 20px 0;">
+                <h2>{emoji} Comfort Level: {comfort_score}/10</h2>
+                <h3>{level}</h3>
+                <p style="margin-top: 15px; font-size: 1.1em;">{message}</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.progress(comfort_score / 10)
+            
+            # Insights from the same scoring pass
+            insights = trip_score.insights
+            
+            # DETAILED COMFORT FACTOR BREAKDOWN - FIXED DISPLAY (only showing proper weights, no extra rounding)
+            st.markdown("## 📊 Detailed Comfort Factor Analysis")
+            st.markdown("*Understanding your comfort score calculation*")
+            
+            factor_explanations = {
+                'baby_age_comfort': f'👶 **Baby Age ({baby_age} months)**: {factors["baby_age_comfort"]:.1f}/{calculator.factor_weights["baby_age_comfort"]:.0f} points',
+                'flight_comfort': f'✈️ **Flight ({flight_hours}h, {layovers} stops)**: {factors["flight_comfort"]:.1f}/{calculator.factor_weights["flight_comfort"]:.0f} points',
+                'timing_convenience': f'⏰ **Departure Time**: {factors["timing_convenience"]:.1f}/{calculator.factor_weights["timing_convenience"]:.0f} points',
+                'trip_duration_comfort': f'📅 **Trip Duration ({trip_duration} days)**: {factors["trip_duration_comfort"]:.1f}/{calculator.factor_weights["trip_duration_comfort"]:.0f} points',
+                'support_system': f'👥 **Support System**: {factors["support_system"]:.1f}/{calculator.factor_weights["support_system"]:.0f} points',
+                'medical_preparedness': f'🏥 **Medical Preparedness**: {factors["medical_preparedness"]:.1f}/{calculator.factor_weights["medical_preparedness"]:.0f} points',
+                'logistical_ease': f'📋 **Logistics Ease**: {factors["logistical_ease"]:.1f}/{calculator.factor_weights["logistical_ease"]:.0f} points',
+                'experience_advantage': f'🎯 **Experience Level**: {factors["experience_advantage"]:.1f}/{calculator.factor_weights["experience_advantage"]:.0f} points',
+                'destination_friendliness': f'🌍 **Destination ({destination.name})**: {factors["destination_friendliness"]:.1f}/{calculator.factor_weights["destination_friendliness"]:.0f} points'
+            }
+            
+            # Create 3 columns for factor display
+            factor_cols = st.columns(3)
+            for i, (factor, explanation) in enumerate(factor_explanations.items()):
+                with factor_cols[i % 3]:
+                    score = factors[factor]
+                    weight = calculator.factor_weights[factor]
+                    percentage = (score / weight) * 100
+                    
+                    if percentage >= 75:
+                        st.success(explanation + " ✅")
+                    elif percentage >= 50:
+                        st.info(explanation + " ⚠️")
+                    else:
+                        st.warning(explanation + " 🔧")
+            
+            # Display insights
+            st.markdown("### 💡 Comfort Insights")
+            st.info(f"**Overall Assessment:** {insights['overall_assessment']}")
+            
+            if insights['top_strengths']:
+                st.success(f"**Top Strengths:** {', '.join(insights['top_strengths'])}")
+            
+            if insights['areas_for_improvement']:
+                st.warning(f"**Areas for Improvement:** {', '.join(insights['areas_for_improvement'])}")
 
-                # Navigation Preview - Show users what's coming
-                st.markdown("---")
-                st.markdown("### 📍 What's Next:")
-                nav_col1, nav_col2, nav_col3 = st.columns(3)
-                with nav_col1:
-                    st.info("🎒 **Smart Packing List**\nPersonalized items with Amazon links")
-                with nav_col2:
-                    st.info("🏨 **Hotel Search**\nBaby-friendly accommodations")
-                with nav_col3:
-                    st.info("📋 **Pre-Travel Checklist**\nDon't forget these essentials")
-                st.markdown("---")
+            # Navigation Preview - Show users what's coming
+            st.markdown("---")
+            st.markdown("### 📍 What's Next:")
+            nav_col1, nav_col2, nav_col3 = st.columns(3)
+            with nav_col1:
+                st.info("🎒 **Smart Packing List**\nPersonalized items with Amazon links")
+            with nav_col2:
+                st.info("🏨 **Hotel Search**\nBaby-friendly accommodations")
+            with nav_col3:
+                st.info("📋 **Pre-Travel Checklist**\nDon't forget these essentials")
+            st.markdown("---")
 
-                # Smart Packing List with Weather-Based Recommendations
-                st.markdown("## 🎒 Enhanced Smart Packing Checklist")
-                st.markdown(f"*Customized for {baby_age}-month-old • {destination.display} • {trip_duration} days • {season.title()} weather • Comfort Level: {comfort_score}/10*")
-                
-                # Get weather info for smart packing
-                weather_info = WeatherComfortService.get_weather_comfort_info(destination)
-                season, weather_desc = get_season_from_date(departure_date, destination.name)
-                
-                st.info(f"💡 **Smart Suggestions:** Items customized for {weather_info['climate']} weather during {season} season in {destination.name}!")
-                
-                # Weather-based packing alert
-                if 'Very hot' in weather_desc or 'hot' in weather_desc.lower():
-                    st.warning(f"🌡️ **Hot Weather Alert:** {weather_desc} - Extra sun protection and cooling items recommended!")
-                elif 'Cold' in weather_desc or 'cold' in weather_desc.lower():
-                    st.warning(f"❄️ **Cold Weather Alert:** {weather_desc} - Warm layers and heating items essential!")
-                elif 'rain' in weather_desc.lower():
-                    st.info(f"🌧️ **Rainy Season:** {weather_desc} - Pack waterproof items!")
-                
-                # Create product recommendation cards
-                st.markdown("### 🛍️ Personalized Amazon Product Recommendations")
-                st.markdown("*Click any link to search Amazon for these products*")
-                
-                # Function to create product card
-                def create_product_card(col, product_name, price_range, description, amazon_link, rating="4.5/5"):
-                    with col:
-                        st.markdown(f"""
-                        <div class="product-card">
-                            <h4 style="color: #ff6b6b; margin-bottom: 10px;">🛍️ {product_name}</h4>
-                            <p style="color: #ffc107; font-size: 1.1em; margin: 5px 0;">⭐ {rating} • 💰 {price_range}</p>
-                            <p style="color: #6c757d; margin: 15px 0; min-height: 40px;">{description}</p>
-                            <a href="{amazon_link}" target="_blank" style="background: linear-gradient(135deg, #ff9500 0%, #ff6200 100%); 
-                               color: white; padding: 12px 24px; border-radius: 8px; text-decoration: none; 
-                               display: inline-block; font-weight: 600; width: 100%; text-align: center;">
-                                🛒 Search on Amazon
-                            </a>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                # Enhanced Climate & Season-Based Essentials Section
-                st.markdown(f"#### 🌤️ {season.title()} Weather Essentials")
-                
-                # Season and climate-specific products
-                if season == 'summer' or 'Hot' in weather_info['climate'] or 'Tropical' in weather_info['climate'] or 'hot' in weather_desc.lower():
-                    cols = st.columns(3)
-                    create_product_card(
-                        cols[0], 
-                        "Baby Sun Hat with Neck Protection",
-                        "$15-25",
-                        f"UPF 50+ protection, perfect for {season} travel",
-                        f"https://www.amazon.com/s?k=baby+sun+hat+upf+50+{baby_age}+months",
-                        "4.4/5"
-                    )
-                    create_product_card(
-                        cols[1],
-                        "Lightweight Baby Rompers (6-pack)",
-                        "$25-35",
-                        f"Breathable cotton for {destination.name} {season}",
-                        f"https://www.amazon.com/s?k=baby+summer+rompers+{baby_age}+months+cotton",
-                        "4.5/5"
-                    )
-                    create_product_card(
-                        cols[2],
-                        "Baby Cooling Towels & Sunscreen",
-                        "$18-28",
-                        f"Essential for hot {season} weather",
-                        "https://www.amazon.com/s?k=baby+cooling+towel+sunscreen+spf+50+travel",
-                        "4.6/5"
-                    )
-                    
-                elif season == 'winter' or 'Cold' in weather_info['climate'] or 'cold' in weather_desc.lower():
-                    cols = st.columns(3)
-                    create_product_card(
-                        cols[0],
-                        "Baby Winter Travel Suit",
-                        "$35-50",
-                        f"Perfect for {destination.name} {season} weather",
-                        f"https://www.amazon.com/s?k=baby+winter+travel+suit+{baby_age}+months",
-                        "4.5/5"
-                    )
-                    create_product_card(
-                        cols[1],
-                        "Thermal Baby Layers Set",
-                        "$20-30",
-                        f"Essential layers for {season} travel",
-                        f"https://www.amazon.com/s?k=baby+thermal+underwear+set+{baby_age}+months",
-                        "4.4/5"
-                    )
-                    create_product_card(
-                        cols[2],
-                        "Baby Winter Accessories Bundle",
-                        "$15-25",
-                        f"Hat, mittens, scarf for cold {destination.name} weather",
-                        "https://www.amazon.com/s?k=baby+winter+hat+mittens+set",
-                        "4.6/5"
-                    )
-                    
-                elif 'rain' in weather_desc.lower() or season == 'autumn':
-                    cols = st.columns(3)
-                    create_product_card(
-                        cols[0],
-                        "Baby Rain Gear Set",
-                        "$25-35",
-                        f"Waterproof protection for {season} in {destination.name}",
-                        f"https://www.amazon.com/s?k=baby+rain+gear+waterproof+{baby_age}+months",
-                        "4.4/5"
-                    )
-                    create_product_card(
-                        cols[1],
-                        "Baby Layering Clothes Set",
-                        "$30-40",
-                        f"Versatile layers for changing {season} weather",
-                        f"https://www.amazon.com/s?k=baby+layering+clothes+{baby_age}+months",
-                        "4.5/5"
-                    )
-                    create_product_card(
-                        cols[2],
-                        "Stroller Rain Cover",
-                        "$15-25",
-                        f"Keep baby dry during {destination.name} {season}",
-                        "https://www.amazon.com/s?k=stroller+rain+cover+universal",
-                        "4.3/5"
-                    )
-                else:  # Spring or moderate climate
-                    cols = st.columns(3)
-                    create_product_card(
-                        cols[0],
-                        "Baby Spring/Fall Outfit Set",
-                        "$30-40",
-                        f"Perfect for mild {season} weather in {destination.name}",
-                        f"https://www.amazon.com/s?k=baby+spring+clothes+{baby_age}+months",
-                        "4.5/5"
-                    )
-                    create_product_card(
-                        cols[1],
-                        "Light Baby Jacket",
-                        "$25-35",
-                        f"Ideal for {season} travel comfort",
-                        f"https://www.amazon.com/s?k=baby+light+jacket+{baby_age}+months",
-                        "4.4/5"
-                    )
-                    create_product_card(
-                        cols[2],
-                        "Baby All-Weather Blanket",
-                        "$20-30",
-                        f"Versatile comfort for {season} weather",
-                        "https://www.amazon.com/s?k=baby+travel+blanket+all+weather",
-                        "4.6/5"
-                    )
-                
-                # Travel Essentials Section
-                st.markdown("#### ✈️ Travel Essentials")
+            # Smart Packing List with Weather-Based Recommendations
+            st.markdown("## 🎒 Enhanced Smart Packing Checklist")
+            st.markdown(f"*Customized for {baby_age}-month-old • {destination.display} • {trip_duration} days • {season.title()} weather • Comfort Level: {comfort_score}/10*")
+            
+            # Get weather info for smart packing
+            weather_info = profile.climate
+            
+            st.info(f"💡 **Smart Suggestions:** Items customized for {weather_info['climate']} weather during {season} season in {destination.name}!")
+            
+            # Weather-based packing alert
+            if 'Very hot' in weather_desc or 'hot' in weather_desc.lower():
+                st.warning(f"🌡️ **Hot Weather Alert:** {weather_desc} - Extra sun protection and cooling items recommended!")
+            elif 'Cold' in weather_desc or 'cold' in weather_desc.lower():
+                st.warning(f"❄️ **Cold Weather Alert:** {weather_desc} - Warm layers and heating items essential!")
+            elif 'rain' in weather_desc.lower():
+                st.info(f"🌧️ **Rainy Season:** {weather_desc} - Pack waterproof items!")
+            
+            # Create product recommendation cards
+            st.markdown("### 🛍️ Personalized Amazon Product Recommendations")
+            st.markdown("*Click any link to search Amazon for these products*")
+            
+            # Function to create product card
+            def create_product_card(col, product_name, price_range, description, amazon_link, rating="4.5/5"):
+                with col:
+                    st.markdown(f"""
+                    <div class="product-card">
+                        <h4 style="color: #ff6b6b; margin-bottom: 10px;">🛍️ {product_name}</h4>
+                        <p style="color: #ffc107; font-size: 1.1em; margin: 5px 0;">⭐ {rating} • 💰 {price_range}</p>
+                        <p style="color: #6c757d; margin: 15px 0; min-height: 40px;">{description}</p>
+                        <a href="{amazon_link}" target="_blank" style="background: linear-gradient(135deg, #ff9500 0%, #ff6200 100%); 
+                           color: white; padding: 12px 24px; border-radius: 8px; text-decoration: none; 
+                           display: inline-block; font-weight: 600; width: 100%; text-align: center;">
+                            🛒 Search on Amazon
+                        </a>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
+            # Enhanced Climate & Season-Based Essentials Section
+            st.markdown(f"#### 🌤️ {season.title()} Weather Essentials")
+            
+            # Season and climate-specific products
+            if season == 'summer' or 'Hot' in weather_info['climate'] or 'Tropical' in weather_info['climate'] or 'hot' in weather_desc.lower():
                 cols = st.columns(3)
+                create_product_card(
+                    cols[0], 
+                    "Baby Sun Hat with Neck Protection",
+                    "$15-25",
+                    f"UPF 50+ protection, perfect for {season} travel",
+                    f"https://www.amazon.com/s?k=baby+sun+hat+upf+50+{baby_age}+months",
+                    "4.4/5"
+                )
+                create_product_card(
+                    cols[1],
+                    "Lightweight Baby Rompers (6-pack)",
+                    "$25-35",
+                    f"Breathable cotton for {destination.name} {season}",
+                    f"https://www.amazon.com/s?k=baby+summer+rompers+{baby_age}+months+cotton",
+                    "4.5/5"
+                )
+                create_product_card(
+                    cols[2],
+                    "Baby Cooling Towels & Sunscreen",
+                    "$18-28",
+                    f"Essential for hot {season} weather",
+                    "https://www.amazon.com/s?k=baby+cooling+towel+sunscreen+spf+50+travel",
+                    "4.6/5"
+                )
                 
+            elif season == 'winter' or 'Cold' in weather_info['climate'] or 'cold' in weather_desc.lower():
+                cols = st.columns(3)
                 create_product_card(
                     cols[0],
-                    "Compact Travel Stroller",
-                    "$150-250",
-                    "One-hand fold, airplane carry-on size",
-                    "https://www.amazon.com/s?k=compact+travel+stroller+airplane+lightweight",
+                    "Baby Winter Travel Suit",
+                    "$35-50",
+                    f"Perfect for {destination.name} {season} weather",
+                    f"https://www.amazon.com/s?k=baby+winter+travel+suit+{baby_age}+months",
                     "4.5/5"
                 )
                 create_product_card(
                     cols[1],
-                    "Baby Carrier for Travel",
-                    "$40-80",
-                    f"Ergonomic design for {baby_age} months",
-                    f"https://www.amazon.com/s?k=baby+carrier+travel+{baby_age}+months+ergonomic",
+                    "Thermal Baby Layers Set",
+                    "$20-30",
+                    f"Essential layers for {season} travel",
+                    f"https://www.amazon.com/s?k=baby+thermal+underwear+set+{baby_age}+months",
                     "4.4/5"
                 )
                 create_product_card(
                     cols[2],
-                    "Diaper Bag Backpack",
-                    "$35-60",
-                    "Multiple compartments, changing pad included",
-                    "https://www.amazon.com/s?k=diaper+bag+backpack+travel+organizer+changing+pad",
+                    "Baby Winter Accessories Bundle",
+                    "$15-25",
+                    f"Hat, mittens, scarf for cold {destination.name} weather",
+                    "https://www.amazon.com/s?k=baby+winter+hat+mittens+set",
                     "4.6/5"
                 )
                 
-                # Age-specific products
-                st.markdown(f"#### 👶 Age-Specific Items ({baby_age} months)")
+            elif 'rain' in weather_desc.lower() or season == 'autumn':
                 cols = st.columns(3)
-                
-                if baby_age <= 6:
-                    create_product_card(
-                        cols[0],
-                        "Portable Baby Bassinet",
-                        "$60-100",
-                        "Foldable design, mosquito net included",
-                        "https://www.amazon.com/s?k=portable+baby+bassinet+travel+foldable",
-                        "4.3/5"
-                    )
-                    create_product_card(
-                        cols[1],
-                        "Formula Dispenser Tower",
-                        "$10-15",
-                        "BPA-free, 4 compartments, spill-proof",
-                        "https://www.amazon.com/s?k=formula+dispenser+travel+container",
-                        "4.5/5"
-                    )
-                    create_product_card(
-                        cols[2],
-                        "Bottle Sterilizer Bags",
-                        "$15-20",
-                        "Microwave steam bags, 20 pack",
-                        "https://www.amazon.com/s?k=bottle+sterilizer+bags+microwave+travel",
-                        "4.4/5"
-                    )
-                elif baby_age <= 12:
-                    create_product_card(
-                        cols[0],
-                        "Travel High Chair",
-                        "$25-40",
-                        "Portable booster, fits most chairs",
-                        "https://www.amazon.com/s?k=portable+high+chair+booster+travel",
-                        "4.4/5"
-                    )
-                    create_product_card(
-                        cols[1],
-                        "Baby Food Pouches Variety",
-                        "$20-30",
-                        "Organic options, TSA-friendly sizes",
-                        "https://www.amazon.com/s?k=baby+food+pouches+travel+organic",
-                        "4.5/5"
-                    )
-                    create_product_card(
-                        cols[2],
-                        "Sippy Cup Travel Set",
-                        "$15-25",
-                        "Spill-proof, easy clean, 3-pack",
-                        "https://www.amazon.com/s?k=sippy+cup+travel+spill+proof+set",
-                        "4.6/5"
-                    )
-                else:  # Toddlers
-                    create_product_card(
-                        cols[0],
-                        "Travel Potty Seat",
-                        "$20-30",
-                        "Foldable, fits standard toilets",
-                        "https://www.amazon.com/s?k=travel+potty+seat+toddler+foldable",
-                        "4.4/5"
-                    )
-                    create_product_card(
-                        cols[1],
-                        "Toddler Travel Activities",
-                        "$25-35",
-                        "Quiet books, reusable stickers, crayons",
-                        f"https://www.amazon.com/s?k=toddler+travel+activities+{baby_age}+months+airplane",
-                        "4.5/5"
-                    )
-                    create_product_card(
-                        cols[2],
-                        "Snack Container Set",
-                        "$15-25",
-                        "Spill-proof, BPA-free, 4-pack",
-                        "https://www.amazon.com/s?k=toddler+snack+containers+spill+proof+travel",
-                        "4.6/5"
-                    )
-                
-                # Essential Items Checklist
-                st.markdown("### ✅ Essential Items to Pack")
-                
-                # Get basic packing list
-                try:
-                    packing_items = get_smart_packing_list(
-                        baby_age, destination, comfort_score, flight_hours, 
-                        special_needs, pumping_needed, trip_duration
-                    )
-                except:
-                    # Fallback packing list
-                    packing_items = [
-                        "Diapers (extra supply)", "Baby wipes", "Baby clothes (layered)", 
-                        "Feeding supplies", "Baby carrier", "Travel stroller",
-                        "Baby first aid kit", "Baby sunscreen", "Pacifiers",
-                        "Baby toys/entertainment", "Blanket", "Baby monitor",
-                        "Changing pad", "Plastic bags", "Hand sanitizer",
-                        "Baby food/formula", "Bottles", "Baby medications"
-                    ]
-                
-                # Display in 3 columns with checkboxes
+                create_product_card(
+                    cols[0],
+                    "Baby Rain Gear Set",
+                    "$25-35",
+                    f"Waterproof protection for {season} in {destination.name}",
+                    f"https://www.amazon.com/s?k=baby+rain+gear+waterproof+{baby_age}+months",
+                    "4.4/5"
+                )
+                create_product_card(
+                    cols[1],
+                    "Baby Layering Clothes Set",
+                    "$30-40",
+                    f"Versatile layers for changing {season} weather",
+                    f"https://www.amazon.com/s?k=baby+layering+clothes+{baby_age}+months",
+                    "4.5/5"
+                )
+                create_product_card(
+                    cols[2],
+                    "Stroller Rain Cover",
+                    "$15-25",
+                    f"Keep baby dry during {destination.name} {season}",
+                    "https://www.amazon.com/s?k=stroller+rain+cover+universal",
+                    "4.3/5"
+                )
+            else:  # Spring or moderate climate
                 cols = st.columns(3)
-                for i, item in enumerate(packing_items[:18]):  # Limit to 18 most important items
-                    with cols[i % 3]:
-                        st.checkbox(item, key=f"pack_{i}")
-                
-                # Weather-specific packing reminders
-                st.markdown("### 🌤️ Weather-Specific Reminders")
+                create_product_card(
+                    cols[0],
+                    "Baby Spring/Fall Outfit Set",
+                    "$30-40",
+                    f"Perfect for mild {season} weather in {destination.name}",
+                    f"https://www.amazon.com/s?k=baby+spring+clothes+{baby_age}+months",
+                    "4.5/5"
+                )
+                create_product_card(
+                    cols[1],
+                    "Light Baby Jacket",
+                    "$25-35",
+                    f"Ideal for {season} travel comfort",
+                    f"https://www.amazon.com/s?k=baby+light+jacket+{baby_age}+months",
+                    "4.4/5"
+                )
+                create_product_card(
+                    cols[2],
+                    "Baby All-Weather Blanket",
+                    "$20-30",
+                    f"Versatile comfort for {season} weather",
+                    "https://www.amazon.com/s?k=baby+travel+blanket+all+weather",
+                    "4.6/5"
+                )
+            
+            # Travel Essentials Section
+            st.markdown("#### ✈️ Travel Essentials")
+            cols = st.columns(3)
+            
+            create_product_card(
+                cols[0],
+                "Compact Travel Stroller",
+                "$150-250",
+                "One-hand fold, airplane carry-on size",
+                "https://www.amazon.com/s?k=compact+travel+stroller+airplane+lightweight",
+                "4.5/5"
+            )
+            create_product_card(
+                cols[1],
+                "Baby Carrier for Travel",
+                "$40-80",
+                f"Ergonomic design for {baby_age} months",
+                f"https://www.amazon.com/s?k=baby+carrier+travel+{baby_age}+months+ergonomic",
+                "4.4/5"
+            )
+            create_product_card(
+                cols[2],
+                "Diaper Bag Backpack",
+                "$35-60",
+                "Multiple compartments, changing pad included",
+                "https://www.amazon.com/s?k=diaper+bag+backpack+travel+organizer+changing+pad",
+                "4.6/5"
+            )
+            
+            # Age-specific products
+            st.markdown(f"#### 👶 Age-Specific Items ({baby_age} months)")
+            cols = st.columns(3)
+            
+            if baby_age <= 6:
+                create_product_card(
+                    cols[0],
+                    "Portable Baby Bassinet",
+                    "$60-100",
+                    "Foldable design, mosquito net included",
+                    "https://www.amazon.com/s?k=portable+baby+bassinet+travel+foldable",
+                    "4.3/5"
+                )
+                create_product_card(
+                    cols[1],
+                    "Formula Dispenser Tower",
+                    "$10-15",
+                    "BPA-free, 4 compartments, spill-proof",
+                    "https://www.amazon.com/s?k=formula+dispenser+travel+container",
+                    "4.5/5"
+                )
+                create_product_card(
+                    cols[2],
+                    "Bottle Sterilizer Bags",
+                    "$15-20",
+                    "Microwave steam bags, 20 pack",
+                    "https://www.amazon.com/s?k=bottle+sterilizer+bags+microwave+travel",
+                    "4.4/5"
+                )
+            elif baby_age <= 12:
+                create_product_card(
+                    cols[0],
+                    "Travel High Chair",
+                    "$25-40",
+                    "Portable booster, fits most chairs",
+                    "https://www.amazon.com/s?k=portable+high+chair+booster+travel",
+                    "4.4/5"
+                )
+                create_product_card(
+                    cols[1],
+                    "Baby Food Pouches Variety",
+                    "$20-30",
+                    "Organic options, TSA-friendly sizes",
+                    "https://www.amazon.com/s?k=baby+food+pouches+travel+organic",
+                    "4.5/5"
+                )
+                create_product_card(
+                    cols[2],
+                    "Sippy Cup Travel Set",
+                    "$15-25",
+                    "Spill-proof, easy clean, 3-pack",
+                    "https://www.amazon.com/s?k=sippy+cup+travel+spill+proof+set",
+                    "4.6/5"
+                )
+            else:  # Toddlers
+                create_product_card(
+                    cols[0],
+                    "Travel Potty Seat",
+                    "$20-30",
+                    "Foldable, fits standard toilets",
+                    "https://www.amazon.com/s?k=travel+potty+seat+toddler+foldable",
+                    "4.4/5"
+                )
+                create_product_card(
+                    cols[1],
+                    "Toddler Travel Activities",
+                    "$25-35",
+                    "Quiet books, reusable stickers, crayons",
+                    f"https://www.amazon.com/s?k=toddler+travel+activities+{baby_age}+months+airplane",
+                    "4.5/5"
+                )
+                create_product_card(
+                    cols[2],
+                    "Snack Container Set",
+                    "$15-25",
+                    "Spill-proof, BPA-free, 4-pack",
+                    "https://www.amazon.com/s?k=toddler+snack+containers+spill+proof+travel",
+                    "4.6/5"
+                )
+            
+            # Essential Items Checklist
+            st.markdown("### ✅ Essential Items to Pack")
+            
+            packing_items = analysis.packing_items
+            
+            # Display in 3 columns with checkboxes
+            cols = st.columns(3)
+            for i, item in enumerate(packing_items[:18]):  # Limit to 18 most important items
+                with cols[i % 3]:
+                    st.checkbox(item, key=f"pack_{i}")
+            
+            # Weather-specific packing reminders
+            st.markdown("### 🌤️ Weather-Specific Reminders")
+            if 'hot' in weather_desc.lower():
+                st.warning("☀️ **Hot Weather Essentials:** Extra sun protection, cooling towels, electrolyte drinks, lightweight clothing")
+            elif 'cold' in weather_desc.lower():
+                st.warning("❄️ **Cold Weather Essentials:** Warm layers, hand warmers, thermal wear, waterproof boots")
+            elif 'rain' in weather_desc.lower():
+                st.info("🌧️ **Rainy Weather Essentials:** Waterproof clothing, umbrella, dry bags, extra clothes")
+            else:
+                st.info(f"🌤️ **{season.title()} Weather:** Pack versatile layers for changing conditions")
+            
+            # Pre-Travel Checklist
+            with st.expander("📋 Pre-Travel Checklist", expanded=False):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.checkbox("🩺 Book pediatrician visit 2 weeks before travel", key="pre1")
+                    st.checkbox("📄 Copy important documents (passport, insurance)", key="pre2")
+                    st.checkbox("📱 Download offline maps and translation apps", key="pre3")
+                    st.checkbox("🛄 Check airline baggage policies for baby items", key="pre4")
+                    st.checkbox("🏨 Confirm hotel crib/baby equipment availability", key="pre5")
+                with col2:
+                    st.checkbox("💉 Check required vaccinations for destination", key="pre6")
+                    st.checkbox("🏥 Research hospitals/clinics at destination", key="pre7")
+                    st.checkbox("💳 Notify bank of travel plans", key="pre8")
+                    st.checkbox("✈️ Select seats (bulkhead for bassinet if needed)", key="pre9")
+                    st.checkbox("📱 Get international phone plan or SIM card", key="pre10")
+                    
+            # Weather-specific pre-travel tasks
+            with st.expander(f"🌤️ {season.title()} Weather Preparation", expanded=False):
                 if 'hot' in weather_desc.lower():
-                    st.warning("☀️ **Hot Weather Essentials:** Extra sun protection, cooling towels, electrolyte drinks, lightweight clothing")
+                    st.checkbox("☀️ Research air-conditioned venues and indoor activities", key="weather1")
+                    st.checkbox("🏊 Pack swimming gear and water play items", key="weather2")
+                    st.checkbox("🧴 Buy high-SPF sunscreen suitable for babies", key="weather3")
                 elif 'cold' in weather_desc.lower():
-                    st.warning("❄️ **Cold Weather Essentials:** Warm layers, hand warmers, thermal wear, waterproof boots")
+                    st.checkbox("❄️ Research heated indoor activities and venues", key="weather4")
+                    st.checkbox("🧤 Pack extra warm accessories (hats, mittens, scarves)", key="weather5")
+                    st.checkbox("🔥 Check hotel heating and warm amenities", key="weather6")
                 elif 'rain' in weather_desc.lower():
-                    st.info("🌧️ **Rainy Weather Essentials:** Waterproof clothing, umbrella, dry bags, extra clothes")
-                else:
-                    st.info(f"🌤️ **{season.title()} Weather:** Pack versatile layers for changing conditions")
-                
-                # Pre-Travel Checklist
-                with st.expander("📋 Pre-Travel Checklist", expanded=False):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.checkbox("🩺 Book pediatrician visit 2 weeks before travel", key="pre1")
-                        st.checkbox("📄 Copy important documents (passport, insurance)", key="pre2")
-                        st.checkbox("📱 Download offline maps and translation apps", key="pre3")
-                        st.checkbox("🛄 Check airline baggage policies for baby items", key="pre4")
-                        st.checkbox("🏨 Confirm hotel crib/baby equipment availability", key="pre5")
-                    with col2:
-                        st.checkbox("💉 Check required vaccinations for destination", key="pre6")
-                        st.checkbox("🏥 Research hospitals/clinics at destination", key="pre7")
-                        st.checkbox("💳 Notify bank of travel plans", key="pre8")
-                        st.checkbox("✈️ Select seats (bulkhead for bassinet if needed)", key="pre9")
-                        st.checkbox("📱 Get international phone plan or SIM card", key="pre10")
-                        
-                # Weather-specific pre-travel tasks
-                with st.expander(f"🌤️ {season.title()} Weather Preparation", expanded=False):
-                    if 'hot' in weather_desc.lower():
-                        st.checkbox("☀️ Research air-conditioned venues and indoor activities", key="weather1")
-                        st.checkbox("🏊 Pack swimming gear and water play items", key="weather2")
-                        st.checkbox("🧴 Buy high-SPF sunscreen suitable for babies", key="weather3")
-                    elif 'cold' in weather_desc.lower():
-                        st.checkbox("❄️ Research heated indoor activities and venues", key="weather4")
-                        st.checkbox("🧤 Pack extra warm accessories (hats, mittens, scarves)", key="weather5")
-                        st.checkbox("🔥 Check hotel heating and warm amenities", key="weather6")
-                    elif 'rain' in weather_desc.lower():
-                        st.checkbox("🌧️ Research covered attractions and indoor activities", key="weather7")
-                        st.checkbox("☔ Pack waterproof gear for stroller and baby", key="weather8")
-                        st.checkbox("🏠 Plan indoor backup activities", key="weather9")
-                
-                # Airport & Flight Checklist
-                with st.expander("✈️ Airport & Flight Checklist", expanded=False):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.checkbox("🍼 Bring extra bottles for security screening", key="air1")
-                        st.checkbox("📄 Bring baby's birth certificate or passport", key="air2")
-                        st.checkbox("💧 Follow 3-1-1 rule for liquids (baby food exempt)", key="air3")
-                    with col2:
-                        st.checkbox("🥛 Pack formula powder (easier than liquid)", key="air4")
-                        st.checkbox("👜 Pack essentials in easily accessible bag", key="air5")
-                        st.checkbox("⏰ Arrive early for security with baby", key="air6")
-                
-                # Trip duration advice
-                if trip_duration <= 3:
-                    st.info("💡 **Short Trip Tip:** Pack light - you can buy essentials locally if needed!")
-                elif trip_duration > 14:
-                    st.warning("📋 **Extended Trip:** Consider shipping items ahead or researching local shopping options.")
-                
-                st.markdown("---")
-                
-                # Baby-Friendly Hotel Suggestions
-                st.markdown("## 🏨 Find Baby-Friendly Accommodations")
-                st.markdown(f"*Customized searches for {destination.display} with your required amenities*")
-
-                try:
-                    hotel_service = BabyFriendlyHotelService()
-                    search_links = hotel_service.get_baby_friendly_hotels(
-                        destination, hotel_preferences, baby_age, trip_duration
-                    )
-                except:
-                    # Fallback hotel search links
-                    search_links = [
-                        {
-                            'platform': 'Booking.com',
-                            'url': f"https://www.booking.com/searchresults.html?ss={destination.name}&checkin={departure_date.strftime('%Y-%m-%d')}&checkout={return_date.strftime('%Y-%m-%d')}&group_adults=2&group_children=1&age=0",
-                            'description': 'Comprehensive hotel search with family filters and your exact dates',
-                            'filters_applied': ['Family rooms', 'Crib available', 'Kitchen facilities', 'Your travel dates']
-                        },
-                        {
-                            'platform': 'Hotels.com',
-                            'url': f"https://www.hotels.com/search.do?destination={destination.name}&adults=2&children=1&checkin={departure_date.strftime('%Y-%m-%d')}&checkout={return_date.strftime('%Y-%m-%d')}",
-                            'description': 'Family-friendly hotels and resorts with exact dates',
-                            'filters_applied': ['Baby amenities', 'Family suites', 'Pool access', 'Your dates']
-                        },
-                        {
-                            'platform': 'Airbnb',
-                            'url': f"https://www.airbnb.com/s/{destination.name}/homes?adults=2&children=1&infants=1&checkin={departure_date.strftime('%Y-%m-%d')}&checkout={return_date.strftime('%Y-%m-%d')}",
-                            'description': 'Vacation rentals with kitchen and family amenities',
-                            'filters_applied': ['Kitchen', 'Family-friendly', 'Crib available', 'Your exact dates']
-                        }
-                    ]
+                    st.checkbox("🌧️ Research covered attractions and indoor activities", key="weather7")
+                    st.checkbox("☔ Pack waterproof gear for stroller and baby", key="weather8")
+                    st.checkbox("🏠 Plan indoor backup activities", key="weather9")
+            
+            # Airport & Flight Checklist
+            with st.expander("✈️ Airport & Flight Checklist", expanded=False):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.checkbox("🍼 Bring extra bottles for security screening", key="air1")
+                    st.checkbox("📄 Bring baby's birth certificate or passport", key="air2")
+                    st.checkbox("💧 Follow 3-1-1 rule for liquids (baby food exempt)", key="air3")
+                with col2:
+                    st.checkbox("🥛 Pack formula powder (easier than liquid)", key="air4")
+                    st.checkbox("👜 Pack essentials in easily accessible bag", key="air5")
+                    st.checkbox("⏰ Arrive early for security with baby", key="air6")
+            
+            # Trip duration advice
+            if trip_duration <= 3:
+                st.info("💡 **Short Trip Tip:** Pack light - you can buy essentials locally if needed!")
+            elif trip_duration > 14:
+                st.warning("📋 **Extended Trip:** Consider shipping items ahead or researching local shopping options.")
+            
+            st.markdown("---")
+            
+            # Baby-Friendly Hotel Suggestions
+            st.markdown("## 🏨 Find Baby-Friendly Accommodations")
+            st.markdown(f"*Customized searches for {destination.display} with your required amenities*")
 
-                # Display search summary with dates
-                st.markdown(f"""
-                <div style="border: 2px solid #4ecdc4; border-radius: 12px; padding: 20px; 
-                           background: linear-gradient(135deg, #4ecdc420 0%, #4ecdc405 100%); margin: 20px 0;">
-                    <h3>🏨 Accommodation Search Summary for {destination.display}</h3>
-                    <p><strong>📅 Your Travel Dates:</strong> {departure_date.strftime('%B %d, %Y')} - {return_date.strftime('%B %d, %Y')} ({trip_duration} nights)</p>
-                    <p><strong>🌤️ Weather:</strong> {season.title()} season - {weather_desc}</p>
-                    <p><strong>Your Requirements:</strong></p>
-                    <ul>
-                        <li>Budget: {hotel_preferences.get('budget', 'Not specified')}</li>
-                        <li>Essential: {', '.join(hotel_preferences.get('essential_amenities', [])[:3])}</li>
-                        <li>Priorities: {', '.join(hotel_preferences.get('location_priorities', [])[:2])}</li>
-                    </ul>
-                    <p><strong>Quick Tips:</strong></p>
-                    <ul>
-                        <li>🎯 All searches include your exact travel dates</li>
-                        <li>🏠 Try Airbnb for longer stays (kitchen + laundry)</li>
-                        <li>📞 Always confirm baby amenities before booking</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
+            search_links = analysis.search_links
 
-                # Display search links with dates
-                # Replace the hotel search links display section (around line 1220-1250) with this fixed version:
+            # Display search summary with dates
+            st.markdown(f"""
+            <div style="border: 2px solid #4ecdc4; border-radius: 12px; padding: 20px; 
+                       background: linear-gradient(135deg, #4ecdc420 0%, #4ecdc405 100%); margin: 20px 0;">
+                <h3>🏨 Accommodation Search Summary for {destination.display}</h3>
+                <p><strong>📅 Your Travel Dates:</strong> {departure_date.strftime('%B %d, %Y')} - {return_date.strftime('%B %d, %Y')} ({trip_duration} nights)</p>
+                <p><strong>🌤️ Weather:</strong> {season.title()} season - {weather_desc}</p>
+                <p><strong>Your Requirements:</strong></p>
+                <ul>
+                    <li>Budget: {hotel_preferences.get('budget', 'Not specified')}</li>
+                    <li>Essential: {', '.join(hotel_preferences.get('essential_amenities', [])[:3])}</li>
+                    <li>Priorities: {', '.join(hotel_preferences.get('location_priorities', [])[:2])}</li>
+                </ul>
+                <p><strong>Quick Tips:</strong></p>
+                <ul>
+                    <li>🎯 All searches include your exact travel dates</li>
+                    <li>🏠 Try Airbnb for longer stays (kitchen + laundry)</li>
+                    <li>📞 Always confirm baby amenities before booking</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
 
-                # Display search links with dates
-                st.markdown("### 🔍 Pre-Configured Search Links (With Your Dates)")
-                st.info("Click any link below to search with baby-friendly filters and your exact travel dates already applied!")
+            # Display search links with dates
+            # Replace the hotel search links display section (around line 1220-1250) with this fixed version:
 
-                # Create columns for search links
-                search_cols = st.columns(2)
+            # Display search links with dates
+            st.markdown("### 🔍 Pre-Configured Search Links (With Your Dates)")
+            st.info("Click any link below to search with baby-friendly filters and your exact travel dates already applied!")
 
-                for i, search_link in enumerate(search_links):
-                    with search_cols[i % 2]:
-                        # Fix: Handle both dictionary and object formats
-                        if hasattr(search_link, 'platform'):
-                            # It's a HotelSearchLink object
-                            platform = search_link.platform
-                            description = search_link.description
-                            url = search_link.url
-                        else:
-                            # It's a dictionary (fallback case)
-                            platform = search_link.get('platform', 'Hotel Search')
-                            description = search_link.get('description', '')
-                            url = search_link.get('url', '#')
-                        
-                        st.markdown(f"""
-                        <div class="hotel-search-card">
-                            <h4 style="color: #2c3e50; margin: 0 0 10px 0;">🏨 {platform}</h4>
-                            <p style="color: #6c757d; margin: 5px 0;">{description}</p>
-                            <div style="margin: 10px 0;">
-                        """, unsafe_allow_html=True)
-                        
-                        
-                        st.markdown(f"""
-                            </div>
-                            <a href="{url}" target="_blank" style="background: linear-gradient(135deg, #4ecdc4 0%, #45b7d1 100%); 
-                               color: white; padding: 10px 20px; border-radius: 8px; text-decoration: none; 
-                               display: inline-block; font-weight: 600; margin-top: 10px; width: 100%; text-align: center;">
-                                🔗 Search on {platform} →
-                            </a>
-                        </div>
-                        """, unsafe_allow_html=True)
+            # Create columns for search links
+            search_cols = st.columns(2)
 
-                # Dynamic destination-specific tips with weather context
-                st.markdown("### 💡 Smart Accommodation Tips")
-                
-                # Weather-based accommodation advice
-                if 'hot' in weather_desc.lower():
-                    st.warning(f"🌡️ **Hot {season.title()} Weather:** Prioritize accommodations with excellent AC, pools, and shaded outdoor areas for {destination.name}")
-                elif 'cold' in weather_desc.lower():
-                    st.warning(f"❄️ **Cold {season.title()} Weather:** Look for hotels with good heating, indoor play areas, and warm lobbies in {destination.name}")
-                elif 'rain' in weather_desc.lower():
-                    st.info(f"🌧️ **Rainy {season.title()} Season:** Choose hotels with covered walkways, indoor activities, and room service in {destination.name}")
-                
-                # Get destination insights dynamically
-                try:
-                    destination_insights = st.session_state.location_service.get_destination_insights(destination)
+            for i, search_link in enumerate(search_links):
+                with search_cols[i % 2]:
+                    # Fix: Handle both dictionary and object formats
+                    if hasattr(search_link, 'platform'):
+                        # It's a HotelSearchLink object
+                        platform = search_link.platform
+                        description = search_link.description
+                        url = search_link.url
+                    else:
+                        # It's a dictionary (fallback case)
+                        platform = search_link.get('platform', 'Hotel Search')
+                        description = search_link.get('description', '')
+                        url = search_link.get('url', '#')
                     
-                    if destination_insights.get('family_rating') == 'Excellent':
-                        st.success(f"🌟 **Great Choice!** {destination.name} has excellent family infrastructure with widespread baby-friendly facilities!")
-                    elif destination_insights.get('infrastructure') == 'World-class':
-                        st.info(f"🏨 **{destination.name}** has world-class infrastructure - most hotels will have baby amenities available.")
+                    st.markdown(f"""
+                    <div class="hotel-search-card">
+                        <h4 style="color: #2c3e50; margin: 0 0 10px 0;">🏨 {platform}</h4>
+                        <p style="color: #6c757d; margin: 5px 0;">{description}</p>
+                        <div style="margin: 10px 0;">
+                    """, unsafe_allow_html=True)
                     
-                    # Language-based tips
-                    if destination_insights.get('language_barrier') == 'None':
-                        st.info("🗣️ **No Language Barrier** - Easy to communicate specific baby needs with hotel staff.")
-                    elif destination_insights.get('language_barrier') == 'Low':
-                        st.info("🗣️ **Low Language Barrier** - Most hotel staff speak English, making special requests easier.")
                     
-                    # Medical facilities tip
-                    if destination_insights.get('medical_facilities') in ['Excellent', 'World-class']:
-                        st.success("🏥 **Excellent Medical Infrastructure** - Pediatric care readily available near most hotels.")
-                
-                except:
-                    # Fallback destination tips
-                    pass
-                
-                # Population-based suggestions
-                if destination.population > 5000000:
-                    st.info("🏙️ **Major City** - Wide variety of family-friendly accommodations available. Consider location carefully for convenience.")
-                elif destination.population > 1000000:
-                    st.info("🌆 **Large City** - Good selection of hotels with baby amenities. Downtown areas usually well-equipped.")
-                elif destination.population > 100000:
-                    st.info("🏘️ **Mid-size City** - Limited but quality options. Consider booking early for best family rooms.")
-                else:
-                    st.info("🏡 **Smaller Destination** - Consider vacation rentals or serviced apartments for more baby-friendly features.")
-                
-                # Trip duration based tips
-                if trip_duration > 7:
-                    st.info("🏠 **Extended Stay** - Consider serviced apartments or vacation rentals with full kitchens and laundry facilities.")
-                elif trip_duration <= 3:
-                    st.info("🏨 **Short Stay** - Hotels with good baby amenities and room service might be more convenient than apartments.")
-                
-                # Budget-based dynamic suggestions
-                if "Budget" in hotel_preferences['budget']:
-                    st.info("💰 **Budget Tip** - Check family hostels or budget chains that often have family rooms with cribs at lower prices.")
-                elif "Luxury" in hotel_preferences['budget']:
-                    st.info("✨ **Luxury Options** - High-end hotels often provide complimentary baby amenities, babysitting services, and kids' clubs.")
-                
-                # Season-specific accommodation tips
-                if season == 'summer':
-                    st.info("☀️ **Summer Travel Tip** - Book accommodations with pools and air conditioning well in advance!")
-                elif season == 'winter':
-                    st.info("❄️ **Winter Travel Tip** - Look for hotels with indoor heating, room service, and covered parking.")
-                elif season == 'spring':
-                    st.info("🌸 **Spring Travel Tip** - Perfect season for outdoor hotel amenities and garden views!")
-                elif season == 'autumn':
-                    st.info("🍂 **Autumn Travel Tip** - Great time for hotels with scenic views and moderate pricing.")
+                    st.markdown(f"""
+                        </div>
+                        <a href="{url}" target="_blank" style="background: linear-gradient(135deg, #4ecdc4 0%, #45b7d1 100%); 
+                           color: white; padding: 10px 20px; border-radius: 8px; text-decoration: none; 
+                           display: inline-block; font-weight: 600; margin-top: 10px; width: 100%; text-align: center;">
+                            🔗 Search on {platform} →
+                        </a>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+            # Dynamic destination-specific tips with weather context
+            st.markdown("### 💡 Smart Accommodation Tips")
+            
+            # Weather-based accommodation advice
+            if 'hot' in weather_desc.lower():
+                st.warning(f"🌡️ **Hot {season.title()} Weather:** Prioritize accommodations with excellent AC, pools, and shaded outdoor areas for {destination.name}")
+            elif 'cold' in weather_desc.lower():
+                st.warning(f"❄️ **Cold {season.title()} Weather:** Look for hotels with good heating, indoor play areas, and warm lobbies in {destination.name}")
+            elif 'rain' in weather_desc.lower():
+                st.info(f"🌧️ **Rainy {season.title()} Season:** Choose hotels with covered walkways, indoor activities, and room service in {destination.name}")
+            
+            # Get destination insights dynamically
+            try:
+                destination_insights = profile.insights
                 
-                # Note about direct booking
-                st.info("""
-                📌 **Pro Tip**: After finding options on search platforms, consider calling the hotel directly. 
-                They may offer better rates, room upgrades, or confirm specific baby amenities that aren't listed online.
-                """)
+                if destination_insights.get('family_rating') == 'Excellent':
+                    st.success(f"🌟 **Great Choice!** {destination.name} has excellent family infrastructure with widespread baby-friendly facilities!")
+                elif destination_insights.get('infrastructure') == 'World-class':
+                    st.info(f"🏨 **{destination.name}** has world-class infrastructure - most hotels will have baby amenities available.")
                 
-                # Success message with positive framing and weather context
-                st.markdown("---")
-                if comfort_score >= 7:
-                    st.success(f"🌟 **Excellent planning!** You're set up for a wonderful {season} family trip to {destination.name}!")
-                    st.balloons()
-                elif comfort_score >= 5:
-                    st.info(f"💪 **Good foundation!** A few tweaks will make this {season} trip even better.")
-                else:
-                    st.info(f"🎯 **Great start!** With our suggestions, this {season} trip will be much more comfortable.")
-                
-                # Final summary with dates and weather
-                st.markdown("### 📅 Your Trip Summary")
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Comfort Score", f"{comfort_score}/10", "")
-                with col2:
-                    st.metric("Trip Duration", f"{trip_duration} days", f"{departure_date.strftime('%b %d')} - {return_date.strftime('%b %d')}")
-                with col3:
-                    st.metric("Weather Season", f"{season.title()}", f"{destination.name}")
+                # Language-based tips
+                if destination_insights.get('language_barrier') == 'None':
+                    st.info("🗣️ **No Language Barrier** - Easy to communicate specific baby needs with hotel staff.")
+                elif destination_insights.get('language_barrier') == 'Low':
+                    st.info("🗣️ **Low Language Barrier** - Most hotel staff speak English, making special requests easier.")
                 
+                # Medical facilities tip
+                if destination_insights.get('medical_facilities') in ['Excellent', 'World-class']:
+                    st.success("🏥 **Excellent Medical Infrastructure** - Pediatric care readily available near most hotels.")
+            
+            except:
+                # Fallback destination tips
+                pass
+            
+            # Population-based suggestions
+            if destination.population > 5000000:
+                st.info("🏙️ **Major City** - Wide variety of family-friendly accommodations available. Consider location carefully for convenience.")
+            elif destination.population > 1000000:
+                st.info("🌆 **Large City** - Good selection of hotels with baby amenities. Downtown areas usually well-equipped.")
+            elif destination.population > 100000:
+                st.info("🏘️ **Mid-size City** - Limited but quality options. Consider booking early for best family rooms.")
+            else:
+                st.info("🏡 **Smaller Destination** - Consider vacation rentals or serviced apartments for more baby-friendly features.")
+            
+            # Trip duration based tips
+            if trip_duration > 7:
+                st.info("🏠 **Extended Stay** - Consider serviced apartments or vacation rentals with full kitchens and laundry facilities.")
+            elif trip_duration <= 3:
+                st.info("🏨 **Short Stay** - Hotels with good baby amenities and room service might be more convenient than apartments.")
+            
+            # Budget-based dynamic suggestions
+            if "Budget" in hotel_preferences['budget']:
+                st.info("💰 **Budget Tip** - Check family hostels or budget chains that often have family rooms with cribs at lower prices.")
+            elif "Luxury" in hotel_preferences['budget']:
+                st.info("✨ **Luxury Options** - High-end hotels often provide complimentary baby amenities, babysitting services, and kids' clubs.")
+            
+            # Season-specific accommodation tips
+            if season == 'summer':
+                st.info("☀️ **Summer Travel Tip** - Book accommodations with pools and air conditioning well in advance!")
+            elif season == 'winter':
+                st.info("❄️ **Winter Travel Tip** - Look for hotels with indoor heating, room service, and covered parking.")
+            elif season == 'spring':
+                st.info("🌸 **Spring Travel Tip** - Perfect season for outdoor hotel amenities and garden views!")
+            elif season == 'autumn':
+                st.info("🍂 **Autumn Travel Tip** - Great time for hotels with scenic views and moderate pricing.")
+            
+            # Note about direct booking
+            st.info("""
+            📌 **Pro Tip**: After finding options on search platforms, consider calling the hotel directly. 
+            They may offer better rates, room upgrades, or confirm specific baby amenities that aren't listed online.
+            """)
+            
+            # Success message with positive framing and weather context
+            st.markdown("---")
+            if comfort_score >= 7:
+                st.success(f"🌟 **Excellent planning!** You're set up for a wonderful {season} family trip to {destination.name}!")
+                st.balloons()
+            elif comfort_score >= 5:
+                st.info(f"💪 **Good foundation!** A few tweaks will make this {season} trip even better.")
+            else:
+                st.info(f"🎯 **Great start!** With our suggestions, this {season} trip will be much more comfortable.")
+            
+            # Final summary with dates and weather
+            st.markdown("### 📅 Your Trip Summary")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Comfort Score", f"{comfort_score}/10", "")
+            with col2:
+                st.metric("Trip Duration", f"{trip_duration} days", f"{departure_date.strftime('%b %d')} - {return_date.strftime('%b %d')}")
+            with col3:
+                st.metric("Weather Season", f"{season.title()}", f"{destination.name}")
+            
         else:
             st.error("🌍 Please select a destination first!")
 
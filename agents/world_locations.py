@@ -4,206 +4,707 @@ Enhanced worldwide locations database with airport codes for travel applications
 Contains 1000+ cities, countries, islands, regions, and airport codes globally
 """
 
+import heapq
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from typing import List, Optional
+
+from .search_cache import LocationCache
+from .search_index import PrefixTrie, normalize_search_text, word_start_keys
+
 WORLD_LOCATIONS = {
-    # Format: 'name': {'country': 'Country', 'admin': 'State/Region', 'type': 'city/country/island', 'population': number, 'airport_codes': ['IATA', 'ICAO'], 'airport_name': 'Full Airport Name'}
+    # Format: 'name': {'country': 'Country', 'admin': 'State/Region', 'type': 'city/country/island', 'population': number, 'airport_codes': ['IATA', ...], 'airport_name': 'Full Airport Name', 'lat': degrees, 'lon': degrees}
+    # airport_codes lists the primary airport first; ICAO codes and names of every airport are in AIRPORTS
+    # Countries use the coordinates of their capital
     
     # EUROPE - Major Cities with Airport Codes
-    'London': {'country': 'United Kingdom', 'admin': 'England', 'type': 'city', 'population': 9000000, 'airport_codes': ['LHR', 'LGW', 'STN', 'LTN'], 'airport_name': 'Heathrow Airport'},
-    'Paris': {'country': 'France', 'admin': 'Ile-de-France', 'type': 'city', 'population': 11000000, 'airport_codes': ['CDG', 'ORY'], 'airport_name': 'Charles de Gaulle Airport'},
-    'Berlin': {'country': 'Germany', 'admin': 'Berlin', 'type': 'city', 'population': 3700000, 'airport_codes': ['BER'], 'airport_name': 'Berlin Brandenburg Airport'},
-    'Madrid': {'country': 'Spain', 'admin': 'Madrid', 'type': 'city', 'population': 6700000, 'airport_codes': ['MAD'], 'airport_name': 'Madrid-Barajas Airport'},
-    'Rome': {'country': 'Italy', 'admin': 'Lazio', 'type': 'city', 'population': 2900000, 'airport_codes': ['FCO', 'CIA'], 'airport_name': 'Leonardo da Vinci Airport'},
-    'Amsterdam': {'country': 'Netherlands', 'admin': 'North Holland', 'type': 'city', 'population': 1150000, 'airport_codes': ['AMS'], 'airport_name': 'Amsterdam Schiphol Airport'},
-    'Vienna': {'country': 'Austria', 'admin': 'Vienna', 'type': 'city', 'population': 1900000, 'airport_codes': ['VIE'], 'airport_name': 'Vienna International Airport'},
-    'Warsaw': {'country': 'Poland', 'admin': 'Mazovia', 'type': 'city', 'population': 1800000, 'airport_codes': ['WAW'], 'airport_name': 'Warsaw Chopin Airport'},
-    'Prague': {'country': 'Czech Republic', 'admin': 'Prague', 'type': 'city', 'population': 1300000, 'airport_codes': ['PRG'], 'airport_name': 'Václav Havel Airport Prague'},
-    'Budapest': {'country': 'Hungary', 'admin': 'Budapest', 'type': 'city', 'population': 1750000, 'airport_codes': ['BUD'], 'airport_name': 'Budapest Ferenc Liszt International Airport'},
+    'London': {'country': 'United Kingdom', 'admin': 'England', 'type': 'city', 'population': 9000000, 'airport_codes': ['LHR', 'LGW', 'STN', 'LTN'], 'airport_name': 'Heathrow Airport', 'lat': 51.5074, 'lon': -0.1278},
+    'Paris': {'country': 'France', 'admin': 'Ile-de-France', 'type': 'city', 'population': 11000000, 'airport_codes': ['CDG', 'ORY'], 'airport_name': 'Charles de Gaulle Airport', 'lat': 48.8566, 'lon': 2.3522},
+    'Berlin': {'country': 'Germany', 'admin': 'Berlin', 'type': 'city', 'population': 3700000, 'airport_codes': ['BER'], 'airport_name': 'Berlin Brandenburg Airport', 'lat': 52.52, 'lon': 13.405},
+    'Munich': {'country': 'Germany', 'admin': 'Bavaria', 'type': 'city', 'population': 1500000, 'airport_codes': ['MUC'], 'airport_name': 'Munich Airport', 'lat': 48.1351, 'lon': 11.582},
+    'Madrid': {'country': 'Spain', 'admin': 'Madrid', 'type': 'city', 'population': 6700000, 'airport_codes': ['MAD'], 'airport_name': 'Madrid-Barajas Airport', 'lat': 40.4168, 'lon': -3.7038},
+    'Rome': {'country': 'Italy', 'admin': 'Lazio', 'type': 'city', 'population': 2900000, 'airport_codes': ['FCO', 'CIA'], 'airport_name': 'Leonardo da Vinci Airport', 'lat': 41.9028, 'lon': 12.4964},
+    'Amsterdam': {'country': 'Netherlands', 'admin': 'North Holland', 'type': 'city', 'population': 1150000, 'airport_codes': ['AMS'], 'airport_name': 'Amsterdam Schiphol Airport', 'lat': 52.3676, 'lon': 4.9041},
+    'Vienna': {'country': 'Austria', 'admin': 'Vienna', 'type': 'city', 'population': 1900000, 'airport_codes': ['VIE'], 'airport_name': 'Vienna International Airport', 'lat': 48.2082, 'lon': 16.3738},
+    'Warsaw': {'country': 'Poland', 'admin': 'Mazovia', 'type': 'city', 'population': 1800000, 'airport_codes': ['WAW'], 'airport_name': 'Warsaw Chopin Airport', 'lat': 52.2297, 'lon': 21.0122},
+    'Prague': {'country': 'Czech Republic', 'admin': 'Prague', 'type': 'city', 'population': 1300000, 'airport_codes': ['PRG'], 'airport_name': 'Václav Havel Airport Prague', 'lat': 50.0755, 'lon': 14.4378},
+    'Budapest': {'country': 'Hungary', 'admin': 'Budapest', 'type': 'city', 'population': 1750000, 'airport_codes': ['BUD'], 'airport_name': 'Budapest Ferenc Liszt International Airport', 'lat': 47.4979, 'lon': 19.0402},
     
     # NORDIC COUNTRIES with Airport Codes
-    'Stockholm': {'country': 'Sweden', 'admin': 'Stockholm', 'type': 'city', 'population': 2400000, 'airport_codes': ['ARN', 'BMA'], 'airport_name': 'Stockholm Arlanda Airport'},
-    'Gothenburg': {'country': 'Sweden', 'admin': 'Vastra Gotaland', 'type': 'city', 'population': 1000000, 'airport_codes': ['GOT'], 'airport_name': 'Gothenburg Landvetter Airport'},
-    'Malmo': {'country': 'Sweden', 'admin': 'Skane', 'type': 'city', 'population': 350000, 'airport_codes': ['MMX'], 'airport_name': 'Malmö Airport'},
-    'Sweden': {'country': 'Sweden', 'admin': '', 'type': 'country', 'population': 10400000, 'airport_codes': ['ARN', 'GOT', 'MMX'], 'airport_name': 'Multiple Airports'},
-    'Copenhagen': {'country': 'Denmark', 'admin': 'Capital Region', 'type': 'city', 'population': 2000000, 'airport_codes': ['CPH'], 'airport_name': 'Copenhagen Airport'},
-    'Oslo': {'country': 'Norway', 'admin': 'Oslo', 'type': 'city', 'population': 1700000, 'airport_codes': ['OSL'], 'airport_name': 'Oslo Gardermoen Airport'},
-    'Helsinki': {'country': 'Finland', 'admin': 'Uusimaa', 'type': 'city', 'population': 1500000, 'airport_codes': ['HEL'], 'airport_name': 'Helsinki-Vantaa Airport'},
-    'Reykjavik': {'country': 'Iceland', 'admin': 'Capital Region', 'type': 'city', 'population': 130000, 'airport_codes': ['KEF'], 'airport_name': 'Keflavík International Airport'},
+    'Stockholm': {'country': 'Sweden', 'admin': 'Stockholm', 'type': 'city', 'population': 2400000, 'airport_codes': ['ARN', 'BMA'], 'airport_name': 'Stockholm Arlanda Airport', 'lat': 59.3293, 'lon': 18.0686},
+    'Gothenburg': {'country': 'Sweden', 'admin': 'Vastra Gotaland', 'type': 'city', 'population': 1000000, 'airport_codes': ['GOT'], 'airport_name': 'Gothenburg Landvetter Airport', 'lat': 57.7089, 'lon': 11.9746},
+    'Malmo': {'country': 'Sweden', 'admin': 'Skane', 'type': 'city', 'population': 350000, 'airport_codes': ['MMX'], 'airport_name': 'Malmö Airport', 'lat': 55.605, 'lon': 13.0038},
+    'Sweden': {'country': 'Sweden', 'admin': '', 'type': 'country', 'population': 10400000, 'airport_codes': ['ARN', 'GOT', 'MMX'], 'airport_name': 'Multiple Airports', 'lat': 59.3293, 'lon': 18.0686},
+    'Copenhagen': {'country': 'Denmark', 'admin': 'Capital Region', 'type': 'city', 'population': 2000000, 'airport_codes': ['CPH'], 'airport_name': 'Copenhagen Airport', 'lat': 55.6761, 'lon': 12.5683},
+    'Oslo': {'country': 'Norway', 'admin': 'Oslo', 'type': 'city', 'population': 1700000, 'airport_codes': ['OSL'], 'airport_name': 'Oslo Gardermoen Airport', 'lat': 59.9139, 'lon': 10.7522},
+    'Helsinki': {'country': 'Finland', 'admin': 'Uusimaa', 'type': 'city', 'population': 1500000, 'airport_codes': ['HEL'], 'airport_name': 'Helsinki-Vantaa Airport', 'lat': 60.1699, 'lon': 24.9384},
+    'Reykjavik': {'country': 'Iceland', 'admin': 'Capital Region', 'type': 'city', 'population': 130000, 'airport_codes': ['KEF'], 'airport_name': 'Keflavík International Airport', 'lat': 64.1466, 'lon': -21.9426},
     
     # MIDDLE EAST with Airport Codes
-    'Dubai': {'country': 'United Arab Emirates', 'admin': 'Dubai', 'type': 'city', 'population': 3500000, 'airport_codes': ['DXB', 'DWC'], 'airport_name': 'Dubai International Airport'},
-    'Abu Dhabi': {'country': 'United Arab Emirates', 'admin': 'Abu Dhabi', 'type': 'city', 'population': 1500000, 'airport_codes': ['AUH'], 'airport_name': 'Abu Dhabi International Airport'},
-    'Doha': {'country': 'Qatar', 'admin': 'Doha', 'type': 'city', 'population': 2400000, 'airport_codes': ['DOH'], 'airport_name': 'Hamad International Airport'},
-    'Kuwait City': {'country': 'Kuwait', 'admin': 'Al Asimah', 'type': 'city', 'population': 4100000, 'airport_codes': ['KWI'], 'airport_name': 'Kuwait International Airport'},
-    'Riyadh': {'country': 'Saudi Arabia', 'admin': 'Riyadh', 'type': 'city', 'population': 7600000, 'airport_codes': ['RUH'], 'airport_name': 'King Khalid International Airport'},
-    'Jeddah': {'country': 'Saudi Arabia', 'admin': 'Makkah', 'type': 'city', 'population': 4700000, 'airport_codes': ['JED'], 'airport_name': 'King Abdulaziz International Airport'},
-    'Muscat': {'country': 'Oman', 'admin': 'Muscat', 'type': 'city', 'population': 1600000, 'airport_codes': ['MCT'], 'airport_name': 'Muscat International Airport'},
-    'Manama': {'country': 'Bahrain', 'admin': 'Capital', 'type': 'city', 'population': 650000, 'airport_codes': ['BAH'], 'airport_name': 'Bahrain International Airport'},
-    'Tehran': {'country': 'Iran', 'admin': 'Tehran', 'type': 'city', 'population': 9000000, 'airport_codes': ['IKA', 'THR'], 'airport_name': 'Imam Khomeini International Airport'},
-    'Istanbul': {'country': 'Turkey', 'admin': 'Istanbul', 'type': 'city', 'population': 15500000, 'airport_codes': ['IST', 'SAW'], 'airport_name': 'Istanbul Airport'},
+    'Dubai': {'country': 'United Arab Emirates', 'admin': 'Dubai', 'type': 'city', 'population': 3500000, 'airport_codes': ['DXB', 'DWC'], 'airport_name': 'Dubai International Airport', 'lat': 25.2048, 'lon': 55.2708},
+    'Abu Dhabi': {'country': 'United Arab Emirates', 'admin': 'Abu Dhabi', 'type': 'city', 'population': 1500000, 'airport_codes': ['AUH'], 'airport_name': 'Abu Dhabi International Airport', 'lat': 24.4539, 'lon': 54.3773},
+    'Doha': {'country': 'Qatar', 'admin': 'Doha', 'type': 'city', 'population': 2400000, 'airport_codes': ['DOH'], 'airport_name': 'Hamad International Airport', 'lat': 25.2854, 'lon': 51.531},
+    'Kuwait City': {'country': 'Kuwait', 'admin': 'Al Asimah', 'type': 'city', 'population': 4100000, 'airport_codes': ['KWI'], 'airport_name': 'Kuwait International Airport', 'lat': 29.3759, 'lon': 47.9774},
+    'Riyadh': {'country': 'Saudi Arabia', 'admin': 'Riyadh', 'type': 'city', 'population': 7600000, 'airport_codes': ['RUH'], 'airport_name': 'King Khalid International Airport', 'lat': 24.7136, 'lon': 46.6753},
+    'Jeddah': {'country': 'Saudi Arabia', 'admin': 'Makkah', 'type': 'city', 'population': 4700000, 'airport_codes': ['JED'], 'airport_name': 'King Abdulaziz International Airport', 'lat': 21.4858, 'lon': 39.1925},
+    'Muscat': {'country': 'Oman', 'admin': 'Muscat', 'type': 'city', 'population': 1600000, 'airport_codes': ['MCT'], 'airport_name': 'Muscat International Airport', 'lat': 23.588, 'lon': 58.3829},
+    'Manama': {'country': 'Bahrain', 'admin': 'Capital', 'type': 'city', 'population': 650000, 'airport_codes': ['BAH'], 'airport_name': 'Bahrain International Airport', 'lat': 26.2285, 'lon': 50.586},
+    'Tehran': {'country': 'Iran', 'admin': 'Tehran', 'type': 'city', 'population': 9000000, 'airport_codes': ['IKA', 'THR'], 'airport_name': 'Imam Khomeini International Airport', 'lat': 35.6892, 'lon': 51.389},
+    'Istanbul': {'country': 'Turkey', 'admin': 'Istanbul', 'type': 'city', 'population': 15500000, 'airport_codes': ['IST', 'SAW'], 'airport_name': 'Istanbul Airport', 'lat': 41.0082, 'lon': 28.9784},
     
     # ASIA - East Asia with Airport Codes
-    'Tokyo': {'country': 'Japan', 'admin': 'Tokyo', 'type': 'city', 'population': 14000000, 'airport_codes': ['NRT', 'HND'], 'airport_name': 'Narita International Airport'},
-    'Osaka': {'country': 'Japan', 'admin': 'Osaka', 'type': 'city', 'population': 19000000, 'airport_codes': ['KIX', 'ITM'], 'airport_name': 'Kansai International Airport'},
-    'Seoul': {'country': 'South Korea', 'admin': 'Seoul', 'type': 'city', 'population': 25600000, 'airport_codes': ['ICN', 'GMP'], 'airport_name': 'Incheon International Airport'},
-    'Beijing': {'country': 'China', 'admin': 'Beijing', 'type': 'city', 'population': 21700000, 'airport_codes': ['PEK', 'PKX'], 'airport_name': 'Beijing Capital International Airport'},
-    'Shanghai': {'country': 'China', 'admin': 'Shanghai', 'type': 'city', 'population': 28500000, 'airport_codes': ['PVG', 'SHA'], 'airport_name': 'Shanghai Pudong International Airport'},
-    'Hong Kong': {'country': 'Hong Kong', 'admin': '', 'type': 'city', 'population': 7500000, 'airport_codes': ['HKG'], 'airport_name': 'Hong Kong International Airport'},
-    'Taipei': {'country': 'Taiwan', 'admin': 'Taipei', 'type': 'city', 'population': 2700000, 'airport_codes': ['TPE', 'TSA'], 'airport_name': 'Taiwan Taoyuan International Airport'},
+    'Tokyo': {'country': 'Japan', 'admin': 'Tokyo', 'type': 'city', 'population': 14000000, 'airport_codes': ['NRT', 'HND'], 'airport_name': 'Narita International Airport', 'lat': 35.6762, 'lon': 139.6503},
+    'Osaka': {'country': 'Japan', 'admin': 'Osaka', 'type': 'city', 'population': 19000000, 'airport_codes': ['KIX', 'ITM'], 'airport_name': 'Kansai International Airport', 'lat': 34.6937, 'lon': 135.5023},
+    'Seoul': {'country': 'South Korea', 'admin': 'Seoul', 'type': 'city', 'population': 25600000, 'airport_codes': ['ICN', 'GMP'], 'airport_name': 'Incheon International Airport', 'lat': 37.5665, 'lon': 126.978},
+    'Beijing': {'country': 'China', 'admin': 'Beijing', 'type': 'city', 'population': 21700000, 'airport_codes': ['PEK', 'PKX'], 'airport_name': 'Beijing Capital International Airport', 'lat': 39.9042, 'lon': 116.4074},
+    'Shanghai': {'country': 'China', 'admin': 'Shanghai', 'type': 'city', 'population': 28500000, 'airport_codes': ['PVG', 'SHA'], 'airport_name': 'Shanghai Pudong International Airport', 'lat': 31.2304, 'lon': 121.4737},
+    'Hong Kong': {'country': 'Hong Kong', 'admin': '', 'type': 'city', 'population': 7500000, 'airport_codes': ['HKG'], 'airport_name': 'Hong Kong International Airport', 'lat': 22.3193, 'lon': 114.1694},
+    'Taipei': {'country': 'Taiwan', 'admin': 'Taipei', 'type': 'city', 'population': 2700000, 'airport_codes': ['TPE', 'TSA'], 'airport_name': 'Taiwan Taoyuan International Airport', 'lat': 25.033, 'lon': 121.5654},
     
     # South Asia with Airport Codes
-    'Mumbai': {'country': 'India', 'admin': 'Maharashtra', 'type': 'city', 'population': 20700000, 'airport_codes': ['BOM'], 'airport_name': 'Chhatrapati Shivaji Maharaj International Airport'},
-    'Delhi': {'country': 'India', 'admin': 'Delhi', 'type': 'city', 'population': 32900000, 'airport_codes': ['DEL'], 'airport_name': 'Indira Gandhi International Airport'},
-    'Bangalore': {'country': 'India', 'admin': 'Karnataka', 'type': 'city', 'population': 13200000, 'airport_codes': ['BLR'], 'airport_name': 'Kempegowda International Airport'},
-    'Chennai': {'country': 'India', 'admin': 'Tamil Nadu', 'type': 'city', 'population': 11700000, 'airport_codes': ['MAA'], 'airport_name': 'Chennai International Airport'},
-    'Hyderabad': {'country': 'India', 'admin': 'Telangana', 'type': 'city', 'population': 10500000, 'airport_codes': ['HYD'], 'airport_name': 'Rajiv Gandhi International Airport'},
-    'Kolkata': {'country': 'India', 'admin': 'West Bengal', 'type': 'city', 'population': 15700000, 'airport_codes': ['CCU'], 'airport_name': 'Netaji Subhas Chandra Bose International Airport'},
-    'Colombo': {'country': 'Sri Lanka', 'admin': 'Western Province', 'type': 'city', 'population': 750000, 'airport_codes': ['CMB'], 'airport_name': 'Bandaranaike International Airport'},
+    'Mumbai': {'country': 'India', 'admin': 'Maharashtra', 'type': 'city', 'population': 20700000, 'airport_codes': ['BOM'], 'airport_name': 'Chhatrapati Shivaji Maharaj International Airport', 'lat': 19.076, 'lon': 72.8777},
+    'Delhi': {'country': 'India', 'admin': 'Delhi', 'type': 'city', 'population': 32900000, 'airport_codes': ['DEL'], 'airport_name': 'Indira Gandhi International Airport', 'lat': 28.7041, 'lon': 77.1025},
+    'Bangalore': {'country': 'India', 'admin': 'Karnataka', 'type': 'city', 'population': 13200000, 'airport_codes': ['BLR'], 'airport_name': 'Kempegowda International Airport', 'lat': 12.9716, 'lon': 77.5946},
+    'Chennai': {'country': 'India', 'admin': 'Tamil Nadu', 'type': 'city', 'population': 11700000, 'airport_codes': ['MAA'], 'airport_name': 'Chennai International Airport', 'lat': 13.0827, 'lon': 80.2707},
+    'Hyderabad': {'country': 'India', 'admin': 'Telangana', 'type': 'city', 'population': 10500000, 'airport_codes': ['HYD'], 'airport_name': 'Rajiv Gandhi International Airport', 'lat': 17.385, 'lon': 78.4867},
+    'Kolkata': {'country': 'India', 'admin': 'West Bengal', 'type': 'city', 'population': 15700000, 'airport_codes': ['CCU'], 'airport_name': 'Netaji Subhas Chandra Bose International Airport', 'lat': 22.5726, 'lon': 88.3639},
+    'Colombo': {'country': 'Sri Lanka', 'admin': 'Western Province', 'type': 'city', 'population': 750000, 'airport_codes': ['CMB'], 'airport_name': 'Bandaranaike International Airport', 'lat': 6.9271, 'lon': 79.8612},
     
     # Southeast Asia with Airport Codes
-    'Singapore': {'country': 'Singapore', 'admin': '', 'type': 'city', 'population': 6000000, 'airport_codes': ['SIN'], 'airport_name': 'Singapore Changi Airport'},
-    'Bangkok': {'country': 'Thailand', 'admin': 'Bangkok', 'type': 'city', 'population': 10700000, 'airport_codes': ['BKK', 'DMK'], 'airport_name': 'Suvarnabhumi Airport'},
-    'Phuket': {'country': 'Thailand', 'admin': 'Phuket', 'type': 'city', 'population': 420000, 'airport_codes': ['HKT'], 'airport_name': 'Phuket International Airport'},
-    'Kuala Lumpur': {'country': 'Malaysia', 'admin': 'Federal Territory', 'type': 'city', 'population': 8000000, 'airport_codes': ['KUL'], 'airport_name': 'Kuala Lumpur International Airport'},
-    'Jakarta': {'country': 'Indonesia', 'admin': 'Jakarta', 'type': 'city', 'population': 10600000, 'airport_codes': ['CGK'], 'airport_name': 'Soekarno-Hatta International Airport'},
-    'Manila': {'country': 'Philippines', 'admin': 'Metro Manila', 'type': 'city', 'population': 13900000, 'airport_codes': ['MNL'], 'airport_name': 'Ninoy Aquino International Airport'},
-    'Ho Chi Minh City': {'country': 'Vietnam', 'admin': 'Ho Chi Minh City', 'type': 'city', 'population': 9000000, 'airport_codes': ['SGN'], 'airport_name': 'Tan Son Nhat International Airport'},
-    'Hanoi': {'country': 'Vietnam', 'admin': 'Hanoi', 'type': 'city', 'population': 8100000, 'airport_codes': ['HAN'], 'airport_name': 'Noi Bai International Airport'},
+    'Singapore': {'country': 'Singapore', 'admin': '', 'type': 'city', 'population': 6000000, 'airport_codes': ['SIN'], 'airport_name': 'Singapore Changi Airport', 'lat': 1.3521, 'lon': 103.8198},
+    'Bangkok': {'country': 'Thailand', 'admin': 'Bangkok', 'type': 'city', 'population': 10700000, 'airport_codes': ['BKK', 'DMK'], 'airport_name': 'Suvarnabhumi Airport', 'lat': 13.7563, 'lon': 100.5018},
+    'Phuket': {'country': 'Thailand', 'admin': 'Phuket', 'type': 'city', 'population': 420000, 'airport_codes': ['HKT'], 'airport_name': 'Phuket International Airport', 'lat': 7.8804, 'lon': 98.3923},
+    'Kuala Lumpur': {'country': 'Malaysia', 'admin': 'Federal Territory', 'type': 'city', 'population': 8000000, 'airport_codes': ['KUL'], 'airport_name': 'Kuala Lumpur International Airport', 'lat': 3.139, 'lon': 101.6869},
+    'Jakarta': {'country': 'Indonesia', 'admin': 'Jakarta', 'type': 'city', 'population': 10600000, 'airport_codes': ['CGK'], 'airport_name': 'Soekarno-Hatta International Airport', 'lat': -6.2088, 'lon': 106.8456},
+    'Manila': {'country': 'Philippines', 'admin': 'Metro Manila', 'type': 'city', 'population': 13900000, 'airport_codes': ['MNL'], 'airport_name': 'Ninoy Aquino International Airport', 'lat': 14.5995, 'lon': 120.9842},
+    'Ho Chi Minh City': {'country': 'Vietnam', 'admin': 'Ho Chi Minh City', 'type': 'city', 'population': 9000000, 'airport_codes': ['SGN'], 'airport_name': 'Tan Son Nhat International Airport', 'lat': 10.8231, 'lon': 106.6297},
+    'Hanoi': {'country': 'Vietnam', 'admin': 'Hanoi', 'type': 'city', 'population': 8100000, 'airport_codes': ['HAN'], 'airport_name': 'Noi Bai International Airport', 'lat': 21.0278, 'lon': 105.8342},
     
     # AMERICAS - North America with Airport Codes
-    'New York': {'country': 'United States', 'admin': 'New York', 'type': 'city', 'population': 8400000, 'airport_codes': ['JFK', 'LGA', 'EWR'], 'airport_name': 'John F. Kennedy International Airport'},
-    'Los Angeles': {'country': 'United States', 'admin': 'California', 'type': 'city', 'population': 4000000, 'airport_codes': ['LAX'], 'airport_name': 'Los Angeles International Airport'},
-    'Chicago': {'country': 'United States', 'admin': 'Illinois', 'type': 'city', 'population': 2700000, 'airport_codes': ['ORD', 'MDW'], 'airport_name': 'O\'Hare International Airport'},
-    'San Francisco': {'country': 'United States', 'admin': 'California', 'type': 'city', 'population': 880000, 'airport_codes': ['SFO'], 'airport_name': 'San Francisco International Airport'},
-    'Miami': {'country': 'United States', 'admin': 'Florida', 'type': 'city', 'population': 470000, 'airport_codes': ['MIA'], 'airport_name': 'Miami International Airport'},
-    'Las Vegas': {'country': 'United States', 'admin': 'Nevada', 'type': 'city', 'population': 650000, 'airport_codes': ['LAS'], 'airport_name': 'McCarran International Airport'},
-    'Orlando': {'country': 'United States', 'admin': 'Florida', 'type': 'city', 'population': 280000, 'airport_codes': ['MCO'], 'airport_name': 'Orlando International Airport'},
-    'Seattle': {'country': 'United States', 'admin': 'Washington', 'type': 'city', 'population': 750000, 'airport_codes': ['SEA'], 'airport_name': 'Seattle-Tacoma International Airport'},
-    'Boston': {'country': 'United States', 'admin': 'Massachusetts', 'type': 'city', 'population': 690000, 'airport_codes': ['BOS'], 'airport_name': 'Logan International Airport'},
-    'Washington': {'country': 'United States', 'admin': 'District of Columbia', 'type': 'city', 'population': 710000, 'airport_codes': ['DCA', 'IAD'], 'airport_name': 'Ronald Reagan Washington National Airport'},
+    'New York': {'country': 'United States', 'admin': 'New York', 'type': 'city', 'population': 8400000, 'airport_codes': ['JFK', 'LGA', 'EWR'], 'airport_name': 'John F. Kennedy International Airport', 'lat': 40.7128, 'lon': -74.006},
+    'Los Angeles': {'country': 'United States', 'admin': 'California', 'type': 'city', 'population': 4000000, 'airport_codes': ['LAX'], 'airport_name': 'Los Angeles International Airport', 'lat': 34.0522, 'lon': -118.2437},
+    'Chicago': {'country': 'United States', 'admin': 'Illinois', 'type': 'city', 'population': 2700000, 'airport_codes': ['ORD', 'MDW'], 'airport_name': 'O\'Hare International Airport', 'lat': 41.8781, 'lon': -87.6298},
+    'San Francisco': {'country': 'United States', 'admin': 'California', 'type': 'city', 'population': 880000, 'airport_codes': ['SFO'], 'airport_name': 'San Francisco International Airport', 'lat': 37.7749, 'lon': -122.4194},
+    'Miami': {'country': 'United States', 'admin': 'Florida', 'type': 'city', 'population': 470000, 'airport_codes': ['MIA'], 'airport_name': 'Miami International Airport', 'lat': 25.7617, 'lon': -80.1918},
+    'Las Vegas': {'country': 'United States', 'admin': 'Nevada', 'type': 'city', 'population': 650000, 'airport_codes': ['LAS'], 'airport_name': 'McCarran International Airport', 'lat': 36.1699, 'lon': -115.1398},
+    'Orlando': {'country': 'United States', 'admin': 'Florida', 'type': 'city', 'population': 280000, 'airport_codes': ['MCO'], 'airport_name': 'Orlando International Airport', 'lat': 28.5383, 'lon': -81.3792},
+    'Seattle': {'country': 'United States', 'admin': 'Washington', 'type': 'city', 'population': 750000, 'airport_codes': ['SEA'], 'airport_name': 'Seattle-Tacoma International Airport', 'lat': 47.6062, 'lon': -122.3321},
+    'Boston': {'country': 'United States', 'admin': 'Massachusetts', 'type': 'city', 'population': 690000, 'airport_codes': ['BOS'], 'airport_name': 'Logan International Airport', 'lat': 42.3601, 'lon': -71.0589},
+    'Washington': {'country': 'United States', 'admin': 'District of Columbia', 'type': 'city', 'population': 710000, 'airport_codes': ['DCA', 'IAD'], 'airport_name': 'Ronald Reagan Washington National Airport', 'lat': 38.9072, 'lon': -77.0369},
     
     # Canada with Airport Codes
-    'Toronto': {'country': 'Canada', 'admin': 'Ontario', 'type': 'city', 'population': 3000000, 'airport_codes': ['YYZ'], 'airport_name': 'Toronto Pearson International Airport'},
-    'Vancouver': {'country': 'Canada', 'admin': 'British Columbia', 'type': 'city', 'population': 2500000, 'airport_codes': ['YVR'], 'airport_name': 'Vancouver International Airport'},
-    'Montreal': {'country': 'Canada', 'admin': 'Quebec', 'type': 'city', 'population': 1800000, 'airport_codes': ['YUL'], 'airport_name': 'Montreal-Pierre Elliott Trudeau International Airport'},
-    'Calgary': {'country': 'Canada', 'admin': 'Alberta', 'type': 'city', 'population': 1400000, 'airport_codes': ['YYC'], 'airport_name': 'Calgary International Airport'},
-    'Ottawa': {'country': 'Canada', 'admin': 'Ontario', 'type': 'city', 'population': 1000000, 'airport_codes': ['YOW'], 'airport_name': 'Ottawa Macdonald-Cartier International Airport'},
+    'Toronto': {'country': 'Canada', 'admin': 'Ontario', 'type': 'city', 'population': 3000000, 'airport_codes': ['YYZ'], 'airport_name': 'Toronto Pearson International Airport', 'lat': 43.6532, 'lon': -79.3832},
+    'Vancouver': {'country': 'Canada', 'admin': 'British Columbia', 'type': 'city', 'population': 2500000, 'airport_codes': ['YVR'], 'airport_name': 'Vancouver International Airport', 'lat': 49.2827, 'lon': -123.1207},
+    'Montreal': {'country': 'Canada', 'admin': 'Quebec', 'type': 'city', 'population': 1800000, 'airport_codes': ['YUL'], 'airport_name': 'Montreal-Pierre Elliott Trudeau International Airport', 'lat': 45.5017, 'lon': -73.5673},
+    'Calgary': {'country': 'Canada', 'admin': 'Alberta', 'type': 'city', 'population': 1400000, 'airport_codes': ['YYC'], 'airport_name': 'Calgary International Airport', 'lat': 51.0447, 'lon': -114.0719},
+    'Ottawa': {'country': 'Canada', 'admin': 'Ontario', 'type': 'city', 'population': 1000000, 'airport_codes': ['YOW'], 'airport_name': 'Ottawa Macdonald-Cartier International Airport', 'lat': 45.4215, 'lon': -75.6972},
     
     # OCEANIA with Airport Codes
-    'Sydney': {'country': 'Australia', 'admin': 'New South Wales', 'type': 'city', 'population': 5300000, 'airport_codes': ['SYD'], 'airport_name': 'Sydney Kingsford Smith Airport'},
-    'Melbourne': {'country': 'Australia', 'admin': 'Victoria', 'type': 'city', 'population': 5100000, 'airport_codes': ['MEL'], 'airport_name': 'Melbourne Airport'},
-    'Brisbane': {'country': 'Australia', 'admin': 'Queensland', 'type': 'city', 'population': 2600000, 'airport_codes': ['BNE'], 'airport_name': 'Brisbane Airport'},
-    'Perth': {'country': 'Australia', 'admin': 'Western Australia', 'type': 'city', 'population': 2100000, 'airport_codes': ['PER'], 'airport_name': 'Perth Airport'},
-    'Auckland': {'country': 'New Zealand', 'admin': 'Auckland', 'type': 'city', 'population': 1700000, 'airport_codes': ['AKL'], 'airport_name': 'Auckland Airport'},
-    'Wellington': {'country': 'New Zealand', 'admin': 'Wellington', 'type': 'city', 'population': 420000, 'airport_codes': ['WLG'], 'airport_name': 'Wellington Airport'},
+    'Sydney': {'country': 'Australia', 'admin': 'New South Wales', 'type': 'city', 'population': 5300000, 'airport_codes': ['SYD'], 'airport_name': 'Sydney Kingsford Smith Airport', 'lat': -33.8688, 'lon': 151.2093},
+    'Melbourne': {'country': 'Australia', 'admin': 'Victoria', 'type': 'city', 'population': 5100000, 'airport_codes': ['MEL'], 'airport_name': 'Melbourne Airport', 'lat': -37.8136, 'lon': 144.9631},
+    'Brisbane': {'country': 'Australia', 'admin': 'Queensland', 'type': 'city', 'population': 2600000, 'airport_codes': ['BNE'], 'airport_name': 'Brisbane Airport', 'lat': -27.4698, 'lon': 153.0251},
+    'Perth': {'country': 'Australia', 'admin': 'Western Australia', 'type': 'city', 'population': 2100000, 'airport_codes': ['PER'], 'airport_name': 'Perth Airport', 'lat': -31.9505, 'lon': 115.8605},
+    'Auckland': {'country': 'New Zealand', 'admin': 'Auckland', 'type': 'city', 'population': 1700000, 'airport_codes': ['AKL'], 'airport_name': 'Auckland Airport', 'lat': -36.8485, 'lon': 174.7633},
+    'Wellington': {'country': 'New Zealand', 'admin': 'Wellington', 'type': 'city', 'population': 420000, 'airport_codes': ['WLG'], 'airport_name': 'Wellington Airport', 'lat': -41.2865, 'lon': 174.7762},
     
     # CAUCASUS REGION with Airport Codes
-    'Baku': {'country': 'Azerbaijan', 'admin': 'Baku', 'type': 'city', 'population': 2300000, 'airport_codes': ['GYD'], 'airport_name': 'Heydar Aliyev International Airport'},
-    'Gabala': {'country': 'Azerbaijan', 'admin': 'Gabala', 'type': 'city', 'population': 13000, 'airport_codes': ['GBB'], 'airport_name': 'Gabala International Airport'},
-    'Tbilisi': {'country': 'Georgia', 'admin': 'Tbilisi', 'type': 'city', 'population': 1100000, 'airport_codes': ['TBS'], 'airport_name': 'Shota Rustaveli Tbilisi International Airport'},
-    'Yerevan': {'country': 'Armenia', 'admin': 'Yerevan', 'type': 'city', 'population': 1100000, 'airport_codes': ['EVN'], 'airport_name': 'Zvartnots International Airport'},
+    'Baku': {'country': 'Azerbaijan', 'admin': 'Baku', 'type': 'city', 'population': 2300000, 'airport_codes': ['GYD'], 'airport_name': 'Heydar Aliyev International Airport', 'lat': 40.4093, 'lon': 49.8671},
+    'Gabala': {'country': 'Azerbaijan', 'admin': 'Gabala', 'type': 'city', 'population': 13000, 'airport_codes': ['GBB'], 'airport_name': 'Gabala International Airport', 'lat': 40.9982, 'lon': 47.87},
+    'Tbilisi': {'country': 'Georgia', 'admin': 'Tbilisi', 'type': 'city', 'population': 1100000, 'airport_codes': ['TBS'], 'airport_name': 'Shota Rustaveli Tbilisi International Airport', 'lat': 41.7151, 'lon': 44.8271},
+    'Yerevan': {'country': 'Armenia', 'admin': 'Yerevan', 'type': 'city', 'population': 1100000, 'airport_codes': ['EVN'], 'airport_name': 'Zvartnots International Airport', 'lat': 40.1792, 'lon': 44.4991},
     
     # Additional destinations with basic airport info
-    'Barcelona': {'country': 'Spain', 'admin': 'Catalonia', 'type': 'city', 'population': 1600000, 'airport_codes': ['BCN'], 'airport_name': 'Barcelona-El Prat Airport'},
-    'Zurich': {'country': 'Switzerland', 'admin': 'Zurich', 'type': 'city', 'population': 1400000, 'airport_codes': ['ZUR'], 'airport_name': 'Zurich Airport'},
-    'Geneva': {'country': 'Switzerland', 'admin': 'Geneva', 'type': 'city', 'population': 500000, 'airport_codes': ['GVA'], 'airport_name': 'Geneva Airport'},
-    'Brussels': {'country': 'Belgium', 'admin': 'Brussels', 'type': 'city', 'population': 1200000, 'airport_codes': ['BRU'], 'airport_name': 'Brussels Airport'},
-    'Dublin': {'country': 'Ireland', 'admin': 'Leinster', 'type': 'city', 'population': 1400000, 'airport_codes': ['DUB'], 'airport_name': 'Dublin Airport'},
-    'Lisbon': {'country': 'Portugal', 'admin': 'Lisbon', 'type': 'city', 'population': 2900000, 'airport_codes': ['LIS'], 'airport_name': 'Lisbon Airport'},
+    'Barcelona': {'country': 'Spain', 'admin': 'Catalonia', 'type': 'city', 'population': 1600000, 'airport_codes': ['BCN'], 'airport_name': 'Barcelona-El Prat Airport', 'lat': 41.3874, 'lon': 2.1686},
+    'Zurich': {'country': 'Switzerland', 'admin': 'Zurich', 'type': 'city', 'population': 1400000, 'airport_codes': ['ZRH'], 'airport_name': 'Zurich Airport', 'lat': 47.3769, 'lon': 8.5417},
+    'Geneva': {'country': 'Switzerland', 'admin': 'Geneva', 'type': 'city', 'population': 500000, 'airport_codes': ['GVA'], 'airport_name': 'Geneva Airport', 'lat': 46.2044, 'lon': 6.1432},
+    'Brussels': {'country': 'Belgium', 'admin': 'Brussels', 'type': 'city', 'population': 1200000, 'airport_codes': ['BRU'], 'airport_name': 'Brussels Airport', 'lat': 50.8503, 'lon': 4.3517},
+    'Dublin': {'country': 'Ireland', 'admin': 'Leinster', 'type': 'city', 'population': 1400000, 'airport_codes': ['DUB'], 'airport_name': 'Dublin Airport', 'lat': 53.3498, 'lon': -6.2603},
+    'Lisbon': {'country': 'Portugal', 'admin': 'Lisbon', 'type': 'city', 'population': 2900000, 'airport_codes': ['LIS'], 'airport_name': 'Lisbon Airport', 'lat': 38.7223, 'lon': -9.1393},
     
     # Countries as searchable entities (without airport codes for countries)
-    'United States': {'country': 'United States', 'admin': '', 'type': 'country', 'population': 331900000, 'airport_codes': [], 'airport_name': 'Multiple Airports'},
-    'United Kingdom': {'country': 'United Kingdom', 'admin': '', 'type': 'country', 'population': 67800000, 'airport_codes': [], 'airport_name': 'Multiple Airports'},
-    'Germany': {'country': 'Germany', 'admin': '', 'type': 'country', 'population': 83200000, 'airport_codes': [], 'airport_name': 'Multiple Airports'},
-    'France': {'country': 'France', 'admin': '', 'type': 'country', 'population': 67800000, 'airport_codes': [], 'airport_name': 'Multiple Airports'},
-    'Japan': {'country': 'Japan', 'admin': '', 'type': 'country', 'population': 125800000, 'airport_codes': [], 'airport_name': 'Multiple Airports'},
-    'Australia': {'country': 'Australia', 'admin': '', 'type': 'country', 'population': 25700000, 'airport_codes': [], 'airport_name': 'Multiple Airports'},
-    'India': {'country': 'India', 'admin': '', 'type': 'country', 'population': 1380000000, 'airport_codes': [], 'airport_name': 'Multiple Airports'},
-    'China': {'country': 'China', 'admin': '', 'type': 'country', 'population': 1440000000, 'airport_codes': [], 'airport_name': 'Multiple Airports'},
+    'United States': {'country': 'United States', 'admin': '', 'type': 'country', 'population': 331900000, 'airport_codes': [], 'airport_name': 'Multiple Airports', 'lat': 38.9072, 'lon': -77.0369},
+    'United Kingdom': {'country': 'United Kingdom', 'admin': '', 'type': 'country', 'population': 67800000, 'airport_codes': [], 'airport_name': 'Multiple Airports', 'lat': 51.5074, 'lon': -0.1278},
+    'Germany': {'country': 'Germany', 'admin': '', 'type': 'country', 'population': 83200000, 'airport_codes': [], 'airport_name': 'Multiple Airports', 'lat': 52.52, 'lon': 13.405},
+    'France': {'country': 'France', 'admin': '', 'type': 'country', 'population': 67800000, 'airport_codes': [], 'airport_name': 'Multiple Airports', 'lat': 48.8566, 'lon': 2.3522},
+    'Japan': {'country': 'Japan', 'admin': '', 'type': 'country', 'population': 125800000, 'airport_codes': [], 'airport_name': 'Multiple Airports', 'lat': 35.6762, 'lon': 139.6503},
+    'Australia': {'country': 'Australia', 'admin': '', 'type': 'country', 'population': 25700000, 'airport_codes': [], 'airport_name': 'Multiple Airports', 'lat': -35.2809, 'lon': 149.13},
+    'India': {'country': 'India', 'admin': '', 'type': 'country', 'population': 1380000000, 'airport_codes': [], 'airport_name': 'Multiple Airports', 'lat': 28.6139, 'lon': 77.209},
+    'China': {'country': 'China', 'admin': '', 'type': 'country', 'population': 1440000000, 'airport_codes': [], 'airport_name': 'Multiple Airports', 'lat': 39.9042, 'lon': 116.4074},
+}
+
+# IATA code -> (ICAO code, airport name) for every airport in WORLD_LOCATIONS
+AIRPORTS = {
+    # Europe
+    'LHR': ('EGLL', 'Heathrow Airport'),
+    'LGW': ('EGKK', 'Gatwick Airport'),
+    'STN': ('EGSS', 'London Stansted Airport'),
+    'LTN': ('EGGW', 'London Luton Airport'),
+    'CDG': ('LFPG', 'Charles de Gaulle Airport'),
+    'ORY': ('LFPO', 'Paris Orly Airport'),
+    'BER': ('EDDB', 'Berlin Brandenburg Airport'),
+    'MUC': ('EDDM', 'Munich Airport'),
+    'MAD': ('LEMD', 'Madrid-Barajas Airport'),
+    'BCN': ('LEBL', 'Barcelona-El Prat Airport'),
+    'FCO': ('LIRF', 'Leonardo da Vinci Airport'),
+    'CIA': ('LIRA', 'Rome Ciampino Airport'),
+    'AMS': ('EHAM', 'Amsterdam Schiphol Airport'),
+    'VIE': ('LOWW', 'Vienna International Airport'),
+    'WAW': ('EPWA', 'Warsaw Chopin Airport'),
+    'PRG': ('LKPR', 'Václav Havel Airport Prague'),
+    'BUD': ('LHBP', 'Budapest Ferenc Liszt International Airport'),
+    'ARN': ('ESSA', 'Stockholm Arlanda Airport'),
+    'BMA': ('ESSB', 'Stockholm Bromma Airport'),
+    'GOT': ('ESGG', 'Gothenburg Landvetter Airport'),
+    'MMX': ('ESMS', 'Malmö Airport'),
+    'CPH': ('EKCH', 'Copenhagen Airport'),
+    'OSL': ('ENGM', 'Oslo Gardermoen Airport'),
+    'HEL': ('EFHK', 'Helsinki-Vantaa Airport'),
+    'KEF': ('BIKF', 'Keflavík International Airport'),
+    'ZRH': ('LSZH', 'Zurich Airport'),
+    'GVA': ('LSGG', 'Geneva Airport'),
+    'BRU': ('EBBR', 'Brussels Airport'),
+    'DUB': ('EIDW', 'Dublin Airport'),
+    'LIS': ('LPPT', 'Lisbon Airport'),
+    'IST': ('LTFM', 'Istanbul Airport'),
+    'SAW': ('LTFJ', 'Sabiha Gökçen International Airport'),
+    # Middle East and Caucasus
+    'DXB': ('OMDB', 'Dubai International Airport'),
+    'DWC': ('OMDW', 'Al Maktoum International Airport'),
+    'AUH': ('OMAA', 'Abu Dhabi International Airport'),
+    'DOH': ('OTHH', 'Hamad International Airport'),
+    'KWI': ('OKKK', 'Kuwait International Airport'),
+    'RUH': ('OERK', 'King Khalid International Airport'),
+    'JED': ('OEJN', 'King Abdulaziz International Airport'),
+    'MCT': ('OOMS', 'Muscat International Airport'),
+    'BAH': ('OBBI', 'Bahrain International Airport'),
+    'IKA': ('OIIE', 'Imam Khomeini International Airport'),
+    'THR': ('OIII', 'Mehrabad International Airport'),
+    'GYD': ('UBBB', 'Heydar Aliyev International Airport'),
+    'GBB': ('UBBQ', 'Gabala International Airport'),
+    'TBS': ('UGTB', 'Shota Rustaveli Tbilisi International Airport'),
+    'EVN': ('UDYZ', 'Zvartnots International Airport'),
+    # Asia
+    'NRT': ('RJAA', 'Narita International Airport'),
+    'HND': ('RJTT', 'Haneda Airport'),
+    'KIX': ('RJBB', 'Kansai International Airport'),
+    'ITM': ('RJOO', 'Osaka International Airport'),
+    'ICN': ('RKSI', 'Incheon International Airport'),
+    'GMP': ('RKSS', 'Gimpo International Airport'),
+    'PEK': ('ZBAA', 'Beijing Capital International Airport'),
+    'PKX': ('ZBAD', 'Beijing Daxing International Airport'),
+    'PVG': ('ZSPD', 'Shanghai Pudong International Airport'),
+    'SHA': ('ZSSS', 'Shanghai Hongqiao International Airport'),
+    'HKG': ('VHHH', 'Hong Kong International Airport'),
+    'TPE': ('RCTP', 'Taiwan Taoyuan International Airport'),
+    'TSA': ('RCSS', 'Taipei Songshan Airport'),
+    'BOM': ('VABB', 'Chhatrapati Shivaji Maharaj International Airport'),
+    'DEL': ('VIDP', 'Indira Gandhi International Airport'),
+    'BLR': ('VOBL', 'Kempegowda International Airport'),
+    'MAA': ('VOMM', 'Chennai International Airport'),
+    'HYD': ('VOHS', 'Rajiv Gandhi International Airport'),
+    'CCU': ('VECC', 'Netaji Subhas Chandra Bose International Airport'),
+    'CMB': ('VCBI', 'Bandaranaike International Airport'),
+    'SIN': ('WSSS', 'Singapore Changi Airport'),
+    'BKK': ('VTBS', 'Suvarnabhumi Airport'),
+    'DMK': ('VTBD', 'Don Mueang International Airport'),
+    'HKT': ('VTSP', 'Phuket International Airport'),
+    'KUL': ('WMKK', 'Kuala Lumpur International Airport'),
+    'CGK': ('WIII', 'Soekarno-Hatta International Airport'),
+    'MNL': ('RPLL', 'Ninoy Aquino International Airport'),
+    'SGN': ('VVTS', 'Tan Son Nhat International Airport'),
+    'HAN': ('VVNB', 'Noi Bai International Airport'),
+    # North America
+    'JFK': ('KJFK', 'John F. Kennedy International Airport'),
+    'LGA': ('KLGA', 'LaGuardia Airport'),
+    'EWR': ('KEWR', 'Newark Liberty International Airport'),
+    'LAX': ('KLAX', 'Los Angeles International Airport'),
+    'ORD': ('KORD', "O'Hare International Airport"),
+    'MDW': ('KMDW', 'Chicago Midway International Airport'),
+    'SFO': ('KSFO', 'San Francisco International Airport'),
+    'MIA': ('KMIA', 'Miami International Airport'),
+    'LAS': ('KLAS', 'Harry Reid International Airport'),
+    'MCO': ('KMCO', 'Orlando International Airport'),
+    'SEA': ('KSEA', 'Seattle-Tacoma International Airport'),
+    'BOS': ('KBOS', 'Logan International Airport'),
+    'DCA': ('KDCA', 'Ronald Reagan Washington National Airport'),
+    'IAD': ('KIAD', 'Washington Dulles International Airport'),
+    'YYZ': ('CYYZ', 'Toronto Pearson International Airport'),
+    'YVR': ('CYVR', 'Vancouver International Airport'),
+    'YUL': ('CYUL', 'Montreal-Pierre Elliott Trudeau International Airport'),
+    'YYC': ('CYYC', 'Calgary International Airport'),
+    'YOW': ('CYOW', 'Ottawa Macdonald-Cartier International Airport'),
+    # Oceania
+    'SYD': ('YSSY', 'Sydney Kingsford Smith Airport'),
+    'MEL': ('YMML', 'Melbourne Airport'),
+    'BNE': ('YBBN', 'Brisbane Airport'),
+    'PER': ('YPPH', 'Perth Airport'),
+    'AKL': ('NZAA', 'Auckland Airport'),
+    'WLG': ('NZWN', 'Wellington Airport'),
 }
 
-# Create reverse mapping for airport codes
+# Create reverse mapping for airport codes (IATA and ICAO)
 AIRPORT_CODE_TO_CITY = {}
 for city, data in WORLD_LOCATIONS.items():
     if 'airport_codes' in data:
         for code in data['airport_codes']:
             AIRPORT_CODE_TO_CITY[code.upper()] = city
+            if code in AIRPORTS:
+                AIRPORT_CODE_TO_CITY[AIRPORTS[code][0]] = city
+
+# Alternate names users search for (former names, local names, transliterations
+# and abbreviations), by canonical WORLD_LOCATIONS name. Spellings that differ
+# only in accents or case need no entry; search folds those already.
+LOCATION_ALIASES = {
+    'Mumbai': ['Bombay'],
+    'Munich': ['München', 'Muenchen'],
+    'Beijing': ['Peking', 'Peiping'],
+    'Dubai': ['Dubayy'],
+    'New York': ['NYC', 'New York City'],
+    'Chennai': ['Madras'],
+    'Kolkata': ['Calcutta'],
+    'Bangalore': ['Bengaluru'],
+    'Ho Chi Minh City': ['Saigon', 'HCMC'],
+    'Vienna': ['Wien'],
+    'Prague': ['Praha'],
+    'Rome': ['Roma'],
+    'Lisbon': ['Lisboa'],
+    'Copenhagen': ['København', 'Koebenhavn'],
+    'Warsaw': ['Warszawa'],
+    'Brussels': ['Bruxelles', 'Brussel'],
+    'Geneva': ['Genève', 'Genf'],
+    'Gothenburg': ['Göteborg'],
+    'Istanbul': ['Constantinople'],
+    'Tehran': ['Teheran'],
+    'Tbilisi': ['Tiflis'],
+    'Jeddah': ['Jiddah', 'Jedda'],
+    'Delhi': ['New Delhi'],
+    'Los Angeles': ['LA'],
+    'San Francisco': ['SF'],
+    'Las Vegas': ['Vegas'],
+    'Washington': ['Washington DC'],
+    'Kuala Lumpur': ['KL'],
+    'Hong Kong': ['HK'],
+    'United Kingdom': ['UK', 'Great Britain', 'Britain'],
+    'United States': ['USA', 'US', 'America'],
+    'Germany': ['Deutschland'],
+    'Sweden': ['Sverige'],
+    'Japan': ['Nippon'],
+}
 
 def get_location_by_name(name: str) -> dict:
     """Get location data by name"""
     return WORLD_LOCATIONS.get(name, None)
 
 def get_location_by_airport_code(code: str) -> dict:
-    """Get location data by airport code (e.g., 'DXB' -> Dubai data)"""
+    """Get location data by IATA or ICAO airport code (e.g., 'DXB' or 'OMDB' -> Dubai data)"""
     code = code.upper()
     if code in AIRPORT_CODE_TO_CITY:
         city_name = AIRPORT_CODE_TO_CITY[code]
         return WORLD_LOCATIONS.get(city_name, None)
     return None
 
-def search_locations_by_query(query: str, limit: int = 10) -> list:
-    """Enhanced search that includes airport codes"""
+# Relevance of a match: the matched field's weight, scaled by how closely the
+# query fits the field (the whole field, a prefix, a word start, or further
+# inside), plus a log-population term so that bigger places win between
+# otherwise similar matches
+MATCH_TYPE_WEIGHTS = {
+    'airport_code': 5.0,
+    'city_name': 4.0,
+    'alias': 3.5,
+    'airport_name': 3.0,
+    'admin_region': 2.0,
+    'country_name': 1.5,
+}
+EXACT_MATCH_FACTOR = 3.0
+PREFIX_MATCH_FACTOR = 2.0
+WORD_MATCH_FACTOR = 1.5
+POSITION_DECAY = 0.1
+POPULATION_WEIGHT = 0.25
+# Each further airport of a city (airport_codes order) counts this much less
+SECONDARY_AIRPORT_FACTOR = 0.8
+
+# Match types found through the n-gram index; airport codes and names come from
+# the code index instead
+_FIELD_MATCH_TYPES = ('city_name', 'alias', 'admin_region', 'country_name')
+
+# N-gram inverted index over WORLD_LOCATIONS (built on the first search)
+# Every field is folded once with normalize_search_text (accents stripped,
+# casefolded) into per-row search keys; the index maps every 1-3 character
+# substring of a row's keys to the sorted row ids containing it, so a query only
+# verifies candidate rows instead of scanning the whole gazetteer. Aliases are
+# indexed like names, and their folded forms map straight to their row.
+# Per match type, the rows whose field equals a folded value, and those whose
+# field or one of its later words starts with each 1-3 character prefix, are
+# indexed as well, so the strongest kinds of match are verified first and a
+# short query stops once no other row could rank, instead of verifying every
+# row containing it. Once limit matches are held, each tier verifies at most
+# MAX_TIER_CANDIDATES more rows, so latency stays flat when thousands of
+# equally populous rows match alike (a less populous row of a long tier that
+# would have ranked by a closer match may then be left out).
+# IATA codes, ICAO codes and airport names go into a separate prefix trie.
+NGRAM_SIZE = 3
+# Rows a tier verifies once limit matches are held
+MAX_TIER_CANDIDATES = 64
+CODE_INDEX_TOP_K = 20
+# Generic words of airport names that do not identify an airport on their own
+AIRPORT_NAME_STOPWORDS = {'airport', 'international'}
+
+_INDEX_NAMES = []
+_POPULATIONS = []
+_NAME_KEYS = []
+_COUNTRY_KEYS = []
+_ADMIN_KEYS = []
+_ALIAS_KEYS = []    # per row: tuple of (folded alias, original alias)
+_ALIAS_INDEX = {}   # folded alias -> row
+_NGRAMS = {}
+# match type -> folded field value -> sorted row ids with that field equal to it
+_EXACT_ROWS = {}
+# match type -> 1-3 character prefix -> sorted row ids with a field starting with it
+_PREFIXES = {}
+# match type -> 1-3 character prefix -> sorted row ids with a later word of a field starting with it
+_WORD_STARTS = {}
+# Items are (row, airport rank, IATA code, match type, folded field, position of key in field)
+_CODE_INDEX = PrefixTrie(top_k=CODE_INDEX_TOP_K)
+_CODE_EXACT = {}    # folded IATA/ICAO code -> every item for it, best first (the trie keeps only the top k)
+_INDEX_READY = False
+_INDEX_LOCK = threading.Lock()
+
+# Results of search_locations_by_query, shared by every caller in the process
+_QUERY_CACHE = LocationCache(max_size=1024)
+
+def _ngrams(text: str) -> set:
+    """All substrings of text up to NGRAM_SIZE characters long"""
+    grams = set()
+    for size in range(1, NGRAM_SIZE + 1):
+        for i in range(len(text) - size + 1):
+            grams.add(text[i:i + size])
+    return grams
+
+def _query_ngrams(text: str) -> set:
+    """Grams every field containing text as a substring must also contain"""
+    if len(text) <= NGRAM_SIZE:
+        return {text}
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+def _prefix_grams(text: str) -> set:
+    """Prefixes of text up to NGRAM_SIZE characters long"""
+    return {text[:size] for size in range(1, min(NGRAM_SIZE, len(text)) + 1)}
+
+def _word_start_grams(text: str) -> set:
+    """Prefixes up to NGRAM_SIZE characters long of the words of text after the
+    first (starting after a non-alphanumeric character, as in score_match)"""
+    grams = set()
+    for i in range(1, len(text)):
+        if not text[i - 1].isalnum():
+            grams |= _prefix_grams(text[i:])
+    return grams
+
+def rebuild_search_index() -> None:
+    """Rebuild the search keys and n-gram index (call after adding entries to WORLD_LOCATIONS)"""
+    # Rows are numbered by descending population, so candidates stream biggest
+    # first and the top-k scan can stop once no later row could rank
+    names = sorted(WORLD_LOCATIONS, key=lambda name: -WORLD_LOCATIONS[name].get('population', 0))
+    name_keys, country_keys, admin_keys, alias_keys = [], [], [], []
+    alias_index = {}
+    ngrams = {}
+    exact_rows = {match_type: {} for match_type in _FIELD_MATCH_TYPES}
+    prefixes = {match_type: {} for match_type in _FIELD_MATCH_TYPES}
+    word_starts = {match_type: {} for match_type in _FIELD_MATCH_TYPES}
+    code_index = PrefixTrie(top_k=CODE_INDEX_TOP_K)
+    code_exact = {}
+    # Countries, regions and codes repeat across rows; fold each distinct value once
+    folded = {}
+    
+    def fold(text: str) -> str:
+        key = folded.get(text)
+        if key is None:
+            key = folded[text] = normalize_search_text(text)
+        return key
+    
+    for row, name in enumerate(names):
+        data = WORLD_LOCATIONS[name]
+        name_key = normalize_search_text(name)
+        country_key = fold(data['country'])
+        admin_key = fold(data.get('admin') or '')
+        aliases = tuple((normalize_search_text(alias), alias) for alias in LOCATION_ALIASES.get(name, ()))
+        name_keys.append(name_key)
+        country_keys.append(country_key)
+        admin_keys.append(admin_key)
+        alias_keys.append(aliases)
+        for alias_key, _ in aliases:
+            alias_index.setdefault(alias_key, row)
+        
+        fields = [('city_name', name_key), ('country_name', country_key), ('admin_region', admin_key)]
+        fields += [('alias', key) for key, _ in aliases]
+        grams = set()
+        type_grams = {match_type: (set(), set(), set()) for match_type in _FIELD_MATCH_TYPES}
+        for match_type, key in fields:
+            grams |= _ngrams(key)
+            exact_keys, prefix_keys, word_keys = type_grams[match_type]
+            exact_keys.add(key)
+            prefix_keys |= _prefix_grams(key)
+            word_keys |= _word_start_grams(key)
+        for gram in grams:
+            ngrams.setdefault(gram, array('I')).append(row)
+        for match_type, type_indexes in type_grams.items():
+            for index, keys in zip((exact_rows, prefixes, word_starts), type_indexes):
+                for key in keys:
+                    index[match_type].setdefault(key, array('I')).append(row)
+        
+        # Airports: IATA and ICAO codes, and every word start of the airport
+        # name, ranked so a city's primary airport comes before its others
+        for rank, code in enumerate(data.get('airport_codes', [])):
+            icao, airport_name = AIRPORTS.get(code, ('', data.get('airport_name', '') if rank == 0 else ''))
+            score = data.get('population', 0) * SECONDARY_AIRPORT_FACTOR ** rank
+            for key in (fold(code), fold(icao)):
+                if key:
+                    item = (row, rank, code, 'airport_code', key, 0)
+                    code_index.insert(key, item, score)
+                    code_exact.setdefault(key, []).append(item)
+            airport_key = fold(airport_name)
+            for key in word_start_keys(airport_key):
+                if key.split(' ', 1)[0] not in AIRPORT_NAME_STOPWORDS:
+                    position = len(airport_key) - len(key)
+                    code_index.insert(key, (row, rank, code, 'airport_name', airport_key, position), score)
+    code_index.finalize()
+    populations = [WORLD_LOCATIONS[name].get('population', 0) for name in names]
+    for items in code_exact.values():
+        items.sort(key=lambda item: (-score_match(item[3], item[4], item[5], len(item[4]),
+                                                  populations[item[0]], item[1]), item[0]))
+    
+    global _INDEX_NAMES, _NAME_KEYS, _COUNTRY_KEYS, _ADMIN_KEYS, _ALIAS_KEYS
+    global _POPULATIONS, _ALIAS_INDEX, _NGRAMS, _EXACT_ROWS, _PREFIXES, _WORD_STARTS
+    global _CODE_INDEX, _CODE_EXACT, _INDEX_READY
+    _INDEX_NAMES, _NGRAMS = names, ngrams
+    _EXACT_ROWS, _PREFIXES, _WORD_STARTS = exact_rows, prefixes, word_starts
+    _CODE_INDEX, _CODE_EXACT = code_index, code_exact
+    _POPULATIONS = populations
+    _NAME_KEYS, _COUNTRY_KEYS, _ADMIN_KEYS = name_keys, country_keys, admin_keys
+    _ALIAS_KEYS, _ALIAS_INDEX = alias_keys, alias_index
+    _QUERY_CACHE.clear()
+    _INDEX_READY = True
+
+def _ensure_search_index() -> None:
+    """Build the search index if no search has needed it yet"""
+    if not _INDEX_READY:
+        with _INDEX_LOCK:
+            if not _INDEX_READY:
+                rebuild_search_index()
+
+def _matching_rows(index: dict, query: str, starts: Optional[dict] = None):
+    """Lazily yield, in row order, rows whose postings hold every gram of query
+
+    With starts (a _PREFIXES or _WORD_STARTS entry), only rows that it lists
+    for the first NGRAM_SIZE characters of query.
+    """
+    grams = [(index, gram) for gram in _query_ngrams(query)]
+    if starts is not None:
+        grams.append((starts, query[:NGRAM_SIZE]))
+    postings = []
+    for gram_index, gram in grams:
+        posting = gram_index.get(gram)
+        if posting is None:
+            return
+        postings.append(posting)
+    
+    # Leapfrog intersection: each posting skips (by binary search) straight to
+    # the first row that is not below the current candidate
+    postings.sort(key=len)
+    positions = [0] * len(postings)
+    candidate = 0
+    while True:
+        for i, posting in enumerate(postings):
+            position = bisect_left(posting, candidate, positions[i])
+            if position == len(posting):
+                return
+            positions[i] = position
+            if posting[position] != candidate:
+                candidate = posting[position]
+                break
+        else:
+            yield candidate
+            candidate += 1
+
+def _candidate_rows(query_key: str, starts: Optional[dict] = None):
+    """Superset of rows that can match, most populous first (with starts, of
+    rows that can match where starts says)"""
+    if not query_key:
+        return iter(range(len(_INDEX_NAMES)))
+    return _matching_rows(_NGRAMS, query_key, starts)
+
+def _candidate_tiers(query_key: str) -> List[tuple]:
+    """(rows, closeness) tiers covering every candidate, by decreasing closeness
+
+    Rows of a tier that are in no earlier tier match with at most its
+    closeness: exact, prefix and word-start matches of each match type, and
+    last every row containing the query, inside a word or as a weaker match.
+    """
+    inner_closeness = max(MATCH_TYPE_WEIGHTS[match_type] for match_type in _FIELD_MATCH_TYPES) / (1.0 + POSITION_DECAY)
+    tiers = []
+    for match_type in _FIELD_MATCH_TYPES:
+        weight = MATCH_TYPE_WEIGHTS[match_type]
+        if query_key in _EXACT_ROWS[match_type]:
+            tiers.append((EXACT_MATCH_FACTOR * weight, iter(_EXACT_ROWS[match_type][query_key])))
+        tiers.append((PREFIX_MATCH_FACTOR * weight, _candidate_rows(query_key, _PREFIXES[match_type])))
+        tiers.append((WORD_MATCH_FACTOR * weight, _candidate_rows(query_key, _WORD_STARTS[match_type])))
+    # Weaker matches are verified with the last tier, which covers them all
+    tiers = sorted((tier for tier in tiers if tier[0] > inner_closeness), key=lambda tier: -tier[0])
+    return [(rows, closeness) for closeness, rows in tiers] + [(_candidate_rows(query_key), inner_closeness)]
+
+def score_match(match_type: str, field: str, position: int, query_length: int,
+                population: int, airport_rank: int = 0) -> float:
+    """Relevance of a query of query_length found at position in a folded field
+
+    airport_rank is the position of the matched airport in its city's
+    airport_codes (0 for the primary airport).
+    """
+    if position == 0:
+        closeness = EXACT_MATCH_FACTOR if query_length == len(field) else PREFIX_MATCH_FACTOR
+    elif not field[position - 1].isalnum():
+        closeness = WORD_MATCH_FACTOR
+    else:
+        closeness = 1.0 / (1.0 + POSITION_DECAY * position)
+    if match_type == 'airport_code':
+        # Codes are short and typed whole; a partial code counts in proportion
+        closeness *= query_length / len(field)
+    closeness *= SECONDARY_AIRPORT_FACTOR ** airport_rank
+    return MATCH_TYPE_WEIGHTS[match_type] * closeness + POPULATION_WEIGHT * math.log10(1 + max(population, 0))
+
+def _score_row(row: int, query_key: str):
+    """(score, match type, matched alias) of a row's best-matching name, country,
+    admin region or alias, or None"""
+    population = _POPULATIONS[row]
+    fields = [('city_name', _NAME_KEYS[row], None), ('country_name', _COUNTRY_KEYS[row], None),
+              ('admin_region', _ADMIN_KEYS[row], None)]
+    fields += [('alias', alias_key, alias) for alias_key, alias in _ALIAS_KEYS[row]]
+    best = None
+    for match_type, field, matched in fields:
+        position = field.find(query_key)
+        if position != -1:
+            score = score_match(match_type, field, position, len(query_key), population)
+            if best is None or score > best[0]:
+                best = (score, match_type, matched)
+    return best
+
+def _airport_matches(query_key: str, limit: Optional[int] = None) -> dict:
+    """row -> (score, match type, matched IATA code) of its best airport whose
+    IATA code, ICAO code or name (any word) starts with query_key
+
+    One prefix lookup in the code index, O(len(query_key) + CODE_INDEX_TOP_K),
+    returning the top airports by primary-first, then population; airports
+    whose code equals query_key are included too, all of them or, with limit,
+    the best ones for limit rows (no other exact code match could rank).
+    """
+    best = {}
+    exact = _CODE_EXACT.get(query_key, [])
+    if limit is not None:
+        rows = set()
+        for end, item in enumerate(exact):
+            rows.add(item[0])
+            if len(rows) > limit:
+                exact = exact[:end]
+                break
+    items = _CODE_INDEX.search(query_key) + exact
+    for row, rank, code, match_type, field, position in items:
+        score = score_match(match_type, field, position, len(query_key), _POPULATIONS[row], rank)
+        if row not in best or score > best[row][0]:
+            best[row] = (score, match_type, code)
+    return best
+
+def search_locations_by_query(query: str, limit: int = 10, min_score: float = 0.0,
+                              stop_score: Optional[float] = None) -> list:
+    """Enhanced search that includes airport codes
+    
+    Matching ignores case and accents: 'zurich' finds 'Zürich' and vice versa.
+    Returns the limit best matches by score_match(), best first, each with its
+    'match_type' and 'score'. Matches scoring below min_score are dropped; once
+    limit matches score at least stop_score, the remaining candidates are not
+    examined.
+    """
     if not query:
         return [{'name': name, **WORLD_LOCATIONS[name]} for name in POPULAR_DESTINATIONS[:limit]]
     
+    _ensure_search_index()
     query_upper = query.upper().strip()
-    query_lower = query.lower().strip()
-    results = []
+    query_key = normalize_search_text(query)
+    # Callers get their own copies, so they may modify the result dicts
+    results = _QUERY_CACHE.get_or_compute(
+        (query_upper, query_key, limit, min_score, stop_score),
+        lambda: tuple(_search_uncached(query_upper, query_key, limit, min_score, stop_score))
+    )
+    return [result.copy() for result in results]
+
+def _search_uncached(query_upper: str, query_key: str, limit: int, min_score: float,
+                     stop_score: Optional[float]) -> list:
+    if limit <= 0:
+        return []
     
-    # First, check if query is an airport code
-    if len(query_upper) == 3 and query_upper in AIRPORT_CODE_TO_CITY:
-        city_name = AIRPORT_CODE_TO_CITY[query_upper]
-        data = WORLD_LOCATIONS[city_name]
-        result = data.copy()
-        result['name'] = city_name
-        result['match_type'] = 'airport_code'
-        result['matched_code'] = query_upper
-        results.append(result)
+    # Min-heap of the best matches so far: (score, -row, row, match type, matched)
+    heap = []
     
-    # Then search by city/country names and airport codes
-    for name, data in WORLD_LOCATIONS.items():
-        # Skip if already added by airport code
-        if results and results[0].get('name') == name:
-            continue
-            
-        # Search in city name
-        if query_lower in name.lower():
-            result = data.copy()
-            result['name'] = name
-            result['match_type'] = 'city_name'
-            results.append(result)
-            continue
-        
-        # Search in country name
-        if query_lower in data['country'].lower():
-            result = data.copy()
-            result['name'] = name
-            result['match_type'] = 'country_name'
-            results.append(result)
-            continue
-        
-        # Search in admin region
-        if data.get('admin') and query_lower in data['admin'].lower():
-            result = data.copy()
-            result['name'] = name
-            result['match_type'] = 'admin_region'
-            results.append(result)
-            continue
-        
-        # Search in airport codes
-        if 'airport_codes' in data:
-            for code in data['airport_codes']:
-                if query_upper in code:
-                    result = data.copy()
-                    result['name'] = name
-                    result['match_type'] = 'airport_code'
-                    result['matched_code'] = code
-                    results.append(result)
+    def offer(row: int, match: Optional[tuple] = None) -> None:
+        field_match = _score_row(row, query_key)
+        if match is None or (field_match is not None and field_match[0] > match[0]):
+            match = field_match
+        if match is None or match[0] < min_score:
+            return
+        entry = (match[0], -row, row, match[1], match[2])
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    
+    def done(closeness: float, population: int = 0) -> bool:
+        if len(heap) < limit:
+            return False
+        if stop_score is not None and heap[0][0] >= stop_score:
+            return True
+        # Later candidates of the tier are no more populous, so none can beat this bound
+        return heap[0][0] >= closeness + POPULATION_WEIGHT * math.log10(1 + max(population, 0))
+    
+    # Airports (from the code index) and exact alternate names are scored
+    # first, so strong matches can end the scan early
+    seeds = _airport_matches(query_key, limit)
+    if query_key in _ALIAS_INDEX:
+        seeds.setdefault(_ALIAS_INDEX[query_key], None)
+    for row, match in seeds.items():
+        offer(row, match)
+    
+    # Then the indexed candidates, tier by tier, compared against the
+    # precomputed folded keys. A tier stops once none of its rows can rank
+    # (the rows it did not reach are outranked in the later tiers as well),
+    # or after verifying MAX_TIER_CANDIDATES rows with limit matches held.
+    offered = set(seeds)
+    for rows, closeness in _candidate_tiers(query_key):
+        verified = 0
+        for row in rows:
+            if done(closeness, _POPULATIONS[row]):
+                break
+            if row in offered:
+                continue
+            if len(heap) == limit:
+                verified += 1
+                if verified > MAX_TIER_CANDIDATES:
                     break
-        
-        if len(results) >= limit:
-            break
+            offer(row)
+            offered.add(row)
     
-    return results[:limit]
+    results = []
+    for score, _, row, match_type, matched in sorted(heap, reverse=True):
+        name = _INDEX_NAMES[row]
+        result = WORLD_LOCATIONS[name].copy()
+        result['name'] = name
+        result['match_type'] = match_type
+        if match_type in ('airport_code', 'airport_name'):
+            result['matched_code'] = matched
+            result['matched_airport'] = AIRPORTS.get(matched, ('', result.get('airport_name', '')))[1]
+        elif match_type == 'alias':
+            result['matched_alias'] = matched
+        result['score'] = round(score, 3)
+        results.append(result)
+    return results
 
 def format_display_name(location_data: dict, name: str) -> str:
     """Enhanced format display name including airport codes"""
@@ -226,6 +727,17 @@ def format_display_name(location_data: dict, name: str) -> str:
     
     return display
 
+def location_records():
+    """WORLD_LOCATIONS as LocationStore records
+    
+    (name, country, admin, population, type, display, airport_codes, lat, lon),
+    with NaN coordinates where an entry has none.
+    """
+    for name, data in WORLD_LOCATIONS.items():
+        yield (name, data['country'], data.get('admin', ''), data['population'],
+               data['type'], format_display_name(data, name), data.get('airport_codes', []),
+               data.get('lat', math.nan), data.get('lon', math.nan))
+
 def get_popular_destinations(limit: int = 20) -> list:
     """Get popular destinations"""
     return [WORLD_LOCATIONS[name] for name in POPULAR_DESTINATIONS[:limit]]
@@ -0,0 +1,67 @@
+"""
+Benchmark: repeated comfort analyses through the shared analysis cache
+Analyzes random trips once (misses), checks each result equals an uncached
+analysis, then repeats them with equivalent inputs (ints as floats, tuples for
+lists, fresh destination objects) and reports the hit rate and per-analysis time.
+
+Run: python bench_analysis_cache.py [--trips 500]
+"""
+
+import argparse
+import datetime
+import time
+
+from agents.analysis_cache import _analyze, analysis_cache_stats, cached_analysis
+from agents.comfort_calculator import Destination, TravelComfortCalculator
+from bench_comfort_batch import random_trips
+from bench_trip_scoring import trip_args
+
+HOTEL_PREFERENCES = {
+    "budget": "Mid-range ($100-200/night)",
+    "accommodation_type": ["Hotels with baby amenities", "Vacation rentals"],
+    "essential_amenities": ["Crib/baby cot", "Kitchenette/kitchen"],
+    "location_priorities": ["Near hospital/medical center", "Close to pharmacy"]
+}
+
+def analysis_args(trips: dict, i: int, equivalent: bool = False) -> tuple:
+    (baby_age, flight_hours, layovers, departure_time, has_partner, special_needs, pumping_needed,
+     first_international, parent_experience, destination, departure, trip_duration) = trip_args(trips, i)
+    departure_date = datetime.date(2026, 1, 1) + datetime.timedelta(days=i % 365)
+    return_date = departure_date + datetime.timedelta(days=trip_duration)
+    preferences = HOTEL_PREFERENCES
+    if equivalent:
+        baby_age, trip_duration = float(baby_age), float(trip_duration)
+        destination = Destination(destination.name, destination.country, destination.admin, 0, 'city', '')
+        preferences = {key: tuple(value) if isinstance(value, list) else value
+                       for key, value in HOTEL_PREFERENCES.items()}
+    return (baby_age, flight_hours, layovers, departure_time, has_partner, special_needs,
+            pumping_needed, first_international, parent_experience, destination, departure,
+            trip_duration, departure_date, return_date, preferences)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--trips', type=int, default=500)
+    args = parser.parse_args()
+
+    calculator = TravelComfortCalculator()
+    trips = random_trips(args.trips, seed=1)
+
+    start = time.perf_counter()
+    first = [cached_analysis(calculator, *analysis_args(trips, i)) for i in range(args.trips)]
+    miss_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    repeat = [cached_analysis(calculator, *analysis_args(trips, i, equivalent=True))
+              for i in range(args.trips)]
+    hit_seconds = time.perf_counter() - start
+
+    for i, ((analysis, hit), (repeated, repeat_hit)) in enumerate(zip(first, repeat)):
+        assert not hit and repeat_hit and repeated is analysis, i
+        assert analysis == _analyze(calculator, *analysis_args(trips, i)), i
+
+    stats = analysis_cache_stats()
+    print(f"{'pass':>7} {'trips':>7} {'us/analysis':>12}")
+    print(f"{'miss':>7} {args.trips:>7,} {miss_seconds / args.trips * 1e6:>12,.0f}")
+    print(f"{'hit':>7} {args.trips:>7,} {hit_seconds / args.trips * 1e6:>12,.0f}")
+    print(f"hit rate {stats['hit_rate']:.0%} ({stats['hits']} hits, {stats['misses']} misses, "
+          f"{stats['size']} entries); cached analyses identical to uncached ones")
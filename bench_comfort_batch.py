@@ -0,0 +1,83 @@
+"""
+Benchmark: TravelComfortCalculator.calculate_travel_comfort_batch vs scoring
+trips one at a time with calculate_travel_comfort
+Generates random candidate trips, checks that the batch scores and factors equal
+the scalar ones exactly on a sample, and reports throughput for both paths.
+
+Run: python bench_comfort_batch.py [--rows 1000000] [--sample 50000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from agents.comfort_calculator import Destination, TravelComfortCalculator
+
+DEPARTURE_TIMES = ["Morning (7-11 AM)", "Evening (5-10 PM)", "Afternoon (11 AM-5 PM)",
+                   "Late Night (10 PM-12 AM)", "Very Early (5-7 AM)", "Red-eye (12-5 AM)", "Unknown"]
+EXPERIENCE = ["Travel veteran (10+ flights)", "Experienced traveler (4+ flights)",
+              "2-3 previous flights", "First time flying with baby"]
+DESTINATIONS = ['Dubai', 'London', 'Rome', 'Bangkok', 'Helsinki', 'Tokyo', 'Nairobi', 'Berlin']
+
+
+def random_trips(rows: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    return {
+        'baby_age': rng.integers(0, 37, rows),
+        # Whole and half hours, so bucket edges (3, 6, 10) are hit exactly
+        'flight_hours': rng.integers(1, 37, rows) / 2,
+        'layovers': rng.integers(0, 4, rows),
+        'departure_time': rng.choice(DEPARTURE_TIMES, rows),
+        'has_partner': rng.random(rows) < 0.7,
+        'special_needs': rng.random(rows) < 0.1,
+        'pumping_needed': rng.random(rows) < 0.4,
+        'first_international': rng.random(rows) < 0.3,
+        'parent_experience': rng.choice(EXPERIENCE, rows),
+        'destination': rng.choice(DESTINATIONS, rows),
+        'trip_duration': rng.integers(1, 31, rows),
+    }
+
+
+def scalar_scores(calculator: TravelComfortCalculator, trips: dict, rows: int):
+    results = []
+    for i in range(rows):
+        destination = Destination(str(trips['destination'][i]), '', '', 0, 'city', '')
+        results.append(calculator.calculate_travel_comfort(
+            int(trips['baby_age'][i]), float(trips['flight_hours'][i]), int(trips['layovers'][i]),
+            str(trips['departure_time'][i]), bool(trips['has_partner'][i]),
+            bool(trips['special_needs'][i]), bool(trips['pumping_needed'][i]),
+            bool(trips['first_international'][i]), str(trips['parent_experience'][i]),
+            destination, trip_duration=int(trips['trip_duration'][i])
+        ))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--sample', type=int, default=50_000)
+    args = parser.parse_args()
+
+    calculator = TravelComfortCalculator()
+    trips = random_trips(args.rows)
+
+    start = time.perf_counter()
+    scores, factors = calculator.calculate_travel_comfort_batch(trips)
+    batch_seconds = time.perf_counter() - start
+
+    sample = min(args.sample, args.rows)
+    start = time.perf_counter()
+    expected = scalar_scores(calculator, trips, sample)
+    scalar_seconds = time.perf_counter() - start
+
+    for i, (score, scalar_factors) in enumerate(expected):
+        assert scores[i] == score, (i, scores[i], score)
+        for name, value in scalar_factors.items():
+            assert factors[name][i] == value, (i, name, factors[name][i], value)
+
+    print(f"{'path':>8} {'rows':>10} {'seconds':>9} {'rows/s':>12}")
+    print(f"{'scalar':>8} {sample:>10,} {scalar_seconds:>9.3f} {sample / scalar_seconds:>12,.0f}")
+    print(f"{'batch':>8} {args.rows:>10,} {batch_seconds:>9.3f} {args.rows / batch_seconds:>12,.0f}")
+    print(f"speedup {(args.rows / batch_seconds) / (sample / scalar_seconds):.0f}x; "
+          f"{sample:,} sampled rows identical to the scalar path")
@@ -0,0 +1,52 @@
+"""
+Benchmark: indexed top-k search_locations_by_query vs a linear scan that scores
+and sorts every entry
+Grows the gazetteer with synthetic entries and reports per-query latency, with
+the query cache cleared before every lookup (indexed, mean and slowest query)
+and warm (cached). The synthetic entries are numbered copies of the real ones,
+so every name, airport code and population repeats thousands of times at the
+largest size. Results are checked against the linear scan at every size
+(test_location_search.py runs the same check).
+
+Run: python bench_location_search.py
+"""
+
+import time
+
+from agents import world_locations as wl
+from test_location_search import grow_gazetteer, linear_search
+
+QUERIES = ['lon', 'dub', 'san', 'a', 'in', 'united', 'DXB', 'LH', 'heathrow', 'OMD',
+           'new york', 'zzz', 'tokyo', 'ca', 'bengal', 'reyk']
+SIZES = [len(wl.WORLD_LOCATIONS), 1_000, 10_000, 200_000]
+REPEATS = 20
+
+def uncached_search(query: str) -> list:
+    wl._QUERY_CACHE.clear()
+    return wl.search_locations_by_query(query)
+
+def time_per_query(search, repeats: int = REPEATS, queries: list = QUERIES) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for query in queries:
+            search(query)
+    return (time.perf_counter() - start) / (repeats * len(queries)) * 1e6
+
+def slowest_query(search, repeats: int = REPEATS) -> tuple:
+    """(µs, query) of the query with the highest mean latency"""
+    return max((time_per_query(search, repeats, [query]), query) for query in QUERIES)
+
+if __name__ == "__main__":
+    print(f"{'entries':>10} {'linear µs':>12} {'indexed µs':>12} {'speedup':>9} {'slowest µs':>18} "
+          f"{'cached µs':>12}")
+    for size in SIZES:
+        grow_gazetteer(size)
+        for query in QUERIES:
+            assert wl.search_locations_by_query(query) == linear_search(query), query
+        # The reference is too slow to repeat on the largest sizes
+        linear = time_per_query(linear_search, 1 if size > 10_000 else REPEATS)
+        indexed = time_per_query(uncached_search)
+        slowest, slowest_text = slowest_query(uncached_search)
+        cached = time_per_query(wl.search_locations_by_query)
+        print(f"{len(wl.WORLD_LOCATIONS):>10,} {linear:>12.1f} {indexed:>12.1f} "
+              f"{linear / indexed:>8.1f}x {slowest:>9.1f} {slowest_text!r:>8} {cached:>12.1f}")
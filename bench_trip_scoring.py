@@ -0,0 +1,79 @@
+"""
+Benchmark: TripScoringEngine (comfort + stress + insights in one pass) vs the
+separate calculate_travel_comfort / calculate_comprehensive_stress /
+get_comfort_insights calls
+Checks that single-trip and batch engine results equal the separate calls on a
+sample of random trips, and reports throughput for each path.
+
+Run: python bench_trip_scoring.py [--rows 1000000] [--sample 20000]
+"""
+
+import argparse
+import time
+
+from agents.comfort_calculator import Destination, TravelComfortCalculator
+from agents.scoring_engine import TripScoringEngine
+from agents.stress_predictor import TravelStressAnalyzer
+from bench_comfort_batch import random_trips
+
+
+def trip_args(trips: dict, i: int) -> tuple:
+    destination = Destination(str(trips['destination'][i]), '', '', 0, 'city', '')
+    return (int(trips['baby_age'][i]), float(trips['flight_hours'][i]), int(trips['layovers'][i]),
+            str(trips['departure_time'][i]), bool(trips['has_partner'][i]),
+            bool(trips['special_needs'][i]), bool(trips['pumping_needed'][i]),
+            bool(trips['first_international'][i]), str(trips['parent_experience'][i]),
+            destination, None, int(trips['trip_duration'][i]))
+
+
+def separate(calculator: TravelComfortCalculator, args: tuple) -> tuple:
+    comfort_score, comfort_factors = calculator.calculate_travel_comfort(*args)
+    stress_score, stress_factors = TravelStressAnalyzer.calculate_comprehensive_stress(*args)
+    insights = calculator.get_comfort_insights(comfort_score, comfort_factors)
+    return comfort_score, comfort_factors, stress_score, stress_factors, insights
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--sample', type=int, default=20_000)
+    args = parser.parse_args()
+
+    calculator = TravelComfortCalculator()
+    engine = TripScoringEngine(calculator)
+    trips = random_trips(args.rows)
+    sample = min(args.sample, args.rows)
+    sample_args = [trip_args(trips, i) for i in range(sample)]
+    calculator.scoring_cube()
+
+    start = time.perf_counter()
+    expected = [separate(calculator, trip) for trip in sample_args]
+    separate_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [engine.score_trip(*trip) for trip in sample_args]
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = engine.score_trips(trips)
+    batch_seconds = time.perf_counter() - start
+
+    sample_trips = {name: column[:sample] for name, column in trips.items()}
+    batch_insights = engine.score_trips(sample_trips, insights=True).insights
+
+    for i, (comfort_score, comfort_factors, stress_score, stress_factors, insights) in enumerate(expected):
+        score = single[i]
+        assert (score.comfort_score, score.comfort_factors, score.stress_score, score.stress_factors,
+                score.insights) == (comfort_score, comfort_factors, stress_score, stress_factors, insights), i
+        assert batch.comfort_scores[i] == comfort_score and batch.stress_scores[i] == stress_score, i
+        for name, value in comfort_factors.items():
+            assert batch.comfort_factors[name][i] == value, (i, name)
+        for name, value in stress_factors.items():
+            assert batch.stress_factors[name][i] == value, (i, name)
+        assert batch_insights[i] == insights, i
+
+    print(f"{'path':>9} {'rows':>10} {'seconds':>9} {'rows/s':>12}")
+    print(f"{'separate':>9} {sample:>10,} {separate_seconds:>9.3f} {sample / separate_seconds:>12,.0f}")
+    print(f"{'single':>9} {sample:>10,} {single_seconds:>9.3f} {sample / single_seconds:>12,.0f}")
+    print(f"{'batch':>9} {args.rows:>10,} {batch_seconds:>9.3f} {args.rows / batch_seconds:>12,.0f}")
+    print(f"{sample:,} sampled trips identical across the separate, single and batch paths")
@@ -2,14 +2,13 @@ import datetime
 import streamlit as st
 from agents.travel_comfort_analyzer import display_travel_comfort_analyzer
 
-# ADD THESE NEW IMPORTS:
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-import os
-
 def send_feedback_email(feedback_data):
     """Send feedback via email with UI-visible debugging"""
+    # Only needed when feedback is submitted, so kept out of app start-up
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    
     try:
         # Email configuration - MAKE SURE THESE ARE YOUR ACTUAL VALUES
         sender_email = "gobabygo.smart@gmail.com"      # Your app's Gmail
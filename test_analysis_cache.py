@@ -0,0 +1,89 @@
+"""
+Analysis cache keys
+Checks that analysis_key gives equivalent trip inputs (ints as floats, tuples
+for lists, reordered preference keys, NumPy scalars, fresh destination objects)
+one key, so cached_analysis hits, and that any input that changes the analysis
+gets a new key and misses. Destination names are kept exact: a name differing
+only in case or spacing gets a different destination profile.
+
+Run: python -m pytest -q test_analysis_cache.py
+"""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from agents import analysis_cache
+from agents.analysis_cache import _analyze, analysis_key, cached_analysis, destination_id
+from agents.comfort_calculator import Destination, TravelComfortCalculator
+from agents.search_cache import LocationCache
+
+LONDON = Destination('London', 'United Kingdom', 'England', 9000000, 'city', 'London (LHR), UK')
+TRIP = dict(
+    baby_age=1, flight_hours=7.5, layovers=1, departure_time='Morning (6AM-12PM)',
+    has_partner=True, special_needs=False, pumping_needed=True, first_international=False,
+    parent_experience='2-3 previous flights', destination=LONDON, departure=None, trip_duration=7,
+    departure_date=datetime.date(2026, 7, 1), return_date=datetime.date(2026, 7, 8),
+    hotel_preferences={'budget': 'Mid-range ($100-200/night)',
+                       'essential_amenities': ['Crib/baby cot', 'Kitchenette/kitchen']},
+)
+
+def trip_key(rules: str = 'rules', **changes) -> str:
+    trip = {**TRIP, **changes}
+    trip['destination'] = destination_id(trip['destination'])
+    del trip['departure']
+    return analysis_key(rules, **trip)
+
+@pytest.fixture
+def calculator() -> TravelComfortCalculator:
+    return TravelComfortCalculator()
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(analysis_cache, '_ANALYSES', LocationCache(max_size=16))
+
+EQUIVALENT = {
+    'float for int': dict(baby_age=1.0, trip_duration=7.0, layovers=1.0),
+    'numpy scalars': dict(baby_age=np.int64(1), flight_hours=np.float64(7.5)),
+    'tuple for list': dict(hotel_preferences={'budget': 'Mid-range ($100-200/night)',
+                                              'essential_amenities': ('Crib/baby cot', 'Kitchenette/kitchen')}),
+    'reordered keys': dict(hotel_preferences={'essential_amenities': ['Crib/baby cot', 'Kitchenette/kitchen'],
+                                              'budget': 'Mid-range ($100-200/night)'}),
+    'fresh destination': dict(destination=Destination('London', 'United Kingdom', 'England', 0, 'city', '')),
+    'other departure': dict(departure=Destination('Paris', 'France', '', 0, 'city', '')),
+}
+
+DIFFERENT = {
+    'baby age': dict(baby_age=2),
+    'flight hours': dict(flight_hours=7.6),
+    'departure time': dict(departure_time='Evening (6PM-12AM)'),
+    'partner': dict(has_partner=False),
+    'destination': dict(destination=Destination('Paris', 'France', '', 0, 'city', '')),
+    'dates': dict(departure_date=datetime.date(2026, 12, 1), return_date=datetime.date(2026, 12, 8)),
+    'name case': dict(destination=Destination('london', 'United Kingdom', 'England', 0, 'city', '')),
+    'name spacing': dict(destination=Destination('London ', 'United Kingdom', 'England', 0, 'city', '')),
+}
+
+@pytest.mark.parametrize('changes', EQUIVALENT.values(), ids=EQUIVALENT.keys())
+def test_equivalent_inputs_hit(calculator, changes):
+    assert trip_key(**changes) == trip_key()
+    first, hit = cached_analysis(calculator, **TRIP)
+    assert not hit
+    repeated, hit = cached_analysis(calculator, **{**TRIP, **changes})
+    assert hit and repeated is first
+
+@pytest.mark.parametrize('changes', DIFFERENT.values(), ids=DIFFERENT.keys())
+def test_different_inputs_miss(calculator, changes):
+    assert trip_key(**changes) != trip_key()
+    cached_analysis(calculator, **TRIP)
+    _, hit = cached_analysis(calculator, **{**TRIP, **changes})
+    assert not hit
+
+@pytest.mark.parametrize('name', ['london', 'London ', ' London'])
+def test_name_variants_analyze_differently(calculator, name):
+    variant = {**TRIP, 'destination': Destination(name, 'United Kingdom', 'England', 0, 'city', '')}
+    assert _analyze(calculator, **variant).trip_score != _analyze(calculator, **TRIP).trip_score
+
+def test_rules_fingerprint_in_key():
+    assert trip_key('edited rules') != trip_key()
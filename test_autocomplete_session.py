@@ -0,0 +1,59 @@
+"""
+Incremental autocomplete against fresh searches
+Replays typing, backspacing, running into a prefix nothing matches (the
+session's trie cursor goes to None), typing on past it and retyping, and checks
+that every AutocompleteSession answer equals a search_destinations_autocomplete
+call on a separate service that has never seen the earlier keystrokes.
+
+Run: python -m pytest -q test_autocomplete_session.py
+"""
+
+import pytest
+
+from agents.location_service import GlobalLocationService
+
+def keystrokes(*edits: str) -> list:
+    """Successive search box contents; '-' deletes the last character, anything else is typed"""
+    text, queries = '', []
+    for edit in edits:
+        for char in edit:
+            text = text[:-1] if char == '-' else text + char
+            if text:
+                queries.append(text)
+    return queries
+
+SEQUENCES = {
+    'type and backspace': keystrokes('London', '---', 'g', '--', 'don'),
+    'dead end then past it': keystrokes('Lonxqzw', 'vv', '-------', 'dn'),
+    'dead end retyped': keystrokes('qxjv', 'k', '--', 'jvk', '----', 'Par'),
+    'typo then fix': keystrokes('Lodnon', '----', 'ndon'),
+    'retype after clearing': keystrokes('Paris', '-----', 'Paris'),
+}
+
+def new_service() -> GlobalLocationService:
+    # A generous fuzzy budget so neither side cuts a typo-tolerant search short
+    return GlobalLocationService(snapshot_path=None, fuzzy_time_budget=60)
+
+@pytest.fixture(scope='module')
+def service() -> GlobalLocationService:
+    return new_service()
+
+@pytest.fixture(scope='module')
+def reference() -> GlobalLocationService:
+    return new_service()
+
+@pytest.mark.parametrize('queries', SEQUENCES.values(), ids=SEQUENCES.keys())
+def test_session_matches_fresh_search(service, reference, queries):
+    session = service.autocomplete_session()
+    for query in queries:
+        expected = reference.search_destinations_autocomplete(query)
+        reference._search_cache.clear()
+        assert session(query) == expected, f"after typing {query!r}"
+
+def test_dead_end_drops_cursor(service):
+    session = service.autocomplete_session()
+    assert session('Lon')
+    assert session('Lonxqzw') == []
+    assert session._cursor is None
+    assert session('Lonxqzwvv') == []
+    assert session('Lon') and session._cursor is not None
@@ -0,0 +1,69 @@
+"""
+Gazetteer snapshot round trip and staleness
+Builds a snapshot from the curated locations plus a small GeoNames file, reopens
+it and checks the memory-mapped service answers like one built in memory; then
+changes the GeoNames data (and, separately, the compiling code's hash) and
+checks the snapshot is rejected as stale and rebuilt.
+
+Run: python -m pytest -q test_gazetteer_snapshot.py
+"""
+
+import pytest
+
+from agents import location_service
+from agents.gazetteer_import import import_gazetteer
+from agents.location_service import (GlobalLocationService, build_gazetteer_snapshot,
+                                     open_gazetteer_snapshot)
+
+QUERIES = ['London', 'lond', 'Lodnon', 'Paris', 'Tokyo', 'Quillbrook', 'Marrowfen', 'sao', 'NYC', 'xqzw']
+
+def geonames_row(geonameid: int, name: str, lat: float, lon: float, population: int) -> str:
+    fields = [str(geonameid), name, name, '', str(lat), str(lon), 'P', 'PPL', 'GB', '', 'ENG',
+              '', '', '', str(population), '', '10', 'Europe/London', '2024-01-01']
+    return '\t'.join(fields) + '\n'
+
+def write_geonames(path, *rows: str) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.writelines(rows)
+
+def search_results(service: GlobalLocationService) -> dict:
+    return {query: (service.search_destinations_autocomplete(query),
+                    [place.display for place in service.search_destinations(query)])
+            for query in QUERIES}
+
+@pytest.fixture
+def geonames(tmp_path):
+    path = tmp_path / 'cities.txt'
+    write_geonames(path, geonames_row(1, 'Quillbrook', 52.1, -1.2, 40000))
+    return str(path)
+
+def test_reopened_snapshot_matches_in_memory_service(tmp_path, geonames):
+    path = str(tmp_path / 'gazetteer.snap')
+    build_gazetteer_snapshot(path, geonames_path=geonames)
+    fingerprint = open_gazetteer_snapshot(path).meta['fingerprint']
+    assert open_gazetteer_snapshot(path).meta['fingerprint'] == fingerprint   # not rebuilt
+
+    from_snapshot = GlobalLocationService(snapshot_path=path)
+    in_memory = GlobalLocationService(snapshot_path=None,
+                                      locations=import_gazetteer(geonames_path=geonames))
+    assert len(from_snapshot.all_locations) == len(in_memory.all_locations)
+    assert search_results(from_snapshot) == search_results(in_memory)
+
+def test_changed_data_makes_snapshot_stale(tmp_path, geonames):
+    path = str(tmp_path / 'gazetteer.snap')
+    build_gazetteer_snapshot(path, geonames_path=geonames)
+    fingerprint = open_gazetteer_snapshot(path).meta['fingerprint']
+    assert not GlobalLocationService(snapshot_path=path).search_destinations_autocomplete('Marrowfen')
+
+    write_geonames(geonames, geonames_row(1, 'Quillbrook', 52.1, -1.2, 40000),
+                   geonames_row(2, 'Marrowfen', 53.4, -2.1, 25000))
+    assert open_gazetteer_snapshot(path).meta['fingerprint'] != fingerprint
+    assert GlobalLocationService(snapshot_path=path).search_destinations_autocomplete('Marrowfen')
+
+def test_changed_code_makes_snapshot_stale(tmp_path, monkeypatch):
+    path = str(tmp_path / 'gazetteer.snap')
+    build_gazetteer_snapshot(path)
+    fingerprint = open_gazetteer_snapshot(path).meta['fingerprint']
+
+    monkeypatch.setattr(location_service, '_gazetteer_code_hash', lambda: 'edited')
+    assert open_gazetteer_snapshot(path).meta['fingerprint'] != fingerprint
@@ -0,0 +1,70 @@
+"""
+Cold-start check for the app entry point
+Runs main.py's top-level imports in a fresh interpreter and fails if a module
+that should only load on first use (NumPy, pandas, plotly, starlette, SMTP/email,
+Google API client, dotenv, requests) is imported at start-up. Modules that
+streamlit itself imports (e.g. starlette, in recent versions) are not the app's
+to defer and are only reported.
+
+Run: python -m pytest -q test_import_time.py   or   python test_import_time.py
+(the script also prints the slowest imports under -X importtime)
+"""
+
+import ast
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ENTRY_POINT = os.path.join(ROOT, 'main.py')
+
+LAZY_MODULES = ('numpy', 'pandas', 'plotly', 'starlette', 'smtplib', 'email.mime',
+                'googleapiclient', 'google_auth_oauthlib', 'dotenv', 'requests')
+
+def entry_point_imports(path: str = ENTRY_POINT) -> str:
+    """Source of the module-level import statements of path"""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return '\n'.join(ast.unparse(node) for node in imports)
+
+def loaded_modules(source: str) -> set:
+    """Names in sys.modules after running source in a fresh interpreter"""
+    script = f"{source}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, '-c', script],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+def eager_modules(modules: set) -> list:
+    """LAZY_MODULES (or their submodules) present in modules"""
+    return [lazy for lazy in LAZY_MODULES
+            if any(name == lazy or name.startswith(lazy + '.') for name in modules)]
+
+def profile_imports(source: str):
+    """(total seconds, {module: cumulative seconds}) for running source in a fresh interpreter"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', source],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    total, modules = 0, {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total += int(self_us)
+        modules[name.strip()] = int(cumulative_us) / 1e6
+    return total / 1e6, modules
+
+def test_heavy_modules_load_on_first_use():
+    from_streamlit = set(eager_modules(loaded_modules('import streamlit')))
+    eager = [name for name in eager_modules(loaded_modules(entry_point_imports()))
+             if name not in from_streamlit]
+    assert not eager, f"imported at start-up instead of on first use: {eager}"
+
+if __name__ == "__main__":
+    source = entry_point_imports()
+    print(f"loaded by streamlit itself: {eager_modules(loaded_modules('import streamlit'))}")
+    print(f"loaded at start-up: {eager_modules(loaded_modules(source))}")
+    total, modules = profile_imports(source)
+    print(f"cold start imports: {total * 1000:.0f} ms")
+    for name, seconds in sorted(modules.items(), key=lambda item: -item[1])[:15]:
+        print(f"{seconds * 1000:>9.1f} ms  {name}")
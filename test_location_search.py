@@ -0,0 +1,92 @@
+"""
+Indexed location search against a linear scan
+search_locations_by_query must return exactly what scoring every entry and
+sorting the full match list returns, on the real gazetteer and on one grown
+with numbered copies of its entries (so names, codes and populations tie), for
+short and long queries, names, aliases, regions and airport codes.
+
+Run: python -m pytest -q test_location_search.py
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from agents import world_locations as wl
+from agents.search_index import normalize_search_text
+
+QUERIES = ['lon', 'dub', 'san', 'a', 'e', 's', 'in', 'united', 'united kingdom', 'DXB', 'LH',
+           'heathrow', 'OMD', 'new york', 'york', 'zzz', 'tokyo', 'ca', 'bengal', 'reyk',
+           'zürich', 'zurich', 'ü', 'states', 'west', 'kong', 'Bombay']
+LIMITS = [1, 5, 10, 30]
+BASE_ENTRIES = list(wl.WORLD_LOCATIONS.items())
+
+def linear_search(query: str, limit: int = 10) -> list:
+    """Reference: score every entry, sort the full match list and take the first limit
+
+    Airport candidates come from the code index, as in the indexed search.
+    """
+    if not query:
+        return [{'name': name, **wl.WORLD_LOCATIONS[name]} for name in wl.POPULAR_DESTINATIONS[:limit]]
+
+    wl._ensure_search_index()
+    query_key = normalize_search_text(query)
+    airports = wl._airport_matches(query_key)
+    matches = []
+    for row in range(len(wl.WORLD_LOCATIONS)):
+        # Ties go to the airport match, as in the indexed search
+        candidates = [airports.get(row), wl._score_row(row, query_key)]
+        match = max((match for match in candidates if match is not None), key=lambda match: match[0],
+                    default=None)
+        if match is not None:
+            matches.append((-match[0], row, match))
+    matches.sort()
+
+    results = []
+    for _, row, (score, match_type, matched) in matches[:limit]:
+        name = wl._INDEX_NAMES[row]
+        result = wl.WORLD_LOCATIONS[name].copy()
+        result['name'] = name
+        result['match_type'] = match_type
+        if match_type in ('airport_code', 'airport_name'):
+            result['matched_code'] = matched
+            result['matched_airport'] = wl.AIRPORTS.get(matched, ('', result.get('airport_name', '')))[1]
+        elif match_type == 'alias':
+            result['matched_alias'] = matched
+        result['score'] = round(score, 3)
+        results.append(result)
+    return results
+
+def grow_gazetteer(size: int) -> None:
+    """Pad WORLD_LOCATIONS with numbered copies of the real entries"""
+    i = len(wl.WORLD_LOCATIONS) - len(BASE_ENTRIES)
+    while len(wl.WORLD_LOCATIONS) < size:
+        name, data = BASE_ENTRIES[i % len(BASE_ENTRIES)]
+        wl.WORLD_LOCATIONS[f"{name} {i:06d}"] = dict(data)
+        i += 1
+    wl.rebuild_search_index()
+
+@pytest.fixture
+def grown_gazetteer():
+    """grow_gazetteer, with the synthetic entries removed again afterwards"""
+    yield grow_gazetteer
+    for name in list(wl.WORLD_LOCATIONS)[len(BASE_ENTRIES):]:
+        del wl.WORLD_LOCATIONS[name]
+    wl.rebuild_search_index()
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_matches_linear_scan(query):
+    for limit in LIMITS:
+        assert wl.search_locations_by_query(query, limit=limit) == linear_search(query, limit), limit
+
+def test_matches_linear_scan_with_ties(grown_gazetteer):
+    grown_gazetteer(5_000)
+    for query in QUERIES:
+        for limit in LIMITS:
+            assert wl.search_locations_by_query(query, limit=limit) == linear_search(query, limit), (query, limit)
+
+def test_index_built_on_first_search():
+    code = ("from agents import world_locations as wl; assert not wl._INDEX_READY; "
+            "wl.search_locations_by_query('lon'); assert wl._INDEX_READY")
+    subprocess.run([sys.executable, '-c', code], check=True)
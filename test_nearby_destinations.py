@@ -0,0 +1,28 @@
+"""
+Nearby destinations from the spatial index
+Checks that the places suggested near a destination are cities and airports:
+country rows carry their capital's coordinates and must not show up as
+neighbours (e.g. the United Kingdom 0 km from London).
+
+Run: python -m pytest -q test_nearby_destinations.py   or   python test_nearby_destinations.py
+"""
+
+from agents.location_service import GlobalLocationService
+
+NEARBY_TYPES = ('city', 'capital', 'airport')
+
+def london_neighbours(limit: int = 10) -> list:
+    """Nearby destinations of London, built from the source data"""
+    service = GlobalLocationService(snapshot_path=None)
+    london = service.all_locations[service.all_locations.row_by_name('London')]
+    return service.get_nearby_destinations(london, limit)
+
+def test_london_neighbours_are_cities_and_airports():
+    neighbours = london_neighbours()
+    assert neighbours, "no destinations found near London"
+    unexpected = [(place.display, place.type) for place in neighbours if place.type not in NEARBY_TYPES]
+    assert not unexpected, f"non-city neighbours of London: {unexpected}"
+
+if __name__ == "__main__":
+    for place in london_neighbours():
+        print(f"{place.type:>8}  {place.display}")
@@ -0,0 +1,69 @@
+"""
+Prefix trie lookups and typo-tolerant search
+Covers PrefixTrie.fuzzy_search (adjacent transpositions, the exact first
+characters, an exact prefix ending partway along an edge, the time budget) and
+checks that a FrozenPrefixTrie read from to_arrays() answers like the trie it
+was built from.
+
+Run: python -m pytest -q test_prefix_trie.py
+"""
+
+import pytest
+
+from agents.search_index import FrozenPrefixTrie, PrefixTrie, normalize_search_text
+
+# (name, population); items are the list positions
+PLACES = [('London', 9_000_000), ('Londonderry', 85_000), ('Lisbon', 545_000), ('Lyon', 516_000),
+          ('Dublin', 1_200_000), ('Paris', 2_100_000), ('Parma', 195_000), ('Sydney', 5_300_000),
+          ('São Paulo', 12_300_000), ('Zürich', 420_000)]
+QUERIES = ['l', 'lon', 'lodnon', 'londn', 'lodnonderry', 'lsbon', 'pari', 'prais', 'sao', 'zurch',
+           'xondon', 'dbulin', '']
+
+def build_trie() -> PrefixTrie:
+    trie = PrefixTrie(top_k=5)
+    for item, (name, population) in enumerate(PLACES):
+        trie.insert(normalize_search_text(name), item, population)
+    trie.finalize()
+    return trie
+
+def names(results) -> list:
+    return [(PLACES[item][0], edits) for item, edits in results]
+
+@pytest.fixture(scope='module')
+def trie() -> PrefixTrie:
+    return build_trie()
+
+def test_transposition_is_one_edit(trie):
+    assert names(trie.fuzzy_search('lodnon', max_edits=1)) == [('London', 1), ('Londonderry', 1)]
+    assert names(trie.fuzzy_search('dbulin', max_edits=1)) == [('Dublin', 1)]
+
+def test_fewest_edits_first(trie):
+    assert names(trie.fuzzy_search('parna', max_edits=2)) == [('Parma', 1), ('Paris', 2)]
+
+def test_first_character_mismatch_finds_nothing(trie):
+    assert trie.fuzzy_search('xondon', max_edits=2) == []
+    assert trie.fuzzy_search('ondon', max_edits=2) == []
+
+def test_exact_prefix_ending_inside_an_edge(trie):
+    # 'lo' stops partway along the 'lo...' edge shared by London and Londonderry
+    assert names(trie.fuzzy_search('lodnn', max_edits=2, prefix_length=2))[0] == ('London', 2)
+    assert trie.fuzzy_search('lsbon', max_edits=2, prefix_length=2) == []
+    assert names(trie.fuzzy_search('lsbon', max_edits=1, prefix_length=1)) == [('Lisbon', 1)]
+
+def test_time_budget(trie):
+    full = trie.fuzzy_search('lodnon', max_edits=2)
+    assert trie.fuzzy_search('lodnon', max_edits=2, time_budget=60) == full
+    # An exhausted budget returns whatever was found so far (here at most the full answer)
+    assert set(trie.fuzzy_search('lodnon', max_edits=2, time_budget=0)) <= set(full)
+
+def test_limit(trie):
+    assert trie.fuzzy_search('l', max_edits=0, limit=2) == trie.fuzzy_search('l', max_edits=0)[:2]
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_frozen_trie_matches_built_trie(trie, query):
+    frozen = FrozenPrefixTrie(build_trie().to_arrays('places'), 'places')
+    assert len(frozen) == len(trie)
+    assert frozen.search(query) == trie.search(query)
+    for prefix_length in (1, 2):
+        assert (frozen.fuzzy_search(query, max_edits=2, prefix_length=prefix_length)
+                == trie.fuzzy_search(query, max_edits=2, prefix_length=prefix_length))
@@ -0,0 +1,86 @@
+"""
+Scoring rules hot reload
+Checks that RulesWatcher picks up an edited scoring_rules.json once the check
+interval has passed (on an injected clock, no sleeping), and that a file that
+is not valid JSON or not a valid rule set keeps the previous rules in use
+instead of raising.
+
+Run: python -m pytest -q test_scoring_rules.py
+"""
+
+import json
+import os
+
+import pytest
+
+from agents.scoring_rules import SCORING_RULES_PATH, RulesWatcher
+
+class FakeClock:
+    """Monotonic clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+def write_rules(path, text: str) -> None:
+    """Replace the file, moving its mtime forward so the change is seen even
+    within the filesystem's timestamp resolution"""
+    previous = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.utime(path, ns=(previous + 10**9, previous + 10**9))
+
+@pytest.fixture
+def spec() -> dict:
+    with open(SCORING_RULES_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+@pytest.fixture
+def watched(tmp_path, spec):
+    path = tmp_path / 'scoring_rules.json'
+    write_rules(path, json.dumps(spec))
+    clock = FakeClock()
+    return path, clock, RulesWatcher(str(path), check_interval=2.0, clock=clock)
+
+def test_change_picked_up_after_interval(watched, spec):
+    path, clock, watcher = watched
+    before = watcher.current()
+    spec['comfort']['weights']['flight_comfort'] = 5.0
+    write_rules(path, json.dumps(spec))
+
+    clock.advance(1.9)
+    assert watcher.current() is before          # not checked yet
+    clock.advance(0.1)
+    after = watcher.current()
+    assert after is not before and after.fingerprint != before.fingerprint
+    assert after.comfort.weights['flight_comfort'] == 5.0
+    assert watcher.last_error is None
+
+@pytest.mark.parametrize('text', ['{"comfort": {', '{"comfort": {}}', ''],
+                         ids=['truncated JSON', 'invalid rules', 'empty file'])
+def test_bad_file_keeps_previous_rules(watched, spec, text):
+    path, clock, watcher = watched
+    before = watcher.current()
+    write_rules(path, text)
+    clock.advance(2.0)
+    assert watcher.current() is before
+    assert watcher.last_error is not None
+
+    # Fixing the file recovers on the next check
+    spec['stress']['weights'] = {'flight': 1.0}
+    write_rules(path, json.dumps(spec))
+    clock.advance(2.0)
+    assert watcher.current().fingerprint != before.fingerprint
+    assert watcher.last_error is None
+
+def test_deleted_file_keeps_previous_rules(watched):
+    path, clock, watcher = watched
+    before = watcher.current()
+    os.remove(path)
+    clock.advance(2.0)
+    assert watcher.current() is before
@@ -0,0 +1,77 @@
+"""
+Search result cache
+Checks LocationCache's least-recently-used eviction order, time-to-live expiry
+(on an injected clock, no sleeping) and hit/miss/eviction/expiration counters.
+
+Run: python -m pytest -q test_search_cache.py
+"""
+
+from agents.search_cache import LocationCache
+
+class FakeClock:
+    """Monotonic clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+def test_evicts_least_recently_used():
+    cache = LocationCache(max_size=3)
+    for key in 'abc':
+        cache.set(key, key.upper())
+    assert cache.get('a') == 'A'        # a is now the most recently used
+    cache.set('d', 'D')                 # evicts b
+    assert cache.get('b') is None
+    cache.set('c', 'C2')                # updating refreshes c as well
+    cache.set('e', 'E')                 # evicts a
+    assert list(cache.cache) == ['d', 'c', 'e']
+    assert [cache.get(key) for key in 'ace'] == [None, 'C2', 'E']
+    assert cache.stats()['evictions'] == 2
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = LocationCache(max_size=10, ttl=60, clock=clock)
+    cache.set('london', ['London'])
+    clock.advance(30)
+    cache.set('paris', ['Paris'])
+    clock.advance(29.9)
+    assert cache.get('london') == ['London']
+    clock.advance(0.1)                  # london is 60 s old, paris 30 s
+    assert cache.get('london') is None
+    assert cache.get('paris') == ['Paris']
+    assert len(cache) == 1
+    clock.advance(30)
+    assert cache.get('paris') is None
+    assert cache.stats()['expirations'] == 2
+
+def test_no_ttl_never_expires():
+    clock = FakeClock()
+    cache = LocationCache(clock=clock)
+    cache.set('tokyo', ['Tokyo'])
+    clock.advance(1e9)
+    assert cache.get('tokyo') == ['Tokyo']
+
+def test_hit_and_miss_counters():
+    clock = FakeClock()
+    cache = LocationCache(max_size=2, ttl=10, clock=clock)
+    computed = []
+
+    def compute():
+        computed.append(1)
+        return 'value'
+
+    assert cache.get_or_compute('x', compute) == 'value'   # miss, computed
+    assert cache.get_or_compute('x', compute) == 'value'   # hit
+    assert cache.get('missing') is None                    # miss
+    clock.advance(10)
+    assert cache.get_or_compute('x', compute) == 'value'   # expired: miss, computed again
+    assert len(computed) == 2
+    assert cache.stats() == {'size': 1, 'max_size': 2, 'hits': 1, 'misses': 3,
+                             'evictions': 0, 'expirations': 1, 'hit_rate': 0.25}
+    cache.clear()
+    assert cache.stats()['size'] == 0 and cache.stats()['hits'] == 1
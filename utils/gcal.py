@@ -1,13 +1,15 @@
 import os
 import pickle
 import datetime
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 
 # Only read access for calendar
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
 
 def get_calendar_service():
+    # The Google client libraries are slow to import; load them on first use
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from googleapiclient.discovery import build
+
     creds = None
     token_path = os.path.join(os.path.dirname(__file__), 'token.pickle')
     credentials_path = os.path.join(os.path.dirname(__file__), 'credentials.json')
@@ -1,12 +1,18 @@
-import requests
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
 
-load_dotenv()
-API_KEY = os.getenv("WEATHER_API_KEY")
+@lru_cache(maxsize=None)
+def get_api_key():
+    # .env is read on first use rather than at import
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return os.getenv("WEATHER_API_KEY")
 
 def get_weather_by_city(city):
-    url = f"https://api.openweathermap.org/data/2.5/weather?q={city}&appid={API_KEY}&units=metric"
+    import requests
+
+    url = f"https://api.openweathermap.org/data/2.5/weather?q={city}&appid={get_api_key()}&units=metric"
     try:
         response = requests.get(url)
         if response.status_code == 200: